@@ -95,6 +95,7 @@ setup(
     package_data={
         "supertokens_python": [
             "py.typed",
+            "recipe/*/emaildelivery/services/smtp/templates/*.html",
         ]
     },
     classifiers=[
@@ -13,11 +13,17 @@
 # under the License.
 
 import asyncio
-from typing import Any, Coroutine, TypeVar
-from os import getenv
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+from os import getenv, getpid
 
 _T = TypeVar("_T")
 
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_thread: Optional[threading.Thread] = None
+_background_loop_pid: Optional[int] = None
+_background_loop_lock = threading.Lock()
+
 
 def nest_asyncio_enabled():
     return getenv("SUPERTOKENS_NEST_ASYNCIO", "") == "1"
@@ -40,6 +46,89 @@ def create_or_get_event_loop() -> asyncio.AbstractEventLoop:
         raise ex
 
 
+def _run_loop_forever(loop: asyncio.AbstractEventLoop):
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def get_background_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the event loop that runs forever in a daemon thread of this process,
+    starting it on first use. It is started again in a forked child process,
+    since threads don't survive a fork.
+    """
+    global _background_loop, _background_loop_thread, _background_loop_pid
+    loop = _background_loop
+    if loop is not None and _background_loop_pid == getpid():
+        return loop
+
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop_pid != getpid():
+            loop = asyncio.new_event_loop()
+            if nest_asyncio_enabled():
+                import nest_asyncio  # type: ignore
+
+                nest_asyncio.apply(loop)  # type: ignore
+
+            thread = threading.Thread(
+                target=_run_loop_forever,
+                args=(loop,),
+                name="supertokens-event-loop",
+                daemon=True,
+            )
+            thread.start()
+            _background_loop = loop
+            _background_loop_thread = thread
+            _background_loop_pid = getpid()
+        return _background_loop
+
+
+def run_in_background_loop(co: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Runs the coroutine on the background event loop and blocks the calling
+    thread until it is done. Unlike `run_until_complete` on a loop per thread,
+    this works from any thread, and connections opened by the coroutine can be
+    reused by later calls, since they are all made on the same loop.
+
+    Context variables of the calling thread are visible to the coroutine, so
+    framework request locals (like flask's `request` and `g`) can be used.
+
+    All callers share the loop, so a coroutine that blocks (for example, with a
+    blocking call in an async override) delays every other caller until it
+    returns.
+    """
+    loop = get_background_event_loop()
+    if threading.current_thread() is _background_loop_thread:
+        # A coroutine on the background loop is calling a sync function.
+        # Waiting for the loop here would deadlock it, so the coroutine can
+        # only be run by nesting it in the running loop.
+        if nest_asyncio_enabled():
+            return loop.run_until_complete(co)
+        co.close()
+        raise Exception(
+            "Sync SuperTokens functions can't be called from async code running on "
+            "the SuperTokens background event loop (for example, an async override "
+            "when using Flask). Await the asyncio version of the function instead, "
+            "or set SUPERTOKENS_NEST_ASYNCIO=1."
+        )
+    return asyncio.run_coroutine_threadsafe(co, loop).result()
+
+
+async def await_in_background_loop(co: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Awaits the coroutine on the background event loop, without blocking the
+    calling event loop. This is for resources, like connection pools, that are
+    bound to the loop they are created on: the background loop lives as long as
+    the process, unlike the loops that `async_to_sync` creates per call.
+    """
+    loop = get_background_event_loop()
+    if asyncio.get_event_loop() is loop:
+        return await co
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(co, loop))
+
+
 def sync(co: Coroutine[Any, Any, _T]) -> _T:
-    loop = create_or_get_event_loop()
-    return loop.run_until_complete(co)
+    # All the syncio functions run on the background loop, so they can be
+    # called from any thread, even one with a running event loop, without
+    # needing nest_asyncio.
+    return run_in_background_loop(co)
@@ -70,13 +70,17 @@ def middleware(get_response: Any):
         custom_request = DjangoRequest(request)
         from django.http import HttpResponse
 
-        response = DjangoResponse(HttpResponse())
         user_context = default_user_context(custom_request)
 
         try:
-            result: Union[DjangoResponse, None] = async_to_sync(st.middleware)(
-                custom_request, response, user_context
-            )
+            result: Union[DjangoResponse, None] = None
+            # Most requests are for the app's own views, so we only run the
+            # middleware coroutine if the request can be for a SuperTokens API.
+            if st.is_supertokens_api_path(custom_request):
+                response = DjangoResponse(HttpResponse())
+                result = async_to_sync(st.middleware)(
+                    custom_request, response, user_context
+                )
 
             if result is None:
                 result = DjangoResponse(get_response(request))
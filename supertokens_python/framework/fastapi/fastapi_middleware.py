@@ -22,14 +22,14 @@ def get_middleware():
     from supertokens_python.recipe.session import SessionContainer
     from supertokens_python.supertokens import manage_session_post_response
 
-    from starlette.requests import Request
     from starlette.responses import Response
     from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
     from supertokens_python.framework.fastapi.fastapi_request import (
-        FastApiRequest,
+        FastApiASGIRequest,
     )
     from supertokens_python.framework.fastapi.fastapi_response import (
+        FastApiASGIResponse,
         FastApiResponse,
     )
 
@@ -44,8 +44,9 @@ def get_middleware():
 
             st = Supertokens.get_instance()
 
-            request = Request(scope, receive=receive)
-            custom_request = FastApiRequest(request)
+            # This reads the headers, cookies and path from the ASGI scope directly,
+            # so no starlette Request is created unless the SDK needs the body.
+            custom_request = FastApiASGIRequest(scope, receive)
             user_context = default_user_context(custom_request)
 
             try:
@@ -61,18 +62,13 @@ def get_middleware():
                         if message["type"] == "http.response.start":
                             # Start message has the headers, so we update the headers here
                             # by using `manage_session_post_response` function, which will
-                            # apply all the Response Mutators. In the end, we just replace
-                            # the updated headers in the message.
-                            if hasattr(request.state, "supertokens") and isinstance(
-                                request.state.supertokens, SessionContainer
-                            ):
-                                fapi_response = Response()
-                                fapi_response.raw_headers = message["headers"]
-                                response = FastApiResponse(fapi_response)
+                            # apply all the Response Mutators directly on the raw header
+                            # list of the message.
+                            session = custom_request.get_session()
+                            if isinstance(session, SessionContainer):
                                 manage_session_post_response(
-                                    request.state.supertokens, response, user_context
+                                    session, FastApiASGIResponse(message), user_context
                                 )
-                                message["headers"] = fapi_response.raw_headers
 
                         # For `http.response.start` message, we might have the headers updated,
                         # otherwise, we just send all the messages as is
@@ -83,12 +79,9 @@ def get_middleware():
 
                 # This means that the request was handled by the supertokens middleware
                 # and hence we respond using the response object returned by the middleware.
-                if hasattr(request.state, "supertokens") and isinstance(
-                    request.state.supertokens, SessionContainer
-                ):
-                    manage_session_post_response(
-                        request.state.supertokens, result, user_context
-                    )
+                session = custom_request.get_session()
+                if isinstance(session, SessionContainer):
+                    manage_session_post_response(session, result, user_context)
 
                 if isinstance(result, FastApiResponse):
                     await result.response(scope, receive, send)
@@ -99,7 +92,7 @@ def get_middleware():
             except SuperTokensError as e:
                 response = FastApiResponse(Response())
                 result: Union[BaseResponse, None] = await st.handle_supertokens_error(
-                    FastApiRequest(request), e, response, user_context
+                    custom_request, e, response, user_context
                 )
                 if isinstance(result, FastApiResponse):
                     await result.response(scope, receive, send)
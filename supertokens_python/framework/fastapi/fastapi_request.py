@@ -13,7 +13,7 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, MutableMapping, Optional, Union
 from urllib.parse import parse_qsl
 
 from supertokens_python.framework.request import BaseRequest
@@ -74,3 +74,96 @@ class FastApiRequest(BaseRequest):
 
     async def form_data(self):
         return dict(parse_qsl((await self.request.body()).decode("utf-8")))
+
+
+class FastApiASGIRequest(BaseRequest):
+    """
+    Reads the request directly from the ASGI scope. A starlette `Request` is
+    only created (on first access of `request`) when the body or the full URL
+    is needed, which only happens for APIs handled by SuperTokens.
+    """
+
+    def __init__(self, scope: MutableMapping[str, Any], receive: Any):
+        self.scope = scope
+        self.receive = receive
+        self._request: Optional[Request] = None
+        self._headers: Optional[Dict[str, str]] = None
+        self._cookies: Optional[Dict[str, str]] = None
+        super().__init__()
+
+    @property
+    def request(self) -> Request:  # type: ignore
+        if self._request is None:
+            from starlette.requests import Request as StarletteRequest
+
+            self._request = StarletteRequest(self.scope, receive=self.receive)
+        return self._request
+
+    @request.setter
+    def request(self, request: Optional[Request]):  # type: ignore
+        self._request = request
+
+    def get_original_url(self) -> str:
+        return self.request.url.components.geturl()
+
+    def get_query_param(
+        self, key: str, default: Union[str, None] = None
+    ) -> Union[str, None]:
+        return self.get_query_params().get(key, default)
+
+    def get_query_params(self) -> Dict[str, Any]:
+        return dict(
+            parse_qsl(
+                self.scope.get("query_string", b"").decode("latin-1"),
+                keep_blank_values=True,
+            )
+        )
+
+    async def json(self) -> Union[Any, None]:
+        try:
+            return await self.request.json()
+        except Exception:
+            return {}
+
+    def method(self) -> str:
+        return self.scope["method"]
+
+    def get_cookie(self, key: str) -> Union[str, None]:
+        if self._cookies is None:
+            # Same as starlette's `request.cookies`
+            from starlette.requests import cookie_parser
+
+            cookie_header = self.get_header("cookie")
+            self._cookies = cookie_parser(cookie_header) if cookie_header else {}
+        return self._cookies.get(key)
+
+    def get_header(self, key: str) -> Union[str, None]:
+        if self._headers is None:
+            headers: Dict[str, str] = {}
+            for header_key, header_value in self.scope["headers"]:
+                # Like starlette, the first value is used for repeated headers
+                headers.setdefault(
+                    header_key.decode("latin-1").lower(),
+                    header_value.decode("latin-1"),
+                )
+            self._headers = headers
+        return self._headers.get(key.lower())
+
+    def get_session(self) -> Union[SessionContainer, None]:
+        return self.scope.get("state", {}).get("supertokens")
+
+    def set_session(self, session: SessionContainer):
+        # This is the same dict that starlette uses for `request.state`
+        self.scope.setdefault("state", {})["supertokens"] = session
+
+    def set_session_as_none(self):
+        self.scope.setdefault("state", {})["supertokens"] = None
+
+    def get_path(self) -> str:
+        root_path = self.scope.get("root_path", "")
+        url = self.scope["path"]
+        # Same as FastApiRequest.get_path
+        return url[url.startswith(root_path) and len(root_path) :]
+
+    async def form_data(self):
+        return dict(parse_qsl((await self.request.body()).decode("utf-8")))
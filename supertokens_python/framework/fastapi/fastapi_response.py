@@ -12,8 +12,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 import json
+from email.utils import formatdate
+from http.cookies import SimpleCookie
 from math import ceil
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple
 
 from supertokens_python.framework.response import BaseResponse
 from supertokens_python.utils import get_timestamp_ms
@@ -22,6 +24,8 @@ from supertokens_python.utils import get_timestamp_ms
 class FastApiResponse(BaseResponse):
     from fastapi import Response
 
+    supports_set_cookie_header = True
+
     def __init__(self, response: Response):
         super().__init__({})
         self.response = response
@@ -66,6 +70,11 @@ class FastApiResponse(BaseResponse):
             samesite=samesite,
         )
 
+    def add_set_cookie_header(self, header_value: str):
+        self.response.raw_headers.append(
+            (b"set-cookie", header_value.encode("latin-1"))
+        )
+
     def set_header(self, key: str, value: str):
         self.response.headers[key] = value
 
@@ -94,3 +103,77 @@ class FastApiResponse(BaseResponse):
             self.set_header("Content-Length", str(len(body)))
             self.response.body = body
             self.response_sent = True
+
+
+class FastApiASGIResponse(BaseResponse):
+    """
+    Wraps the `http.response.start` message of an ASGI response, so that
+    headers and cookies can be changed on its raw header list directly. Used
+    by the ASGI middleware once the app has started sending the response.
+    """
+
+    supports_set_cookie_header = True
+
+    def __init__(self, message: MutableMapping[str, Any]):
+        super().__init__({}, message.get("status", 200))
+        self.message = message
+        self.raw_headers: List[Tuple[bytes, bytes]] = list(message.get("headers", []))
+        message["headers"] = self.raw_headers
+
+    def set_cookie(
+        self,
+        key: str,
+        value: str,
+        expires: int,
+        path: str = "/",
+        domain: Optional[str] = None,
+        secure: bool = False,
+        httponly: bool = False,
+        samesite: str = "lax",
+    ):
+        cookie: SimpleCookie = SimpleCookie()  # type: ignore
+        cookie[key] = value
+        cookie[key]["expires"] = formatdate(expires / 1000, usegmt=True)
+        cookie[key]["path"] = path
+        if domain is not None:
+            cookie[key]["domain"] = domain
+        if secure:
+            cookie[key]["secure"] = True
+        if httponly:
+            cookie[key]["httponly"] = True
+        cookie[key]["samesite"] = samesite
+        self.add_set_cookie_header(cookie.output(header="").strip())
+
+    def add_set_cookie_header(self, header_value: str):
+        self.raw_headers.append((b"set-cookie", header_value.encode("latin-1")))
+
+    def set_header(self, key: str, value: str):
+        self.remove_header(key)
+        self.raw_headers.append(
+            (key.lower().encode("latin-1"), value.encode("latin-1"))
+        )
+
+    def get_header(self, key: str) -> Optional[str]:
+        raw_key = key.lower().encode("latin-1")
+        for header_key, header_value in self.raw_headers:
+            if header_key.lower() == raw_key:
+                return header_value.decode("latin-1")
+        return None
+
+    def remove_header(self, key: str):
+        raw_key = key.lower().encode("latin-1")
+        self.raw_headers[:] = [
+            (header_key, header_value)
+            for header_key, header_value in self.raw_headers
+            if header_key.lower() != raw_key
+        ]
+
+    def set_status_code(self, status_code: int):
+        self.message["status"] = status_code
+        self.status_code = status_code
+
+    def set_json_content(self, content: Dict[str, Any]):
+        raise Exception("Cannot set the body after the response has started")
+
+    def set_html_content(self, content: str):
+        raise Exception("Cannot set the body after the response has started")
@@ -16,7 +16,7 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING, Union
 
-from supertokens_python.async_to_sync_wrapper import sync
+from supertokens_python.async_to_sync_wrapper import run_in_background_loop
 from supertokens_python.framework import BaseResponse
 
 if TYPE_CHECKING:
@@ -50,10 +50,15 @@ class Middleware:
             st = Supertokens.get_instance()
 
             request_ = FlaskRequest(request)
+            if not st.is_supertokens_api_path(request_):
+                # Most requests are for the app's own routes, so we avoid running
+                # the middleware coroutine for them.
+                return None
+
             response_ = FlaskResponse(Response())
             user_context = default_user_context(request_)
 
-            result: Union[BaseResponse, None] = sync(
+            result: Union[BaseResponse, None] = run_in_background_loop(
                 st.middleware(request_, response_, user_context)
             )
 
@@ -103,7 +108,7 @@ class Middleware:
             base_request = FlaskRequest(request)
             user_context = default_user_context(base_request)
 
-            result: BaseResponse = sync(
+            result: BaseResponse = run_in_background_loop(
                 st.handle_supertokens_error(
                     base_request,
                     error,
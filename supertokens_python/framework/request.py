@@ -13,17 +13,65 @@
 # under the License.
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from urllib.parse import unquote
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.session.interfaces import SessionContainer
 
+# A backslash followed by either three octal digits or any other character, as
+# used in quoted cookie values
+_QUOTED_COOKIE_VALUE_ESCAPE = re.compile(r"\\(?:([0-3][0-7][0-7])|(.))")
+
+
+def _unquote_cookie_value(value: str) -> str:
+    def unescape(match: re.Match[str]) -> str:
+        octal, char = match.groups()
+        return chr(int(octal, 8)) if octal is not None else char
+
+    return _QUOTED_COOKIE_VALUE_ESCAPE.sub(unescape, value[1:-1])
+
+
+def parse_cookie_header_allow_duplicates(cookie_string: str) -> Dict[str, List[str]]:
+    """Parses a cookie header into a map of cookie name -> all the values sent
+    for that name (in the order they appear in the header). Values are unquoted
+    and url decoded."""
+    cookies: Dict[str, List[str]] = {}
+    for cookie_pair in cookie_string.split(";"):
+        name, sep, value = cookie_pair.partition("=")
+        if sep == "":
+            continue
+        name, value = name.strip(), value.strip()
+        if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+            value = _unquote_cookie_value(value)
+        name, value = unquote(name), unquote(value)
+        if name in cookies:
+            cookies[name].append(value)
+        else:
+            cookies[name] = [value]
+    return cookies
+
 
 class BaseRequest(ABC):
     def __init__(self):
         self.wrapper_used = True
         self.request = None
+        self.parsed_cookies: Optional[Dict[str, List[str]]] = None
+
+    def get_cookies_allow_duplicates(self) -> Dict[str, List[str]]:
+        """Returns all the cookies in the request's cookie header, including
+        duplicates. The header is parsed on first use and then cached for the
+        rest of the request."""
+        if self.parsed_cookies is None:
+            cookie_string = self.get_header("cookie")
+            self.parsed_cookies = (
+                {}
+                if cookie_string is None
+                else parse_cookie_header_allow_duplicates(cookie_string)
+            )
+        return self.parsed_cookies
 
     @abstractmethod
     def get_original_url(self) -> str:
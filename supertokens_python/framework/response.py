@@ -17,6 +17,11 @@ from typing import Any, Dict, Optional
 
 
 class BaseResponse(ABC):
+    # Set to True by responses whose set_cookie output is the same as the
+    # headers built by the session recipe, so those can be added directly
+    # with add_set_cookie_header instead of going through set_cookie.
+    supports_set_cookie_header = False
+
     @abstractmethod
     def __init__(self, content: Dict[str, Any], status_code: int = 200):
         self.content = content
@@ -38,6 +43,11 @@ class BaseResponse(ABC):
     ):
         pass
 
+    def add_set_cookie_header(self, header_value: str) -> None:
+        # Only called if supports_set_cookie_header is set, so other responses
+        # don't need to implement it
+        pass
+
     @abstractmethod
     def set_header(self, key: str, value: str) -> None:
         pass
@@ -0,0 +1,26 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from functools import lru_cache
+from os import path
+
+
+@lru_cache(maxsize=None)
+def get_email_template(templates_dir: str, name: str) -> str:
+    """
+    Reads an email template that is shipped as package data. Templates are
+    read when they are first used, instead of being part of the modules'
+    source, and then cached for the life of the process.
+    """
+    with open(path.join(templates_dir, name), encoding="utf-8", newline="") as f:
+        return f.read()
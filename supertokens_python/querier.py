@@ -14,11 +14,20 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from json import JSONDecodeError
 from os import environ
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
-
-from httpx import AsyncClient, ConnectTimeout, NetworkError, Response
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+)
 
 from .constants import (
     API_KEY_HEADER,
@@ -31,6 +40,8 @@ from .constants import (
 from .normalised_url_path import NormalisedURLPath
 
 if TYPE_CHECKING:
+    from httpx import AsyncClient, Response
+
     from .supertokens import Host
 
 from typing import List, Set, Union
@@ -41,6 +52,12 @@ from sniffio import AsyncLibraryNotFoundError
 from supertokens_python.async_to_sync_wrapper import create_or_get_event_loop
 from supertokens_python.utils import get_timestamp_ms
 
+# Set (via Querier.use_pooled_client) for the duration of bulk operations so
+# that all the core requests made in that context share a connection pool.
+_pooled_client: ContextVar[Optional[AsyncClient]] = ContextVar(
+    "_pooled_client", default=None
+)
+
 
 class Querier:
     __init_called = False
@@ -105,17 +122,19 @@ class Querier:
         if attempts_remaining == 0:
             raise Exception("Retry request failed")
 
+        # httpx is imported when it is first used, to keep the SDK's import time low
+        from httpx import AsyncClient
+
         try:
+            pooled_client = _pooled_client.get()
+            if pooled_client is not None:
+                return await Querier.__send_with_client(
+                    pooled_client, url, method, *args, **kwargs
+                )
             async with AsyncClient() as client:
-                if method == "GET":
-                    return await client.get(url, *args, **kwargs)  # type: ignore
-                if method == "POST":
-                    return await client.post(url, *args, **kwargs)  # type: ignore
-                if method == "PUT":
-                    return await client.put(url, *args, **kwargs)  # type: ignore
-                if method == "DELETE":
-                    return await client.delete(url, *args, **kwargs)  # type: ignore
-                raise Exception("Shouldn't come here")
+                return await Querier.__send_with_client(
+                    client, url, method, *args, **kwargs
+                )
         except AsyncLibraryNotFoundError:
             # Retry
             loop = create_or_get_event_loop()
@@ -123,6 +142,44 @@ class Querier:
                 self.api_request(url, method, attempts_remaining - 1, *args, **kwargs)
             )
 
+    @staticmethod
+    async def __send_with_client(
+        client: AsyncClient, url: str, method: str, *args: Any, **kwargs: Any
+    ) -> Response:
+        if method == "GET":
+            return await client.get(url, *args, **kwargs)  # type: ignore
+        if method == "POST":
+            return await client.post(url, *args, **kwargs)  # type: ignore
+        if method == "PUT":
+            return await client.put(url, *args, **kwargs)  # type: ignore
+        if method == "DELETE":
+            return await client.delete(url, *args, **kwargs)  # type: ignore
+        raise Exception("Shouldn't come here")
+
+    @staticmethod
+    @asynccontextmanager
+    async def use_pooled_client(max_connections: int) -> AsyncIterator[None]:
+        """All core requests made within this context (including from tasks
+        created in it) reuse the connections of a single client instead of
+        opening a new one per request. Nested uses reuse the outer client."""
+        if _pooled_client.get() is not None:
+            yield
+            return
+
+        from httpx import AsyncClient, Limits
+
+        async with AsyncClient(
+            limits=Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            )
+        ) as client:
+            token = _pooled_client.set(client)
+            try:
+                yield
+            finally:
+                _pooled_client.reset(token)
+
     async def get_api_version(self):
         if Querier.api_version is not None:
             return Querier.api_version
@@ -439,6 +496,8 @@ class Querier:
         no_of_tries: int,
         retry_info_map: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
+        from httpx import ConnectTimeout, NetworkError
+
         if no_of_tries == 0:
             raise Exception("No SuperTokens core available to query")
 
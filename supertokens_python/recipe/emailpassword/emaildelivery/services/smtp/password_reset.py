@@ -18,7 +18,7 @@ from supertokens_python.ingredients.emaildelivery.types import EmailContent
 from supertokens_python.recipe.emailpassword.types import PasswordResetEmailTemplateVars
 from supertokens_python.supertokens import Supertokens
 
-from .password_reset_email import html_template
+from . import password_reset_email
 
 
 def get_password_reset_email_content(
@@ -36,6 +36,6 @@ def get_password_reset_email_content(
 
 
 def get_password_reset_email_html(app_name: str, email: str, reset_link: str):
-    return Template(html_template).substitute(
+    return Template(password_reset_email.html_template).substitute(
         appname=app_name, resetLink=reset_link, toEmail=email
     )
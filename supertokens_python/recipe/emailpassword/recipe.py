@@ -14,7 +14,7 @@
 from __future__ import annotations
 
 from os import environ
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from supertokens_python.ingredients.emaildelivery import EmailDeliveryIngredient
 from supertokens_python.ingredients.emaildelivery.types import EmailDeliveryConfig
@@ -71,7 +71,6 @@ from .utils import (
 class EmailPasswordRecipe(RecipeModule):
     recipe_id = "emailpassword"
     __instance = None
-    email_delivery: EmailDeliveryIngredient[EmailTemplateVars]
 
     def __init__(
         self,
@@ -102,13 +101,9 @@ class EmailPasswordRecipe(RecipeModule):
             else self.config.override.functions(recipe_implementation)
         )
 
-        email_delivery_ingredient = ingredients.email_delivery
-        if email_delivery_ingredient is None:
-            self.email_delivery = EmailDeliveryIngredient(
-                self.config.get_email_delivery_config(self.recipe_implementation)
-            )
-        else:
-            self.email_delivery = email_delivery_ingredient
+        self._email_delivery: Optional[
+            EmailDeliveryIngredient[EmailTemplateVars]
+        ] = ingredients.email_delivery
 
         api_implementation = APIImplementation()
         self.api_implementation = (
@@ -124,6 +119,21 @@ class EmailPasswordRecipe(RecipeModule):
 
         PostSTInitCallbacks.add_post_init_callback(callback)
 
+    @property
+    def email_delivery(self) -> EmailDeliveryIngredient[EmailTemplateVars]:
+        # Created on first use, since most requests don't send emails
+        if self._email_delivery is None:
+            self._email_delivery = EmailDeliveryIngredient(
+                self.config.get_email_delivery_config(self.recipe_implementation)
+            )
+        return self._email_delivery
+
+    @email_delivery.setter
+    def email_delivery(
+        self, email_delivery: EmailDeliveryIngredient[EmailTemplateVars]
+    ):
+        self._email_delivery = email_delivery
+
     def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
         return isinstance(err, SuperTokensError) and (
             isinstance(err, SuperTokensEmailPasswordError)
@@ -20,7 +20,7 @@ from supertokens_python.recipe.emailverification.types import (
 )
 from supertokens_python.supertokens import Supertokens
 
-from .email_verify_email import html_template
+from . import email_verify_email
 
 
 def get_email_verify_email_content(
@@ -37,6 +37,6 @@ def get_email_verify_email_content(
 
 
 def get_email_verify_email_html(app_name: str, email: str, verification_link: str):
-    return Template(html_template).substitute(
+    return Template(email_verify_email.html_template).substitute(
         appname=app_name, verificationLink=verification_link, toEmail=email
     )
@@ -81,7 +81,6 @@ from .utils import MODE_TYPE, OverrideConfig, validate_and_normalise_user_input
 class EmailVerificationRecipe(RecipeModule):
     recipe_id = "emailverification"
     __instance = None
-    email_delivery: EmailDeliveryIngredient[VerificationEmailTemplateVars]
 
     def __init__(
         self,
@@ -118,18 +117,29 @@ class EmailVerificationRecipe(RecipeModule):
             else self.config.override.apis(api_implementation)
         )
 
-        email_delivery_ingredient = ingredients.email_delivery
-        if email_delivery_ingredient is None:
-            self.email_delivery = EmailDeliveryIngredient(
-                self.config.get_email_delivery_config()
-            )
-        else:
-            self.email_delivery = email_delivery_ingredient
+        self._email_delivery: Optional[
+            EmailDeliveryIngredient[VerificationEmailTemplateVars]
+        ] = ingredients.email_delivery
 
         self.get_email_for_user_id_funcs_from_other_recipes: List[
             TypeGetEmailForUserIdFunction
         ] = []
 
+    @property
+    def email_delivery(self) -> EmailDeliveryIngredient[VerificationEmailTemplateVars]:
+        # Created on first use, since most requests don't send emails
+        if self._email_delivery is None:
+            self._email_delivery = EmailDeliveryIngredient(
+                self.config.get_email_delivery_config()
+            )
+        return self._email_delivery
+
+    @email_delivery.setter
+    def email_delivery(
+        self, email_delivery: EmailDeliveryIngredient[VerificationEmailTemplateVars]
+    ):
+        self._email_delivery = email_delivery
+
     def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
         return isinstance(err, SuperTokensError) and isinstance(
             err, SuperTokensEmailVerificationError
@@ -13,7 +13,7 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from . import exceptions as ex
 from . import recipe
@@ -34,8 +34,12 @@ def init(
         TypeGetAllowedDomainsForTenantId, None
     ] = None,
     override: Union[InputOverrideConfig, None] = None,
+    tenant_config_cache_ttl_in_sec: Optional[int] = None,
+    tenant_config_cache_stale_while_revalidate_in_sec: Optional[int] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return recipe.MultitenancyRecipe.init(
         get_allowed_domains_for_tenant_id,
         override,
+        tenant_config_cache_ttl_in_sec,
+        tenant_config_cache_stale_while_revalidate_in_sec,
     )
@@ -11,8 +11,9 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from supertokens_python.recipe.multitenancy.interfaces import (
     APIOptions,
@@ -22,9 +23,14 @@ from supertokens_python.recipe.multitenancy.interfaces import (
     LoginMethodThirdParty,
 )
 from supertokens_python.types import GeneralErrorResponse
+from supertokens_python.utils import gather_with_concurrency_limit
 
+from ..constants import PROVIDER_RESOLUTION_CONCURRENCY_LIMIT
 from ..interfaces import APIInterface, ThirdPartyProvider
 
+if TYPE_CHECKING:
+    from supertokens_python.recipe.thirdparty.provider import ProviderInput
+
 
 class APIImplementation(APIInterface):
     async def login_methods_get(
@@ -50,16 +56,20 @@ class APIImplementation(APIInterface):
         if tenant_config is None:
             raise Exception("Tenant not found")
 
-        provider_inputs_from_static = api_options.static_third_party_providers
-        provider_configs_from_core = tenant_config.third_party.providers
-
-        merged_providers = merge_providers_from_core_and_static(
-            provider_configs_from_core, provider_inputs_from_static
-        )
-
-        final_provider_list: List[ThirdPartyProvider] = []
+        merged_providers_cache = api_options.merged_providers_cache
+        if merged_providers_cache is not None:
+            merged_providers = merged_providers_cache.get_merged_providers(
+                tenant_id, tenant_config
+            )
+        else:
+            merged_providers = merge_providers_from_core_and_static(
+                tenant_config.third_party.providers,
+                api_options.static_third_party_providers,
+            )
 
-        for provider_input in merged_providers:
+        async def get_third_party_provider(
+            provider_input: ProviderInput,
+        ) -> Optional[ThirdPartyProvider]:
             try:
                 provider_instance = await find_and_create_provider_instance(
                     merged_providers,
@@ -72,17 +82,28 @@ class APIImplementation(APIInterface):
                     raise Exception("Should never come here")
 
             except ClientTypeNotFoundError:
-                continue
-            final_provider_list.append(
-                ThirdPartyProvider(provider_instance.id, provider_instance.config.name)
+                return None
+            return ThirdPartyProvider(
+                provider_instance.id, provider_instance.config.name
             )
 
+        # Creating a provider can fetch its OIDC discovery endpoint, so they
+        # are created concurrently
+        third_party_providers = await gather_with_concurrency_limit(
+            [
+                get_third_party_provider(provider_input)
+                for provider_input in merged_providers
+            ],
+            PROVIDER_RESOLUTION_CONCURRENCY_LIMIT,
+        )
+
         return LoginMethodsGetOkResult(
             email_password=LoginMethodEmailPassword(
                 tenant_config.emailpassword.enabled
             ),
             passwordless=LoginMethodPasswordless(tenant_config.passwordless.enabled),
             third_party=LoginMethodThirdParty(
-                tenant_config.third_party.enabled, final_provider_list
+                tenant_config.third_party.enabled,
+                [p for p in third_party_providers if p is not None],
             ),
         )
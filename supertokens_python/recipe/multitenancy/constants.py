@@ -13,3 +13,4 @@
 # under the License.
 LOGIN_METHODS = "/loginmethods"
 DEFAULT_TENANT_ID = "public"
+PROVIDER_RESOLUTION_CONCURRENCY_LIMIT = 5
@@ -24,6 +24,9 @@ if TYPE_CHECKING:
         ProviderConfig,
         ProviderInput,
     )
+    from supertokens_python.recipe.thirdparty.providers.config_utils import (
+        MergedProvidersCache,
+    )
     from .utils import MultitenancyConfig
 
 
@@ -280,6 +283,7 @@ class APIOptions:
         config: MultitenancyConfig,
         recipe_implementation: RecipeInterface,
         static_third_party_providers: List[ProviderInput],
+        merged_providers_cache: Optional[MergedProvidersCache] = None,
     ):
         self.request = request
         self.response = response
@@ -287,6 +291,7 @@ class APIOptions:
         self.config = config
         self.recipe_implementation = recipe_implementation
         self.static_third_party_providers = static_third_party_providers
+        self.merged_providers_cache = merged_providers_cache
 
 
 class ThirdPartyProvider:
@@ -36,6 +36,9 @@ if TYPE_CHECKING:
     from supertokens_python.framework.response import BaseResponse
     from supertokens_python.supertokens import AppInfo
     from supertokens_python.recipe.thirdparty.provider import ProviderInput
+    from supertokens_python.recipe.thirdparty.providers.config_utils import (
+        MergedProvidersCache,
+    )
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
@@ -47,6 +50,7 @@ from .constants import LOGIN_METHODS
 from .exceptions import MultitenancyError
 from .utils import (
     InputOverrideConfig,
+    TenantConfigCache,
     validate_and_normalise_user_input,
 )
 
@@ -63,15 +67,23 @@ class MultitenancyRecipe(RecipeModule):
             TypeGetAllowedDomainsForTenantId
         ] = None,
         override: Union[InputOverrideConfig, None] = None,
+        tenant_config_cache_ttl_in_sec: Optional[int] = None,
+        tenant_config_cache_stale_while_revalidate_in_sec: Optional[int] = None,
     ) -> None:
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
             get_allowed_domains_for_tenant_id,
             override,
+            tenant_config_cache_ttl_in_sec,
+            tenant_config_cache_stale_while_revalidate_in_sec,
+        )
+        self.tenant_config_cache = TenantConfigCache(
+            self.config.tenant_config_cache_ttl_in_sec,
+            self.config.tenant_config_cache_stale_while_revalidate_in_sec,
         )
 
         recipe_implementation = RecipeImplementation(
-            Querier.get_instance(recipe_id), self.config
+            Querier.get_instance(recipe_id), self.config, self.tenant_config_cache
         )
         self.recipe_implementation = (
             recipe_implementation
@@ -87,6 +99,8 @@ class MultitenancyRecipe(RecipeModule):
         )
 
         self.static_third_party_providers: List[ProviderInput] = []
+        # Set by the thirdparty recipe, if it's initialised
+        self.merged_providers_cache: Optional[MergedProvidersCache] = None
         self.get_allowed_domains_for_tenant_id = (
             self.config.get_allowed_domains_for_tenant_id
         )
@@ -123,6 +137,7 @@ class MultitenancyRecipe(RecipeModule):
             self.config,
             self.recipe_implementation,
             self.static_third_party_providers,
+            self.merged_providers_cache,
         )
         return await handle_login_methods_api(
             self.api_implementation,
@@ -149,6 +164,8 @@ class MultitenancyRecipe(RecipeModule):
             TypeGetAllowedDomainsForTenantId, None
         ] = None,
         override: Union[InputOverrideConfig, None] = None,
+        tenant_config_cache_ttl_in_sec: Optional[int] = None,
+        tenant_config_cache_stale_while_revalidate_in_sec: Optional[int] = None,
     ):
         def func(app_info: AppInfo):
             if MultitenancyRecipe.__instance is None:
@@ -157,6 +174,8 @@ class MultitenancyRecipe(RecipeModule):
                     app_info,
                     get_allowed_domains_for_tenant_id,
                     override,
+                    tenant_config_cache_ttl_in_sec,
+                    tenant_config_cache_stale_while_revalidate_in_sec,
                 )
 
                 def callback():
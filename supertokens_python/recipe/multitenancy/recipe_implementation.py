@@ -13,7 +13,8 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Dict, Any, Union, List
+import asyncio
+from typing import TYPE_CHECKING, Optional, Dict, Any, Union, List, Set
 from supertokens_python.recipe.multitenancy.interfaces import (
     AssociateUserToTenantOkResult,
     AssociateUserToTenantUnknownUserIdError,
@@ -42,7 +43,7 @@ from .interfaces import (
 if TYPE_CHECKING:
     from supertokens_python.querier import Querier
     from supertokens_python.recipe.thirdparty.provider import ProviderConfig
-    from .utils import MultitenancyConfig
+    from .utils import MultitenancyConfig, TenantConfigCache
 
 from supertokens_python.querier import NormalisedURLPath
 from .constants import DEFAULT_TENANT_ID
@@ -121,10 +122,22 @@ def parse_tenant_config(tenant: Dict[str, Any]) -> TenantConfigResponse:
 
 
 class RecipeImplementation(RecipeInterface):
-    def __init__(self, querier: Querier, config: MultitenancyConfig):
+    def __init__(
+        self,
+        querier: Querier,
+        config: MultitenancyConfig,
+        tenant_config_cache: Optional[TenantConfigCache] = None,
+    ):
         super().__init__()
         self.querier = querier
         self.config = config
+        self.tenant_config_cache = tenant_config_cache
+        # Keeps the background refreshes of stale tenant configs alive
+        self._refresh_tasks: Set[asyncio.Future[None]] = set()
+
+    def _invalidate_tenant_config(self, tenant_id: Optional[str]):
+        if self.tenant_config_cache is not None:
+            self.tenant_config_cache.invalidate(tenant_id or DEFAULT_TENANT_ID)
 
     async def get_tenant_id(
         self, tenant_id_from_frontend: str, user_context: Dict[str, Any]
@@ -145,6 +158,7 @@ class RecipeImplementation(RecipeInterface):
             },
             user_context=user_context,
         )
+        self._invalidate_tenant_config(tenant_id)
         return CreateOrUpdateTenantOkResult(
             created_new=response["createdNew"],
         )
@@ -157,17 +171,57 @@ class RecipeImplementation(RecipeInterface):
             {"tenantId": tenant_id},
             user_context=user_context,
         )
+        self._invalidate_tenant_config(tenant_id)
         return DeleteTenantOkResult(
             did_exist=response["didExist"],
         )
 
     async def get_tenant(
         self, tenant_id: Optional[str], user_context: Dict[str, Any]
+    ) -> Optional[GetTenantOkResult]:
+        tenant_id = tenant_id or DEFAULT_TENANT_ID
+        cache = self.tenant_config_cache
+        if cache is None:
+            return await self._fetch_tenant(tenant_id, user_context)
+
+        # Cached results are shared by all callers, and the thirdparty recipe's
+        # caches are keyed on them, so they must be treated as read-only
+        state, tenant = cache.get(tenant_id)
+        if state == cache.FRESH:
+            return tenant
+        if state == cache.STALE:
+            if cache.start_refresh(tenant_id):
+                # The refresh outlives the request that triggered it, so it
+                # doesn't get that request's user_context
+                task = asyncio.ensure_future(self._refresh_tenant(cache, tenant_id, {}))
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            return tenant
+
+        cache_version = cache.get_version()
+        tenant = await self._fetch_tenant(tenant_id, user_context)
+        cache.set(tenant_id, tenant, cache_version)
+        return tenant
+
+    async def _refresh_tenant(
+        self, cache: TenantConfigCache, tenant_id: str, user_context: Dict[str, Any]
+    ):
+        try:
+            cache_version = cache.get_version()
+            tenant = await self._fetch_tenant(tenant_id, user_context)
+            cache.set(tenant_id, tenant, cache_version)
+        except Exception:
+            # The stale config keeps being served until it expires, and then
+            # the next get_tenant call fetches it again
+            pass
+        finally:
+            cache.end_refresh(tenant_id)
+
+    async def _fetch_tenant(
+        self, tenant_id: str, user_context: Dict[str, Any]
     ) -> Optional[GetTenantOkResult]:
         res = await self.querier.send_get_request(
-            NormalisedURLPath(
-                f"{tenant_id or DEFAULT_TENANT_ID}/recipe/multitenancy/tenant"
-            ),
+            NormalisedURLPath(f"{tenant_id}/recipe/multitenancy/tenant"),
             None,
             user_context=user_context,
         )
@@ -227,6 +281,7 @@ class RecipeImplementation(RecipeInterface):
             },
             user_context=user_context,
         )
+        self._invalidate_tenant_config(tenant_id)
 
         return CreateOrUpdateThirdPartyConfigOkResult(
             created_new=response["createdNew"],
@@ -247,6 +302,7 @@ class RecipeImplementation(RecipeInterface):
             },
             user_context=user_context,
         )
+        self._invalidate_tenant_config(tenant_id)
 
         return DeleteThirdPartyConfigOkResult(
             did_config_exist=response["didConfigExist"],
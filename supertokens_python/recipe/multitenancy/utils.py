@@ -14,10 +14,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Awaitable, Optional, Callable
+from threading import Lock
+from typing import TYPE_CHECKING, Awaitable, Dict, Optional, Callable, Set, Tuple
 from supertokens_python.exceptions import SuperTokensError
 from supertokens_python.framework import BaseRequest, BaseResponse
 from supertokens_python.utils import (
+    get_timestamp_ms,
     resolve,
 )
 
@@ -27,6 +29,7 @@ if TYPE_CHECKING:
         TypeGetAllowedDomainsForTenantId,
         RecipeInterface,
         APIInterface,
+        GetTenantOkResult,
     )
 
 
@@ -86,14 +89,105 @@ class MultitenancyConfig:
         self,
         get_allowed_domains_for_tenant_id: Optional[TypeGetAllowedDomainsForTenantId],
         override: OverrideConfig,
+        tenant_config_cache_ttl_in_sec: int,
+        tenant_config_cache_stale_while_revalidate_in_sec: int,
     ):
         self.get_allowed_domains_for_tenant_id = get_allowed_domains_for_tenant_id
         self.override = override
+        self.tenant_config_cache_ttl_in_sec = tenant_config_cache_ttl_in_sec
+        self.tenant_config_cache_stale_while_revalidate_in_sec = (
+            tenant_config_cache_stale_while_revalidate_in_sec
+        )
+
+
+class TenantConfigCache:
+    """Process level cache of tenant id -> tenant config, used by `get_tenant`.
+    Entries are fresh for the configured TTL. After that, they are still served
+    during the stale while revalidate window while they are refreshed in the
+    background. Entries are invalidated whenever a tenant or its third party
+    configs are changed via this SDK."""
+
+    FRESH = "FRESH"
+    STALE = "STALE"
+    MISS = "MISS"
+
+    def __init__(self, ttl_in_sec: int, stale_while_revalidate_in_sec: int):
+        self.ttl_in_ms = ttl_in_sec * 1000
+        self.stale_while_revalidate_in_ms = stale_while_revalidate_in_sec * 1000
+        self._lock = Lock()
+        # tenant id -> (time fetched in ms, config or None if the tenant doesn't exist)
+        self._entries: Dict[str, Tuple[int, Optional[GetTenantOkResult]]] = {}
+        self._refreshing: Set[str] = set()
+        self._version = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def get_version(self) -> int:
+        return self._version
+
+    def get(self, tenant_id: str) -> Tuple[str, Optional[GetTenantOkResult]]:
+        """Returns whether the tenant's config is FRESH, STALE or a MISS, along
+        with the cached config"""
+        entry = self._entries.get(tenant_id)
+        if entry is not None:
+            age = get_timestamp_ms() - entry[0]
+            if age < self.ttl_in_ms:
+                self.hits += 1
+                return TenantConfigCache.FRESH, entry[1]
+            if age < self.ttl_in_ms + self.stale_while_revalidate_in_ms:
+                self.stale_hits += 1
+                return TenantConfigCache.STALE, entry[1]
+            with self._lock:
+                if self._entries.get(tenant_id) is entry:
+                    del self._entries[tenant_id]
+        self.misses += 1
+        return TenantConfigCache.MISS, None
+
+    def set(self, tenant_id: str, config: Optional[GetTenantOkResult], version: int):
+        """Caches the tenant's config, unless the cache was invalidated after
+        `version` was read (i.e. while the config was being fetched)"""
+        if self.ttl_in_ms <= 0:
+            return
+        with self._lock:
+            if version != self._version:
+                return
+            self._entries[tenant_id] = (get_timestamp_ms(), config)
+
+    def start_refresh(self, tenant_id: str) -> bool:
+        """Returns False if the tenant's config is already being refreshed"""
+        with self._lock:
+            if tenant_id in self._refreshing:
+                return False
+            self._refreshing.add(tenant_id)
+            return True
+
+    def end_refresh(self, tenant_id: str):
+        with self._lock:
+            self._refreshing.discard(tenant_id)
+
+    def invalidate(self, tenant_id: Optional[str] = None):
+        with self._lock:
+            self._version += 1
+            if tenant_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(tenant_id, None)
+
+    def get_hit_ratio(self) -> float:
+        """Returns the share of lookups, including stale ones, that were served
+        from the cache"""
+        total = self.hits + self.stale_hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits + self.stale_hits) / total
 
 
 def validate_and_normalise_user_input(
     get_allowed_domains_for_tenant_id: Optional[TypeGetAllowedDomainsForTenantId],
     override: Union[InputOverrideConfig, None] = None,
+    tenant_config_cache_ttl_in_sec: Optional[int] = None,
+    tenant_config_cache_stale_while_revalidate_in_sec: Optional[int] = None,
 ) -> MultitenancyConfig:
     if override is not None and not isinstance(override, OverrideConfig):  # type: ignore
         raise ValueError("override must be of type OverrideConfig or None")
@@ -101,7 +195,20 @@ def validate_and_normalise_user_input(
     if override is None:
         override = InputOverrideConfig()
 
+    if tenant_config_cache_ttl_in_sec is None:
+        tenant_config_cache_ttl_in_sec = 60
+    if tenant_config_cache_ttl_in_sec < 0:
+        raise ValueError("tenant_config_cache_ttl_in_sec must not be negative")
+    if tenant_config_cache_stale_while_revalidate_in_sec is None:
+        tenant_config_cache_stale_while_revalidate_in_sec = 60
+    if tenant_config_cache_stale_while_revalidate_in_sec < 0:
+        raise ValueError(
+            "tenant_config_cache_stale_while_revalidate_in_sec must not be negative"
+        )
+
     return MultitenancyConfig(
         get_allowed_domains_for_tenant_id,
         OverrideConfig(override.functions, override.apis),
+        tenant_config_cache_ttl_in_sec,
+        tenant_config_cache_stale_while_revalidate_in_sec,
     )
@@ -20,7 +20,7 @@ from supertokens_python.ingredients.emaildelivery.types import EmailContent
 from supertokens_python.supertokens import Supertokens
 from supertokens_python.utils import humanize_time
 
-from .pless_login_email import magic_link_body, otp_and_magic_link_body, otp_body
+from . import pless_login_email
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.passwordless.interfaces import (
@@ -51,11 +51,11 @@ def get_pless_email_html(
     user_input_code: Union[str, None] = None,
 ):
     if (user_input_code is not None) and (url_with_link_code is not None):
-        html_template = otp_and_magic_link_body
+        html_template = pless_login_email.otp_and_magic_link_body
     elif user_input_code is not None:
-        html_template = otp_body
+        html_template = pless_login_email.otp_body
     elif url_with_link_code is not None:
-        html_template = magic_link_body
+        html_template = pless_login_email.magic_link_body
     else:
         raise Exception("This should never be thrown.")
 
@@ -78,8 +78,6 @@ from supertokens_python.recipe_module import APIHandled, RecipeModule
 class PasswordlessRecipe(RecipeModule):
     recipe_id = "passwordless"
     __instance = None
-    email_delivery: EmailDeliveryIngredient[PasswordlessLoginEmailTemplateVars]
-    sms_delivery: SMSDeliveryIngredient[PasswordlessLoginSMSTemplateVars]
 
     def __init__(
         self,
@@ -126,20 +124,12 @@ class PasswordlessRecipe(RecipeModule):
             else self.config.override.apis(api_implementation)
         )
 
-        email_delivery_ingredient = ingredients.email_delivery
-        if email_delivery_ingredient is None:
-            self.email_delivery = EmailDeliveryIngredient(
-                self.config.get_email_delivery_config()
-            )
-        else:
-            self.email_delivery = email_delivery_ingredient
-
-        sms_delivery_ingredient = ingredients.sms_delivery
-        self.sms_delivery = (
-            SMSDeliveryIngredient(self.config.get_sms_delivery_config())
-            if sms_delivery_ingredient is None
-            else sms_delivery_ingredient
-        )
+        self._email_delivery: Optional[
+            EmailDeliveryIngredient[PasswordlessLoginEmailTemplateVars]
+        ] = ingredients.email_delivery
+        self._sms_delivery: Optional[
+            SMSDeliveryIngredient[PasswordlessLoginSMSTemplateVars]
+        ] = ingredients.sms_delivery
 
         def callback():
             ev_recipe = EmailVerificationRecipe.get_instance_optional()
@@ -250,6 +240,38 @@ class PasswordlessRecipe(RecipeModule):
     def get_all_cors_headers(self) -> List[str]:
         return []
 
+    @property
+    def email_delivery(
+        self,
+    ) -> EmailDeliveryIngredient[PasswordlessLoginEmailTemplateVars]:
+        # Created on first use, since most requests don't send emails
+        if self._email_delivery is None:
+            self._email_delivery = EmailDeliveryIngredient(
+                self.config.get_email_delivery_config()
+            )
+        return self._email_delivery
+
+    @email_delivery.setter
+    def email_delivery(
+        self,
+        email_delivery: EmailDeliveryIngredient[PasswordlessLoginEmailTemplateVars],
+    ):
+        self._email_delivery = email_delivery
+
+    @property
+    def sms_delivery(self) -> SMSDeliveryIngredient[PasswordlessLoginSMSTemplateVars]:
+        if self._sms_delivery is None:
+            self._sms_delivery = SMSDeliveryIngredient(
+                self.config.get_sms_delivery_config()
+            )
+        return self._sms_delivery
+
+    @sms_delivery.setter
+    def sms_delivery(
+        self, sms_delivery: SMSDeliveryIngredient[PasswordlessLoginSMSTemplateVars]
+    ):
+        self._sms_delivery = sms_delivery
+
     def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
         return isinstance(err, SuperTokensError) and isinstance(
             err, SuperTokensPasswordlessError
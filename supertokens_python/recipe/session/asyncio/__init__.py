@@ -12,13 +12,30 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+import asyncio
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from supertokens_python.logger import log_debug_message
+from supertokens_python.querier import Querier
 
 from supertokens_python.recipe.openid.interfaces import (
     GetOpenIdDiscoveryConfigurationResult,
 )
 from supertokens_python.recipe.session.interfaces import (
     ClaimsValidationResult,
+    CreateNewSessionInput,
+    CreateNewSessionsBulkResult,
     GetClaimValueOkResult,
     JSONObject,
     SessionClaim,
@@ -26,10 +43,16 @@ from supertokens_python.recipe.session.interfaces import (
     SessionContainer,
     SessionDoesNotExistError,
     SessionInformationResult,
+    UserSessionHandle,
 )
 from supertokens_python.recipe.session.recipe import SessionRecipe
 from supertokens_python.types import MaybeAwaitable
-from supertokens_python.utils import FRAMEWORKS, resolve
+from supertokens_python.utils import (
+    FRAMEWORKS,
+    gather_with_concurrency_limit,
+    get_timestamp_ms,
+    resolve,
+)
 
 from ...jwt.interfaces import (
     CreateJwtOkResult,
@@ -125,6 +148,55 @@ async def create_new_session_without_request_response(
     )
 
 
+async def create_new_sessions_bulk(
+    inputs: List[CreateNewSessionInput],
+    max_concurrency: int = 10,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> CreateNewSessionsBulkResult:
+    """Creates a session for each input (like `create_new_session_without_request_response`),
+    with at most `max_concurrency` of them being created at a time over a shared
+    connection pool to the core. Failures are reported per input instead of
+    stopping the whole batch.
+
+    Each session is created with its own copy of `user_context`."""
+    if user_context is None:
+        user_context = {}
+    if max_concurrency < 1:
+        raise Exception("max_concurrency must be at least 1")
+    common_user_context = user_context
+
+    async def create(
+        session_input: CreateNewSessionInput,
+    ) -> Union[SessionContainer, Exception]:
+        try:
+            return await create_new_session_without_request_response(
+                session_input.tenant_id,
+                session_input.user_id,
+                session_input.access_token_payload,
+                session_input.session_data_in_database,
+                session_input.disable_anti_csrf,
+                {**common_user_context},
+            )
+        except Exception as e:
+            return e
+
+    start_time = get_timestamp_ms()
+    async with Querier.use_pooled_client(max_concurrency):
+        results = await gather_with_concurrency_limit(
+            [create(i) for i in inputs], max_concurrency
+        )
+    result = CreateNewSessionsBulkResult(results, get_timestamp_ms() - start_time)
+
+    log_debug_message(
+        "createNewSessionsBulk: created %s sessions (%s failed) in %sms (%.2f sessions/s)",
+        result.success_count,
+        result.error_count,
+        result.time_taken_in_ms,
+        result.sessions_per_second,
+    )
+    return result
+
+
 async def validate_claims_for_session_handle(
     session_handle: str,
     override_global_claim_validators: Optional[
@@ -467,6 +539,132 @@ async def revoke_multiple_sessions(
     )
 
 
+async def _iterate(items: Union[Iterable[_T], AsyncIterable[_T]]):
+    if isinstance(items, AsyncIterable):
+        async for item in items:  # type: ignore
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def iterate_sessions_for_users(
+    user_ids: Union[Iterable[str], AsyncIterable[str]],
+    tenant_id: Optional[str] = None,
+    fetch_session_information: bool = True,
+    max_concurrency: int = 10,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> AsyncGenerator[UserSessionHandle, None]:
+    """Streams the session handles (and optionally the session information) of
+    all the given users. At most `max_concurrency` users are processed at a time,
+    and only a bounded number of results are buffered, so memory use doesn't
+    grow with the number of users. Results are not ordered by user.
+
+    Sessions that stop existing before their information could be fetched are skipped.
+    If fetching the sessions of a user fails, the error is raised from this generator."""
+    if user_context is None:
+        user_context = {}
+    if max_concurrency < 1:
+        raise Exception("max_concurrency must be at least 1")
+    common_user_context = user_context
+
+    user_id_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(max_concurrency)
+    result_queue: asyncio.Queue[
+        Union[UserSessionHandle, Exception, None]
+    ] = asyncio.Queue(max_concurrency * 10)
+
+    # The end of input / output sentinels are not queued when the tasks are
+    # cancelled, as nothing may be reading the queues anymore by then.
+    async def produce():
+        try:
+            async for user_id in _iterate(user_ids):
+                await user_id_queue.put(user_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await result_queue.put(e)
+        for _ in range(max_concurrency):
+            await user_id_queue.put(None)
+
+    async def work():
+        try:
+            while True:
+                user_id = await user_id_queue.get()
+                if user_id is None:
+                    return
+                handles = await get_all_session_handles_for_user(
+                    user_id, tenant_id, {**common_user_context}
+                )
+                for handle in handles:
+                    session_information = None
+                    if fetch_session_information:
+                        session_information = await get_session_information(
+                            handle, {**common_user_context}
+                        )
+                        if session_information is None:
+                            continue
+                    await result_queue.put(
+                        UserSessionHandle(user_id, handle, session_information)
+                    )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await result_queue.put(e)
+        await result_queue.put(None)
+
+    async def run():
+        # Runs in its own task, so that the pooled client is only visible to
+        # the producer and workers and not to the code consuming this generator.
+        async with Querier.use_pooled_client(max_concurrency):
+            await asyncio.gather(produce(), *[work() for _ in range(max_concurrency)])
+
+    task = asyncio.ensure_future(run())
+    try:
+        workers_running = max_concurrency
+        while workers_running > 0:
+            result = await result_queue.get()
+            if result is None:
+                workers_running -= 1
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                yield result
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def revoke_sessions_in_bulk(
+    session_handles: Union[Iterable[str], AsyncIterable[str]],
+    batch_size: int = 100,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> int:
+    """Revokes the given session handles in batches of `batch_size` using
+    `revoke_multiple_sessions`, so the handles can be streamed in (for example
+    from `iterate_sessions_for_users`) without collecting all of them first.
+
+    Returns the number of sessions that were revoked."""
+    if user_context is None:
+        user_context = {}
+    if batch_size < 1:
+        raise Exception("batch_size must be at least 1")
+
+    revoked_count = 0
+    batch: List[str] = []
+    async for session_handle in _iterate(session_handles):
+        batch.append(session_handle)
+        if len(batch) == batch_size:
+            revoked_count += len(
+                await revoke_multiple_sessions(batch, {**user_context})
+            )
+            batch = []
+    if len(batch) > 0:
+        revoked_count += len(await revoke_multiple_sessions(batch, {**user_context}))
+
+    log_debug_message("revokeSessionsInBulk: revoked %s sessions", revoked_count)
+    return revoked_count
+
+
 async def get_session_information(
     session_handle: str, user_context: Union[None, Dict[str, Any]] = None
 ) -> Union[SessionInformationResult, None]:
@@ -12,7 +12,17 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from typing import Any, Callable, Dict, Optional, TypeVar, Union, Generic, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from supertokens_python.types import MaybeAwaitable
 from supertokens_python.utils import get_timestamp_ms
@@ -45,6 +55,12 @@ class SCVMixin(SessionClaimValidator, Generic[_T]):
         self.claim: SessionClaim[PrimitiveList] = claim  # TODO:PrimitiveArrayClaim
         self.val = val
         self.max_age_in_sec = max_age_in_sec
+        # Normalised once here so that validation is a single set operation
+        # irrespective of whether self.val is Primitive or PrimitiveList
+        vals: List[JSONPrimitive] = (
+            val if isinstance(val, list) else [val]
+        )  # pyright: reportGeneralTypeIssues=false
+        self.expected_vals: FrozenSet[JSONPrimitive] = frozenset(vals)
 
     def should_refetch(
         self,
@@ -101,51 +117,24 @@ class SCVMixin(SessionClaimValidator, Generic[_T]):
                 },
             )
 
-        # Doing this to ensure same code in the upcoming steps irrespective of
-        # whether self.val is Primitive or PrimitiveList
-        vals: List[JSONPrimitive] = (
-            val if isinstance(val, list) else [val]
-        )  # pyright: reportGeneralTypeIssues=false
-
-        claim_val_set = set(claim_val)
-        if is_include and not is_include_any:
-            for v in vals:
-                if v not in claim_val_set:
-                    return ClaimValidationResult(
-                        is_valid=False,
-                        reason={
-                            "message": "wrong value",
-                            expected_key: val,
-                            # other SDKs return the item itself
-                            "actualValue": claim_val,
-                        },
-                    )
+        claim_val_set: FrozenSet[JSONPrimitive] = frozenset(claim_val)
+        if is_include_any:
+            is_valid = not self.expected_vals.isdisjoint(claim_val_set)
+        elif is_include:
+            is_valid = self.expected_vals.issubset(claim_val_set)
         else:
-            for v in vals:
-                if v in claim_val_set:
-                    if is_include_any:
-                        return ClaimValidationResult(is_valid=True)
-
-                    return ClaimValidationResult(
-                        is_valid=False,
-                        reason={
-                            "message": "wrong value",
-                            expected_key: val,
-                            # other SDKs return the item itself
-                            "actualValue": claim_val,
-                        },
-                    )
-
-            if is_include_any:
-                return ClaimValidationResult(
-                    is_valid=False,
-                    reason={
-                        "message": "wrong value",
-                        expected_key: val,
-                        # other SDKs return the item itself
-                        "actualValue": claim_val,
-                    },
-                )
+            is_valid = self.expected_vals.isdisjoint(claim_val_set)
+
+        if not is_valid:
+            return ClaimValidationResult(
+                is_valid=False,
+                reason={
+                    "message": "wrong value",
+                    expected_key: val,
+                    # other SDKs return the item itself
+                    "actualValue": claim_val,
+                },
+            )
 
         return ClaimValidationResult(is_valid=True)
 
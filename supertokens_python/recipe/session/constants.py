@@ -30,6 +30,8 @@ AUTHORIZATION_HEADER_KEY = "authorization"
 ACCESS_TOKEN_HEADER_KEY = "st-access-token"
 REFRESH_TOKEN_HEADER_KEY = "st-refresh-token"
 ACCESS_CONTROL_EXPOSE_HEADERS = "Access-Control-Expose-Headers"
+CLAIM_REFETCH_CONCURRENCY_LIMIT = 5
+COOKIE_SAME_SITE_CACHE_SIZE = 1000
 
 available_token_transfer_methods: List[TokenTransferMethod] = ["cookie", "header"]
 
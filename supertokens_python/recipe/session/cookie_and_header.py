@@ -13,8 +13,11 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
-from urllib.parse import quote, unquote
+import re
+from email.utils import formatdate
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+from urllib.parse import quote
 
 from typing_extensions import Literal
 
@@ -67,7 +70,7 @@ def build_front_token(
 
 
 def _set_front_token_in_headers(
-    response: BaseResponse,
+    response: ResponsePlan,
     front_token: str,
 ):
     set_header(response, FRONT_TOKEN_HEADER_SET_KEY, front_token, False)
@@ -85,7 +88,7 @@ def get_cors_allowed_headers():
     ]
 
 
-def set_header(response: BaseResponse, key: str, value: str, allow_duplicate: bool):
+def set_header(response: ResponsePlan, key: str, value: str, allow_duplicate: bool):
     if allow_duplicate:
         old_value = response.get_header(key)
         if old_value is None:
@@ -96,20 +99,72 @@ def set_header(response: BaseResponse, key: str, value: str, allow_duplicate: bo
         response.set_header(key, value)
 
 
-def remove_header(response: BaseResponse, key: str):
+def remove_header(response: ResponsePlan, key: str):
     if response.get_header(key) is not None:
         response.remove_header(key)
 
 
-def get_cookie(request: BaseRequest, key: str):
-    cookie_val = request.get_cookie(key)
-    if cookie_val is None:
+def get_cookie(request: BaseRequest, key: str) -> Optional[str]:
+    cookie_values = request.get_cookies_allow_duplicates().get(key)
+    if cookie_values is None:
         return None
-    return unquote(cookie_val)
+    return cookie_values[-1]
+
+
+# Cookie values made only of these characters are not quoted by SimpleCookie
+_UNQUOTED_COOKIE_VALUE = re.compile(r"[\w!#$%&'*+\-.^`|~:]+", re.ASCII)
+
+
+def _quote_cookie_value(value: str) -> str:
+    # Quotes the url encoded value the way SimpleCookie does. Url encoded values
+    # have no quotes or backslashes, so nothing needs escaping inside the quotes.
+    value = quote(value, encoding="utf-8")
+    if _UNQUOTED_COOKIE_VALUE.fullmatch(value) is not None:
+        return value
+    return '"' + value + '"'
+
+
+@lru_cache(maxsize=128)
+def _get_set_cookie_attributes(
+    path: str, domain: Optional[str], secure: bool, same_site: str
+) -> Tuple[str, str]:
+    # Returns the attributes that go before and after the expires attribute.
+    # The order matches the one produced by http.cookies.SimpleCookie, so the
+    # header is identical to what the frameworks would have generated.
+    before_expires = "" if domain is None else "; Domain=" + domain
+    after_expires = "; HttpOnly; Path=" + path + "; SameSite=" + same_site
+    if secure:
+        after_expires += "; Secure"
+    return before_expires, after_expires
+
+
+def build_set_cookie_header(
+    key: str,
+    value: str,
+    expires: int,
+    path: str,
+    domain: Optional[str],
+    secure: bool,
+    same_site: str,
+) -> str:
+    before_expires, after_expires = _get_set_cookie_attributes(
+        path, domain, secure, same_site
+    )
+    return "".join(
+        (
+            key,
+            "=",
+            _quote_cookie_value(value),
+            before_expires,
+            "; expires=",
+            formatdate(expires / 1000, usegmt=True),
+            after_expires,
+        )
+    )
 
 
 def _set_cookie(
-    response: BaseResponse,
+    response: ResponsePlan,
     config: SessionConfig,
     key: str,
     value: str,
@@ -126,19 +181,125 @@ def _set_cookie(
         path = config.refresh_token_path.get_as_string_dangerous()
     elif path_type == "access_token_path":
         path = "/"
-    http_only = True
     response.set_cookie(
         key=key,
-        value=quote(value, encoding="utf-8"),
+        value=value,
         expires=expires,
         path=path,
         domain=domain,
         secure=secure,
-        httponly=http_only,
-        samesite=same_site,
+        same_site=same_site,
     )
 
 
+class ResponsePlan:
+    """
+    Records the session cookies and headers that response mutators write, so
+    that they can be applied to the actual response in one go. If the same
+    cookie (name, path and domain) or header is written more than once, only the
+    last write is applied.
+    """
+
+    def __init__(self, response: BaseResponse):
+        self.response = response
+        self.cookies: Dict[Tuple[str, str, Optional[str]], Dict[str, Any]] = {}
+        # A None value means that the header should be removed
+        self.headers: Dict[str, Tuple[str, Optional[str]]] = {}
+
+    def set_cookie(
+        self,
+        key: str,
+        value: str,
+        expires: int,
+        path: str,
+        domain: Optional[str],
+        secure: bool,
+        same_site: str,
+    ):
+        # Session cookies are always HttpOnly
+        self.cookies[(key, path, domain)] = {
+            "key": key,
+            "value": value,
+            "expires": expires,
+            "path": path,
+            "domain": domain,
+            "secure": secure,
+            "same_site": same_site,
+        }
+
+    def set_header(self, key: str, value: str):
+        self.headers[key.lower()] = (key, value)
+
+    def get_header(self, key: str) -> Optional[str]:
+        planned = self.headers.get(key.lower())
+        if planned is not None:
+            return planned[1]
+        return self.response.get_header(key)
+
+    def remove_header(self, key: str):
+        self.headers[key.lower()] = (key, None)
+
+    def apply(self):
+        for cookie in self.cookies.values():
+            if self.response.supports_set_cookie_header:
+                self.response.add_set_cookie_header(build_set_cookie_header(**cookie))
+            else:
+                self.response.set_cookie(
+                    key=cookie["key"],
+                    value=quote(cookie["value"], encoding="utf-8"),
+                    expires=cookie["expires"],
+                    path=cookie["path"],
+                    domain=cookie["domain"],
+                    secure=cookie["secure"],
+                    httponly=True,
+                    samesite=cookie["same_site"],
+                )
+
+        for key, value in self.headers.values():
+            if value is not None:
+                self.response.set_header(key, value)
+            elif self.response.get_header(key) is not None:
+                self.response.remove_header(key)
+
+        self.cookies = {}
+        self.headers = {}
+
+
+class ResponsePlanMutator:
+    """
+    A response mutator of the session recipe. Its changes are written to a
+    `ResponsePlan`, so that `apply_response_mutators` can collapse them. It can
+    still be called with a `BaseResponse`, like any other `ResponseMutator`.
+    """
+
+    def __init__(self, write: Callable[[ResponsePlan, Dict[str, Any]], None]):
+        self.write = write
+
+    def __call__(self, response: BaseResponse, user_context: Dict[str, Any]):
+        plan = ResponsePlan(response)
+        self.write(plan, user_context)
+        plan.apply()
+
+
+def apply_response_mutators(
+    mutators: List[ResponseMutator],
+    response: BaseResponse,
+    user_context: Dict[str, Any],
+):
+    if len(mutators) == 0:
+        return
+    plan = ResponsePlan(response)
+    for mutator in mutators:
+        if isinstance(mutator, ResponsePlanMutator):
+            mutator.write(plan, user_context)
+        else:
+            # Other mutators change the response directly, so the changes
+            # recorded so far are applied first to keep them in order
+            plan.apply()
+            mutator(response, user_context)
+    plan.apply()
+
+
 def set_cookie_response_mutator(
     config: SessionConfig,
     key: str,
@@ -150,7 +311,7 @@ def set_cookie_response_mutator(
 ):
     domain = domain if domain is not None else config.cookie_domain
 
-    def mutator(response: BaseResponse, user_context: Dict[str, Any]):
+    def mutator(response: ResponsePlan, user_context: Dict[str, Any]):
         return _set_cookie(
             response,
             config,
@@ -163,22 +324,22 @@ def set_cookie_response_mutator(
             user_context,
         )
 
-    return mutator
+    return ResponsePlanMutator(mutator)
 
 
-def _attach_anti_csrf_header(response: BaseResponse, value: str):
+def _attach_anti_csrf_header(response: ResponsePlan, value: str):
     set_header(response, ANTI_CSRF_HEADER_KEY, value, False)
     set_header(response, ACCESS_CONTROL_EXPOSE_HEADERS, ANTI_CSRF_HEADER_KEY, True)
 
 
 def anti_csrf_response_mutator(value: str):
     def mutator(
-        response: BaseResponse,
+        response: ResponsePlan,
         _: Dict[str, Any],
     ):
         return _attach_anti_csrf_header(response, value)
 
-    return mutator
+    return ResponsePlanMutator(mutator)
 
 
 def get_anti_csrf_header(request: BaseRequest):
@@ -201,8 +362,10 @@ def clear_session_from_all_token_transfer_methods(
     # In this case: the SDK has attached cookies to the response, but none was sent with the request
     # We can't know which to clear since we can't reliably query or remove the set-cookie header added to the response (causes issues in some frameworks, i.e.: hapi)
     # The safe solution in this case is to overwrite all the response cookies/headers with an empty value, which is what we are doing here.
+    plan = ResponsePlan(response)
     for transfer_method in available_token_transfer_methods:
-        _clear_session(response, recipe.config, transfer_method, request, user_context)
+        _clear_session(plan, recipe.config, transfer_method, request, user_context)
+    plan.apply()
 
 
 def clear_session_mutator(
@@ -211,16 +374,16 @@ def clear_session_mutator(
     request: BaseRequest,
 ):
     def mutator(
-        response: BaseResponse,
+        response: ResponsePlan,
         user_context: Dict[str, Any],
     ):
         return _clear_session(response, config, transfer_method, request, user_context)
 
-    return mutator
+    return ResponsePlanMutator(mutator)
 
 
 def _clear_session(
-    response: BaseResponse,
+    response: ResponsePlan,
     config: SessionConfig,
     transfer_method: TokenTransferMethod,
     request: BaseRequest,
@@ -248,12 +411,12 @@ def clear_session_response_mutator(
     request: BaseRequest,
 ):
     def mutator(
-        response: BaseResponse,
+        response: ResponsePlan,
         user_context: Dict[str, Any],
     ):
         return _clear_session(response, config, transfer_method, request, user_context)
 
-    return mutator
+    return ResponsePlanMutator(mutator)
 
 
 def get_cookie_name_from_token_type(token_type: TokenType):
@@ -278,7 +441,8 @@ def get_token(
     transfer_method: TokenTransferMethod,
 ) -> Optional[str]:
     if transfer_method == "cookie":
-        # Note: Don't use request.get_cookie() as it won't apply unquote() func
+        # Note: Don't use request.get_cookie() as it won't apply unquote() func,
+        # and it parses the cookie header again on every call in some frameworks
         return get_cookie(request, get_cookie_name_from_token_type(token_type))
     if transfer_method == "header":
         value = request.get_header(AUTHORIZATION_HEADER_KEY)
@@ -291,7 +455,7 @@ def get_token(
 
 
 def _set_token(
-    response: BaseResponse,
+    response: ResponsePlan,
     config: SessionConfig,
     token_type: TokenType,
     value: str,
@@ -330,7 +494,7 @@ def token_response_mutator(
     request: BaseRequest,
 ):
     def mutator(
-        response: BaseResponse,
+        response: ResponsePlan,
         user_context: Dict[str, Any],
     ):
         _set_token(
@@ -344,10 +508,10 @@ def token_response_mutator(
             user_context,
         )
 
-    return mutator
+    return ResponsePlanMutator(mutator)
 
 
-def set_token_in_header(response: BaseResponse, name: str, value: str):
+def set_token_in_header(response: ResponsePlan, name: str, value: str):
     set_header(response, name, value, allow_duplicate=False)
     set_header(response, ACCESS_CONTROL_EXPOSE_HEADERS, name, allow_duplicate=True)
 
@@ -360,7 +524,7 @@ def access_token_mutator(
     request: BaseRequest,
 ):
     def mutator(
-        response: BaseResponse,
+        response: ResponsePlan,
         user_context: Dict[str, Any],
     ):
         _set_access_token_in_response(
@@ -373,11 +537,11 @@ def access_token_mutator(
             user_context,
         )
 
-    return mutator
+    return ResponsePlanMutator(mutator)
 
 
 def _set_access_token_in_response(
-    res: BaseResponse,
+    res: ResponsePlan,
     access_token: str,
     front_token: str,
     config: SessionConfig,
@@ -484,27 +648,6 @@ def clear_session_cookies_from_older_cookie_domain(
 def has_multiple_cookies_for_token_type(
     request: BaseRequest, token_type: TokenType
 ) -> bool:
-    cookie_string = request.get_header("cookie")
-    if cookie_string is None:
-        return False
-
-    cookies = _parse_cookie_string_from_request_header_allow_duplicates(cookie_string)
     cookie_name = get_cookie_name_from_token_type(token_type)
-    return cookie_name in cookies and len(cookies[cookie_name]) > 1
-
-
-def _parse_cookie_string_from_request_header_allow_duplicates(
-    cookie_string: str,
-) -> Dict[str, List[str]]:
-    cookies: Dict[str, List[str]] = {}
-    cookie_pairs = cookie_string.split(";")
-    for cookie_pair in cookie_pairs:
-        name_value = cookie_pair.split("=")
-        if len(name_value) != 2:
-            continue
-        name, value = unquote(name_value[0].strip()), unquote(name_value[1].strip())
-        if name in cookies:
-            cookies[name].append(value)
-        else:
-            cookies[name] = [value]
-    return cookies
+    cookie_values = request.get_cookies_allow_duplicates().get(cookie_name)
+    return cookie_values is not None and len(cookie_values) > 1
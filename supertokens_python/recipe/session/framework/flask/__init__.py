@@ -15,7 +15,7 @@ from functools import wraps
 from typing import Any, Callable, Dict, TypeVar, Union, cast, List, Optional
 
 from supertokens_python import Supertokens
-from supertokens_python.async_to_sync_wrapper import sync
+from supertokens_python.async_to_sync_wrapper import run_in_background_loop
 from supertokens_python.framework.flask.flask_request import FlaskRequest
 from supertokens_python.framework.flask.flask_response import FlaskResponse
 from supertokens_python.recipe.session import SessionRecipe, SessionContainer
@@ -55,7 +55,7 @@ def verify_session(
             recipe = SessionRecipe.get_instance()
 
             try:
-                session = sync(
+                session = run_in_background_loop(
                     recipe.verify_session(
                         base_req,
                         anti_csrf_check,
@@ -76,7 +76,7 @@ def verify_session(
                 return make_response(response) if response is not None else None
             except SuperTokensError as e:
                 response = FlaskResponse(make_response())
-                result = sync(
+                result = run_in_background_loop(
                     Supertokens.get_instance().handle_supertokens_error(
                         base_req, e, response, user_context
                     )
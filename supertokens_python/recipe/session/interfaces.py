@@ -89,6 +89,18 @@ class SessionInformationResult:
         self.tenant_id = tenant_id
 
 
+class UserSessionHandle:
+    def __init__(
+        self,
+        user_id: str,
+        session_handle: str,
+        session_information: Optional[SessionInformationResult] = None,
+    ):
+        self.user_id = user_id
+        self.session_handle = session_handle
+        self.session_information = session_information
+
+
 class ReqResInfo:
     def __init__(
         self,
@@ -127,6 +139,41 @@ class ClaimsValidationResult:
         self.access_token_payload_update = access_token_payload_update
 
 
+class CreateNewSessionInput:
+    def __init__(
+        self,
+        tenant_id: str,
+        user_id: str,
+        access_token_payload: Union[Dict[str, Any], None] = None,
+        session_data_in_database: Union[Dict[str, Any], None] = None,
+        disable_anti_csrf: bool = False,
+    ):
+        self.tenant_id = tenant_id
+        self.user_id = user_id
+        self.access_token_payload = access_token_payload
+        self.session_data_in_database = session_data_in_database
+        self.disable_anti_csrf = disable_anti_csrf
+
+
+class CreateNewSessionsBulkResult:
+    def __init__(
+        self,
+        results: List[Union[SessionContainer, Exception]],
+        time_taken_in_ms: int,
+    ):
+        # Has one item per input, in the same order as the inputs. An item is the
+        # exception raised while creating that session if it couldn't be created.
+        self.results = results
+        self.time_taken_in_ms = time_taken_in_ms
+        self.success_count = len([r for r in results if not isinstance(r, Exception)])
+        self.error_count = len(results) - self.success_count
+        self.sessions_per_second = (
+            self.success_count * 1000 / time_taken_in_ms
+            if time_taken_in_ms > 0
+            else float(self.success_count)
+        )
+
+
 class GetSessionTokensDangerouslyDict(TypedDict):
     accessToken: str
     accessAndFrontTokenUpdated: bool
@@ -12,7 +12,6 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import requests
 from os import environ
 from typing import List, Optional
 from typing_extensions import TypedDict
@@ -112,6 +111,10 @@ def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[Py
 
     last_error: Exception = Exception("No valid JWKS found")
 
+    # requests is only needed when the keys are not cached, so it's not imported
+    # with the SDK
+    import requests
+
     with RWLockContext(mutex, read=False):
         # check again if the keys are in cache
         # because another thread might have fetched the keys while this one was waiting for the lock
@@ -61,7 +61,10 @@ from .utils import (
     TokenTransferMethod,
     validate_and_normalise_user_input,
 )
-from .cookie_and_header import clear_session_from_all_token_transfer_methods
+from .cookie_and_header import (
+    apply_response_mutators,
+    clear_session_from_all_token_transfer_methods,
+)
 
 
 class SessionRecipe(RecipeModule):
@@ -237,12 +240,8 @@ class SessionRecipe(RecipeModule):
         response: BaseResponse,
         user_context: Dict[str, Any],
     ) -> BaseResponse:
-        if (
-            isinstance(err, SuperTokensSessionError)
-            and err.response_mutators is not None
-        ):
-            for mutator in err.response_mutators:
-                mutator(response, user_context)
+        if isinstance(err, SuperTokensSessionError):
+            apply_response_mutators(err.response_mutators, response, user_context)
 
         if isinstance(err, UnauthorisedError):
             log_debug_message("errorHandler: returning UNAUTHORISED")
@@ -18,11 +18,12 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from supertokens_python.logger import log_debug_message
 from supertokens_python.normalised_url_path import NormalisedURLPath
-from supertokens_python.utils import resolve
+from supertokens_python.utils import gather_with_concurrency_limit, resolve
 
 from ...types import MaybeAwaitable
 from . import session_functions
 from .access_token import validate_access_token_structure
+from .constants import CLAIM_REFETCH_CONCURRENCY_LIMIT
 from .cookie_and_header import build_front_token
 from .exceptions import UnauthorisedError
 from .interfaces import (
@@ -113,34 +114,46 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
     ) -> ClaimsValidationResult:
         access_token_payload_update = None
         original_access_token_payload = json.dumps(access_token_payload)
+        tenant_id = access_token_payload.get("tId", DEFAULT_TENANT_ID)
 
+        # should_refetch is evaluated against the original payload for every
+        # validator, and each claim is fetched at most once even if multiple
+        # validators refer to it. The fetches are independent of each other,
+        # so we run them concurrently and merge the results in validator order.
+        claims_to_refetch: List[SessionClaim[Any]] = []
         for validator in claim_validators:
             log_debug_message(
                 "update_claims_in_payload_if_needed checking should_refetch for %s",
                 validator.id,
             )
-            if validator.claim is not None and validator.should_refetch(
-                access_token_payload, user_context
+            if (
+                validator.claim is not None
+                and all(c.key != validator.claim.key for c in claims_to_refetch)
+                and validator.should_refetch(access_token_payload, user_context)
             ):
                 log_debug_message(
                     "update_claims_in_payload_if_needed refetching for %s", validator.id
                 )
-                value = await resolve(
-                    validator.claim.fetch_value(
-                        user_id,
-                        access_token_payload.get("tId", DEFAULT_TENANT_ID),
-                        user_context,
-                    )
-                )
-                log_debug_message(
-                    "update_claims_in_payload_if_needed %s refetch result %s",
-                    validator.id,
-                    json.dumps(value),
+                claims_to_refetch.append(validator.claim)
+
+        values = await gather_with_concurrency_limit(
+            [
+                resolve(claim.fetch_value(user_id, tenant_id, user_context))
+                for claim in claims_to_refetch
+            ],
+            CLAIM_REFETCH_CONCURRENCY_LIMIT,
+        )
+
+        for claim, value in zip(claims_to_refetch, values):
+            log_debug_message(
+                "update_claims_in_payload_if_needed %s refetch result %s",
+                claim.key,
+                json.dumps(value),
+            )
+            if value is not None:
+                access_token_payload = claim.add_to_payload_(
+                    access_token_payload, value, user_context
                 )
-                if value is not None:
-                    access_token_payload = validator.claim.add_to_payload_(
-                        access_token_payload, value, user_context
-                    )
 
         if json.dumps(access_token_payload) != original_access_token_payload:
             access_token_payload_update = access_token_payload
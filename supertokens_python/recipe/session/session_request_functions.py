@@ -24,6 +24,7 @@ from supertokens_python.recipe.session.cookie_and_header import (
     clear_session_cookies_from_older_cookie_domain,
     clear_session_mutator,
     get_anti_csrf_header,
+    get_cookie,
     get_token,
     has_multiple_cookies_for_token_type,
     set_cookie_response_mutator,
@@ -100,7 +101,7 @@ async def get_session_from_request(
     user_context = set_request_in_user_context_if_not_defined(user_context, request)
 
     # This token isn't handled by getToken to limit the scope of this legacy/migration code
-    if request.get_cookie(LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME) is not None:
+    if get_cookie(request, LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME) is not None:
         log_debug_message(
             "getSession: Throwing TRY_REFRESH_TOKEN because the request is using a legacy session"
         )
@@ -400,7 +401,7 @@ async def refresh_session_in_request(
         refresh_token = refresh_tokens["cookie"]
     else:
         # This token isn't handled by getToken/setToken to limit the scope of this legacy/migration code
-        if request.get_cookie(LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME) is not None:
+        if get_cookie(request, LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME) is not None:
             log_debug_message(
                 "refreshSession: cleared legacy id refresh token because refresh token was not found"
             )
@@ -475,7 +476,7 @@ async def refresh_session_in_request(
         ):
             # We clear the LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME here because we want to limit the scope of
             # this legacy/migration code so the token clearing functions in the error handlers do not.
-            if request.get_cookie(LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME) is not None:
+            if get_cookie(request, LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME) is not None:
                 log_debug_message(
                     "refreshSession: cleared legacy id refresh token because refresh token was not found"
                 )
@@ -514,7 +515,7 @@ async def refresh_session_in_request(
     log_debug_message("refreshSession: Success!")
 
     # This token isn't handled by getToken/setToken to limit the scope of this legacy/migration code
-    if request.get_cookie(LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME) is not None:
+    if get_cookie(request, LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME) is not None:
         log_debug_message(
             "refreshSession: cleared legacy id refresh token after successful refresh"
         )
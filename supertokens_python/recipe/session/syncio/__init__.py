@@ -12,7 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
-from typing import Any, Dict, List, Union, Callable, Optional, TypeVar
+from typing import Any, Dict, Iterable, List, Union, Callable, Optional, TypeVar
 
 from supertokens_python.async_to_sync_wrapper import sync
 from supertokens_python.recipe.openid.interfaces import (
@@ -26,6 +26,8 @@ from ...jwt.interfaces import (
     GetJWKSResult,
 )
 from ..interfaces import (
+    CreateNewSessionInput,
+    CreateNewSessionsBulkResult,
     SessionContainer,
     SessionInformationResult,
     SessionClaimValidator,
@@ -85,6 +87,18 @@ def create_new_session_without_request_response(
     )
 
 
+def create_new_sessions_bulk(
+    inputs: List[CreateNewSessionInput],
+    max_concurrency: int = 10,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> CreateNewSessionsBulkResult:
+    from supertokens_python.recipe.session.asyncio import (
+        create_new_sessions_bulk as async_create_new_sessions_bulk,
+    )
+
+    return sync(async_create_new_sessions_bulk(inputs, max_concurrency, user_context))
+
+
 def get_session(
     request: Any,
     session_required: bool = True,
@@ -221,6 +235,20 @@ def revoke_multiple_sessions(
     return sync(async_revoke_multiple_sessions(session_handles, user_context))
 
 
+def revoke_sessions_in_bulk(
+    session_handles: Iterable[str],
+    batch_size: int = 100,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> int:
+    from supertokens_python.recipe.session.asyncio import (
+        revoke_sessions_in_bulk as async_revoke_sessions_in_bulk,
+    )
+
+    return sync(
+        async_revoke_sessions_in_bulk(session_handles, batch_size, user_context)
+    )
+
+
 def get_session_information(
     session_handle: str, user_context: Union[None, Dict[str, Any]] = None
 ) -> Union[SessionInformationResult, None]:
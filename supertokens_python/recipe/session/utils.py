@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
@@ -23,6 +24,7 @@ from supertokens_python.exceptions import raise_general_exception
 from supertokens_python.framework import BaseResponse
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.utils import (
+    get_top_level_domain_for_same_site_resolution,
     is_an_ip_address,
     resolve,
     send_200_response,
@@ -31,7 +33,11 @@ from supertokens_python.utils import (
 )
 
 from ...types import MaybeAwaitable
-from .constants import AUTH_MODE_HEADER_KEY, SESSION_REFRESH
+from .constants import (
+    AUTH_MODE_HEADER_KEY,
+    COOKIE_SAME_SITE_CACHE_SIZE,
+    SESSION_REFRESH,
+)
 from .exceptions import ClaimValidationError
 
 if TYPE_CHECKING:
@@ -428,7 +434,6 @@ def validate_and_normalise_user_input(
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
     jwks_refresh_interval_sec: Union[int, None] = None,
 ):
-    _ = cookie_same_site  # we have this otherwise pylint complains that cookie_same_site is unused, but it is being used in the get_cookie_same_site function.
     if anti_csrf not in {"VIA_TOKEN", "VIA_CUSTOM_HEADER", "NONE", None}:
         raise ValueError(
             "anti_csrf must be one of VIA_TOKEN, VIA_CUSTOM_HEADER, NONE or None"
@@ -485,36 +490,38 @@ def validate_and_normalise_user_input(
     if expose_access_token_to_frontend_in_cookie_based_auth is None:
         expose_access_token_to_frontend_in_cookie_based_auth = False
 
-    if cookie_same_site is not None:
-        # this is just so that we check that the user has provided the right
-        # values, since normalise_same_site throws an error if the user
-        # as provided an empty string.
-        _ = normalise_same_site(cookie_same_site)
+    # normalise_same_site also checks that the user has provided a valid value
+    normalised_cookie_same_site = (
+        normalise_same_site(cookie_same_site) if cookie_same_site is not None else None
+    )
 
-    def get_cookie_same_site(
-        request: Optional[BaseRequest], user_context: Dict[str, Any]
+    @lru_cache(maxsize=COOKIE_SAME_SITE_CACHE_SIZE)
+    def get_cookie_same_site_for_origin(
+        origin: str,
     ) -> Literal["lax", "strict", "none"]:
-        nonlocal cookie_same_site
-        if cookie_same_site is not None:
-            return normalise_same_site(cookie_same_site)
         top_level_api_domain = app_info.top_level_api_domain
-        top_level_website_domain = app_info.get_top_level_website_domain(
-            request, user_context
-        )
+        top_level_website_domain = get_top_level_domain_for_same_site_resolution(origin)
 
         api_domain_scheme = get_url_scheme(
             app_info.api_domain.get_as_string_dangerous()
         )
-        website_domain_scheme = get_url_scheme(
-            app_info.get_origin(request, user_context).get_as_string_dangerous()
-        )
+        website_domain_scheme = get_url_scheme(origin)
         if (top_level_api_domain != top_level_website_domain) or (
             api_domain_scheme != website_domain_scheme
         ):
-            cookie_same_site = "none"
-        else:
-            cookie_same_site = "lax"
-        return cookie_same_site
+            return "none"
+        return "lax"
+
+    def get_cookie_same_site(
+        request: Optional[BaseRequest], user_context: Dict[str, Any]
+    ) -> Literal["lax", "strict", "none"]:
+        if normalised_cookie_same_site is not None:
+            return normalised_cookie_same_site
+        # The origin can differ per request (multiple website domains), so the
+        # result is cached per origin instead of being computed only once.
+        return get_cookie_same_site_for_origin(
+            app_info.get_origin(request, user_context).get_as_string_dangerous()
+        )
 
     def anti_csrf_function(
         request: Optional[BaseRequest], user_context: Dict[str, Any]
@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from . import exceptions as ex
 from . import utils, provider
+from .providers import utils as providers_utils
 from .recipe import ThirdPartyRecipe
 
 InputOverrideConfig = utils.InputOverrideConfig
@@ -26,6 +27,7 @@ SignInAndUpFeature = utils.SignInAndUpFeature
 ProviderInput = provider.ProviderInput
 ProviderConfig = provider.ProviderConfig
 ProviderClientConfig = provider.ProviderClientConfig
+HTTPClientConfig = providers_utils.HTTPClientConfig
 exceptions = ex
 
 if TYPE_CHECKING:
@@ -37,7 +39,11 @@ if TYPE_CHECKING:
 def init(
     sign_in_and_up_feature: Optional[SignInAndUpFeature] = None,
     override: Union[InputOverrideConfig, None] = None,
+    http_client: Optional[HTTPClientConfig] = None,
+    prewarm_oidc_discovery: bool = False,
 ) -> Callable[[AppInfo], RecipeModule]:
     if sign_in_and_up_feature is None:
         sign_in_and_up_feature = SignInAndUpFeature()
-    return ThirdPartyRecipe.init(sign_in_and_up_feature, override)
+    return ThirdPartyRecipe.init(
+        sign_in_and_up_feature, override, http_client, prewarm_oidc_discovery
+    )
@@ -13,15 +13,36 @@
 # under the License.
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import sha256
 from re import sub
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from jwt import encode  # type: ignore
+from jwt.algorithms import ECAlgorithm
 from time import time
 
 from .custom import GenericProvider, NewProvider
 from ..provider import Provider, ProviderConfigForClient, ProviderInput
 from .utils import get_actual_client_id_from_development_client_id
 
+CLIENT_SECRET_VALIDITY_IN_SECS = 86400 * 180  # 6 months
+# A new client secret is created once the cached one has less than this left
+CLIENT_SECRET_REFRESH_MARGIN_IN_SECS = 86400
+CLIENT_SECRET_CACHE_SIZE = 64
+
+# (team id, key id, client id, private key sha256) -> (client secret, expiry)
+_client_secrets: OrderedDict[
+    Tuple[str, str, str, str], Tuple[str, float]
+] = OrderedDict()
+
+
+@lru_cache(maxsize=16)
+def _load_private_key(private_key: str) -> Any:
+    return ECAlgorithm(ECAlgorithm.SHA256).prepare_key(  # type: ignore
+        sub(r"\\n", "\n", private_key)
+    )
+
 
 class AppleImpl(GenericProvider):
     async def get_config_for_client_type(
@@ -50,20 +71,51 @@ class AppleImpl(GenericProvider):
                 "Please ensure that keyId, teamId and privateKey are provided in the additionalConfig"
             )
 
+        team_id: str = config.additional_config["teamId"]
+        key_id: str = config.additional_config["keyId"]
+        private_key: str = config.additional_config["privateKey"]
+        client_id = get_actual_client_id_from_development_client_id(config.client_id)
+
+        # The secret is valid for months, so it's reused instead of signing a
+        # new one on every sign in
+        cache_key = (
+            team_id,
+            key_id,
+            client_id,
+            sha256(private_key.encode("utf-8")).hexdigest(),
+        )
+        now = time()
+        cached = _client_secrets.get(cache_key)
+        if (
+            cached is not None
+            and cached[1] - now > CLIENT_SECRET_REFRESH_MARGIN_IN_SECS
+        ):
+            return cached[0]
+
+        expiry = now + CLIENT_SECRET_VALIDITY_IN_SECS
         payload: Dict[str, Any] = {
-            "iss": config.additional_config.get("teamId"),
-            "iat": time(),
-            "exp": time() + (86400 * 180),  # 6 months
+            "iss": team_id,
+            "iat": now,
+            "exp": expiry,
             "aud": "https://appleid.apple.com",
-            "sub": get_actual_client_id_from_development_client_id(config.client_id),
+            "sub": client_id,
         }
-        headers = {"kid": config.additional_config.get("keyId")}
-        return encode(  # type: ignore
+        headers = {"kid": key_id}
+        client_secret: str = encode(  # type: ignore
             payload,
-            sub(r"\\n", "\n", config.additional_config.get("privateKey")),  # type: ignore
+            _load_private_key(private_key),
             algorithm="ES256",
             headers=headers,
-        )  # type: ignore
+        )
+
+        # Expired secrets are dropped, and the oldest ones once the cache is full
+        for key in [k for k, (_, exp) in _client_secrets.items() if exp <= now]:
+            del _client_secrets[key]
+        _client_secrets.pop(cache_key, None)
+        _client_secrets[cache_key] = (client_secret, expiry)
+        while len(_client_secrets) > CLIENT_SECRET_CACHE_SIZE:
+            _client_secrets.popitem(last=False)
+        return client_secret
 
 
 def Apple(input: ProviderInput) -> Provider:  # pylint: disable=redefined-builtin
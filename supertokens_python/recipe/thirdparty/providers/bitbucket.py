@@ -21,6 +21,7 @@ from supertokens_python.recipe.thirdparty.provider import (
     ProviderInput,
     Provider,
 )
+from supertokens_python.utils import gather_cancelling_on_error
 from .custom import GenericProvider, NewProvider
 
 from .utils import do_get_request
@@ -52,20 +53,26 @@ class BitbucketImpl(GenericProvider):
 
         raw_user_info_from_provider = RawUserInfoFromProvider({}, {})
 
-        user_info_from_access_token = await do_get_request(
-            "https://api.bitbucket.org/2.0/user",
-            query_params=None,
-            headers=headers,
+        (
+            user_info_from_access_token,
+            user_info_from_email,
+        ) = await gather_cancelling_on_error(
+            [
+                do_get_request(
+                    "https://api.bitbucket.org/2.0/user",
+                    query_params=None,
+                    headers=headers,
+                ),
+                do_get_request(
+                    "https://api.bitbucket.org/2.0/user/emails",
+                    query_params=None,
+                    headers=headers,
+                ),
+            ]
         )
 
         raw_user_info_from_provider.from_user_info_api = user_info_from_access_token
 
-        user_info_from_email = await do_get_request(
-            "https://api.bitbucket.org/2.0/user/emails",
-            query_params=None,
-            headers=headers,
-        )
-
         if raw_user_info_from_provider.from_id_token_payload is None:
             # Actually this should never happen but python type
             # checker is not agreeing so doing this:
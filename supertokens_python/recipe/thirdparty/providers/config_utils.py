@@ -1,5 +1,11 @@
-from typing import List, Dict, Optional, Any
+from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Tuple
+
+from supertokens_python.logger import log_debug_message
 from supertokens_python.normalised_url_domain import NormalisedURLDomain
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from .active_directory import ActiveDirectory
@@ -16,7 +22,7 @@ from .linkedin import Linkedin
 from .twitter import Twitter
 from .okta import Okta
 from .custom import NewProvider
-from .utils import do_get_request
+from .utils import SingleFlight, do_get_request_with_max_age
 
 from ..provider import (
     ProviderConfig,
@@ -27,6 +33,16 @@ from ..provider import (
     UserInfoMap,
 )
 
+from supertokens_python.utils import get_timestamp_ms
+
+if TYPE_CHECKING:
+    from supertokens_python.recipe.multitenancy.interfaces import GetTenantOkResult
+
+OIDC_DISCOVERY_CACHE_SIZE = 100
+DEFAULT_OIDC_DISCOVERY_MAX_AGE_IN_SECS = 60 * 60
+MIN_OIDC_DISCOVERY_MAX_AGE_IN_SECS = 60
+MAX_OIDC_DISCOVERY_MAX_AGE_IN_SECS = 24 * 60 * 60
+
 
 def merge_config(
     config_from_static: ProviderConfig, config_from_core: ProviderConfig
@@ -212,25 +228,142 @@ def create_provider(provider_input: ProviderInput) -> Provider:
     return NewProvider(provider_input)
 
 
-OIDC_INFO_MAP: Dict[str, Any] = {}
+class OIDCDiscoveryCache:
+    """Process level cache of the OIDC discovery info of issuers. Each entry is
+    kept for as long as the Cache-Control header of its response allows,
+    clamped between a minute and a day (an hour if the header doesn't say).
+    Concurrent lookups of an issuer share a single request, and if
+    `refresh_in_background` is set, an entry in the last quarter of its life is
+    refreshed in the background while it's still being served."""
 
+    def __init__(
+        self,
+        max_size: int = OIDC_DISCOVERY_CACHE_SIZE,
+        refresh_in_background: bool = True,
+    ):
+        self.max_size = max_size
+        self.refresh_in_background = refresh_in_background
+        self._lock = Lock()
+        # issuer -> (time fetched in ms, max age in ms, oidc info)
+        self._entries: OrderedDict[str, Tuple[int, int, Dict[str, Any]]] = OrderedDict()
+        self._fetches: SingleFlight[Dict[str, Any]] = SingleFlight()
+
+    async def get(self, issuer: str) -> Dict[str, Any]:
+        entry = self._entries.get(issuer)
+        if entry is not None:
+            fetched_at, max_age, oidc_info = entry
+            age = get_timestamp_ms() - fetched_at
+            if age < max_age:
+                if self.refresh_in_background and age >= max_age * 3 // 4:
+                    self._fetch(issuer)
+                return oidc_info
+
+        # Shielded so that a cancelled caller doesn't cancel the request for
+        # the others waiting on it
+        return await asyncio.shield(self._fetch(issuer))
+
+    async def prewarm(self, issuers: List[str]):
+        results = await asyncio.gather(
+            *[self.get(issuer) for issuer in issuers], return_exceptions=True
+        )
+        for issuer, result in zip(issuers, results):
+            if isinstance(result, BaseException):
+                log_debug_message(
+                    "Could not prewarm OIDC discovery info of %s: %s", issuer, result
+                )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _fetch(self, issuer: str) -> asyncio.Future[Dict[str, Any]]:
+        return self._fetches.run(issuer, lambda: self._do_fetch(issuer))
+
+    async def _do_fetch(self, issuer: str) -> Dict[str, Any]:
+        ndomain = NormalisedURLDomain(issuer)
+        npath = NormalisedURLPath(issuer)
+        openid_config_path = NormalisedURLPath("/.well-known/openid-configuration")
+
+        npath = npath.append(openid_config_path)
+
+        oidc_info, max_age_in_secs = await do_get_request_with_max_age(
+            ndomain.get_as_string_dangerous() + npath.get_as_string_dangerous()
+        )
+
+        if max_age_in_secs is None:
+            max_age_in_secs = DEFAULT_OIDC_DISCOVERY_MAX_AGE_IN_SECS
+        max_age_in_secs = min(
+            max(max_age_in_secs, MIN_OIDC_DISCOVERY_MAX_AGE_IN_SECS),
+            MAX_OIDC_DISCOVERY_MAX_AGE_IN_SECS,
+        )
+
+        with self._lock:
+            self._entries[issuer] = (
+                get_timestamp_ms(),
+                max_age_in_secs * 1000,
+                oidc_info,
+            )
+            self._entries.move_to_end(issuer)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
 
-async def get_oidc_discovery_info(issuer: str):
-    if issuer in OIDC_INFO_MAP:
-        return OIDC_INFO_MAP[issuer]
+        return oidc_info
 
-    ndomain = NormalisedURLDomain(issuer)
-    npath = NormalisedURLPath(issuer)
-    openid_config_path = NormalisedURLPath("/.well-known/openid-configuration")
 
-    npath = npath.append(openid_config_path)
+oidc_discovery_cache = OIDCDiscoveryCache()
 
-    oidc_info = await do_get_request(
-        ndomain.get_as_string_dangerous() + npath.get_as_string_dangerous()
-    )
-    OIDC_INFO_MAP[issuer] = oidc_info
 
-    return oidc_info
+async def get_oidc_discovery_info(issuer: str) -> Dict[str, Any]:
+    return await oidc_discovery_cache.get(issuer)
+
+
+def is_get_config_for_client_type_overridden(provider_input: ProviderInput) -> bool:
+    if provider_input.override is None:
+        return False
+    provider = create_provider(provider_input)
+    provider_without_override = create_provider(ProviderInput(provider_input.config))
+    return getattr(
+        provider.get_config_for_client_type, "__func__", None
+    ) is not getattr(provider_without_override.get_config_for_client_type, "__func__")
+
+
+async def prewarm_oidc_discovery_cache(providers: List[ProviderInput]):
+    """Fetches the OIDC discovery info of the given providers, for each of
+    their clients, so that the first sign ins don't have to. Providers that
+    override `get_config_for_client_type` are skipped, since their config
+    can depend on the user_context. Errors are logged and otherwise ignored."""
+    issuers: List[str] = []
+    for provider_input in providers:
+        try:
+            if is_get_config_for_client_type_overridden(provider_input):
+                continue
+            provider = create_provider(provider_input)
+        except Exception as e:
+            log_debug_message(
+                "Could not prewarm OIDC discovery info of %s: %s",
+                provider_input.config.third_party_id,
+                e,
+            )
+            continue
+        for client in provider_input.config.clients or []:
+            try:
+                config = await provider.get_config_for_client_type(
+                    client.client_type, {}
+                )
+            except Exception as e:
+                log_debug_message(
+                    "Could not prewarm OIDC discovery info of %s: %s",
+                    provider_input.config.third_party_id,
+                    e,
+                )
+                continue
+            if (
+                config.oidc_discovery_endpoint is not None
+                and config.oidc_discovery_endpoint not in issuers
+            ):
+                issuers.append(config.oidc_discovery_endpoint)
+
+    await oidc_discovery_cache.prewarm(issuers)
 
 
 async def discover_oidc_endpoints(
@@ -286,3 +419,35 @@ async def find_and_create_provider_instance(
             return provider_instance
 
     return None
+
+
+class MergedProvidersCache:
+    """Caches, per tenant, the providers merged from the core and static
+    configs. An entry is reused as long as `get_tenant` returns the same tenant
+    config object, which is the case until the multitenancy recipe's tenant
+    config cache fetches the tenant again.
+
+    Provider instances are still created, and their config fetched, on every
+    request, since `get_config_for_client_type` can be overridden to return a
+    config based on the `user_context`."""
+
+    def __init__(self, provider_inputs_from_static: List[ProviderInput]):
+        self.provider_inputs_from_static = provider_inputs_from_static
+        # tenant id -> (tenant config, merged providers)
+        self._merged_providers: Dict[
+            str, Tuple["GetTenantOkResult", List[ProviderInput]]
+        ] = {}
+
+    def get_merged_providers(
+        self, tenant_id: str, tenant_config: "GetTenantOkResult"
+    ) -> List[ProviderInput]:
+        entry = self._merged_providers.get(tenant_id)
+        if entry is not None and entry[0] is tenant_config:
+            return entry[1]
+
+        merged_providers = merge_providers_from_core_and_static(
+            provider_configs_from_core=tenant_config.third_party.providers,
+            provider_inputs_from_static=self.provider_inputs_from_static,
+        )
+        self._merged_providers[tenant_id] = (tenant_config, merged_providers)
+        return merged_providers
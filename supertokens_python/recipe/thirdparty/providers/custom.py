@@ -1,14 +1,18 @@
-from typing import Any, Callable, Dict, List, Optional, Union
-from urllib.parse import parse_qs, urlencode, urlparse
+import asyncio
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import ParseResult, parse_qs, quote_plus, urlencode, urlparse
 
-from httpx import AsyncClient
-
-from jwt import decode  # type: ignore
+from jwt import decode, get_unverified_header  # type: ignore
 from jwt.algorithms import RSAAlgorithm
 import pkce
 
 from supertokens_python.recipe.thirdparty.exceptions import ClientTypeNotFoundError
+from supertokens_python.utils import get_timestamp_ms
 from supertokens_python.recipe.thirdparty.providers.utils import (
+    SingleFlight,
+    do_get_request_with_max_age,
     DEV_OAUTH_AUTHORIZATION_URL,
     DEV_OAUTH_REDIRECT_URL,
     do_get_request,
@@ -152,15 +156,98 @@ def get_supertokens_user_info_result_from_raw_user_info(
     return result
 
 
+JWKS_CACHE_SIZE = 100
+DEFAULT_JWKS_MAX_AGE_IN_SECS = 60 * 60
+MIN_JWKS_MAX_AGE_IN_SECS = 60
+MAX_JWKS_MAX_AGE_IN_SECS = 24 * 60 * 60
+JWKS_REFETCH_COOLDOWN_IN_SECS = 30
+
+
+class _JWKSKeys:
+    def __init__(self):
+        self.all: List[Any] = []
+        self.by_kid: Dict[str, Any] = {}
+
+
+class JWKSCache:
+    """Process level cache of the public keys served by the JWKS endpoints of
+    providers, indexed by kid. Each entry is kept for as long as the
+    Cache-Control header of its response allows, clamped between a minute and
+    a day (an hour if the header doesn't say). If an id token is signed with a
+    kid that isn't cached, the keys are fetched again, at most once every
+    JWKS_REFETCH_COOLDOWN_IN_SECS per endpoint. Concurrent fetches of an
+    endpoint share a single request."""
+
+    def __init__(self, max_size: int = JWKS_CACHE_SIZE):
+        self.max_size = max_size
+        self._lock = Lock()
+        # jwks uri -> (time fetched in ms, max age in ms, keys)
+        self._entries: Dict[str, Tuple[int, int, _JWKSKeys]] = {}
+        self._fetches: SingleFlight[_JWKSKeys] = SingleFlight()
+
+    async def get_public_keys(self, jwks_uri: str, kid: Optional[str]) -> List[Any]:
+        """Returns the key with the given kid, or all keys of the endpoint if
+        it has none with that kid"""
+        keys = await self._get_keys(jwks_uri, kid)
+        if kid is not None and kid in keys.by_kid:
+            return [keys.by_kid[kid]]
+        return keys.all
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    async def _get_keys(self, jwks_uri: str, kid: Optional[str]) -> _JWKSKeys:
+        entry = self._entries.get(jwks_uri)
+        if entry is not None:
+            fetched_at, max_age, keys = entry
+            age = get_timestamp_ms() - fetched_at
+            if age < max_age and (
+                kid is None
+                or kid in keys.by_kid
+                or age < JWKS_REFETCH_COOLDOWN_IN_SECS * 1000
+            ):
+                return keys
+
+        # Shielded so that a cancelled caller doesn't cancel the request for
+        # the others waiting on it
+        return await asyncio.shield(
+            self._fetches.run(jwks_uri, lambda: self._fetch(jwks_uri))
+        )
+
+    async def _fetch(self, jwks_uri: str) -> _JWKSKeys:
+        key_payload, max_age_in_secs = await do_get_request_with_max_age(jwks_uri)
+
+        keys = _JWKSKeys()
+        for key in key_payload["keys"]:
+            public_key = RSAAlgorithm.from_jwk(key)  # type: ignore
+            keys.all.append(public_key)
+            if key.get("kid") is not None:
+                keys.by_kid[key["kid"]] = public_key
+
+        if max_age_in_secs is None:
+            max_age_in_secs = DEFAULT_JWKS_MAX_AGE_IN_SECS
+        max_age_in_secs = min(
+            max(max_age_in_secs, MIN_JWKS_MAX_AGE_IN_SECS), MAX_JWKS_MAX_AGE_IN_SECS
+        )
+
+        with self._lock:
+            self._entries.pop(jwks_uri, None)
+            self._entries[jwks_uri] = (get_timestamp_ms(), max_age_in_secs * 1000, keys)
+            while len(self._entries) > self.max_size:
+                del self._entries[next(iter(self._entries))]
+
+        return keys
+
+
+jwks_cache = JWKSCache()
+
+
 async def verify_id_token_from_jwks_endpoint_and_get_payload(
     id_token: str, jwks_uri: str, audience: str
 ):
-    public_keys: List[RSAAlgorithm] = []
-    async with AsyncClient() as client:
-        response = await client.get(jwks_uri)  # type:ignore
-        key_payload = response.json()
-        for key in key_payload["keys"]:
-            public_keys.append(RSAAlgorithm.from_jwk(key))  # type: ignore
+    kid: Optional[str] = get_unverified_header(id_token).get("kid")  # type: ignore
+    public_keys = await jwks_cache.get_public_keys(jwks_uri, kid)
 
     err = Exception("id token verification failed")
     for key in public_keys:
@@ -187,6 +274,100 @@ def is_using_development_client_id(client_id: str) -> bool:
     return client_id.startswith(DEV_KEY_IDENTIFIER) or client_id in DEV_OAUTH_CLIENT_IDS
 
 
+class _AuthorisationURLParam:
+    # Stands in for a query param value that is only known per request
+    pass
+
+
+_REDIRECT_URI = _AuthorisationURLParam()
+_CODE_CHALLENGE = _AuthorisationURLParam()
+
+
+class _AuthorisationURLTemplate:
+    """An authorisation URL with all of its query params url encoded, except
+    for the redirect URI and PKCE code challenge, which are added by render.
+    The result is the same as url encoding all the params every time."""
+
+    def __init__(self, url_obj: ParseResult, qparams: Dict[str, List[Any]]):
+        # Each part is either an encoded param, or the encoded "key=" of a
+        # param whose value is added by render
+        self.parts: List[Tuple[str, Optional[_AuthorisationURLParam]]] = []
+        for k, v in qparams.items():
+            if len(v) == 1 and isinstance(v[0], _AuthorisationURLParam):
+                self.parts.append((f"{quote_plus(k)}=", v[0]))
+            else:
+                self.parts.append((urlencode({k: v}, doseq=True), None))
+
+        if len(self.parts) == 0:
+            self.prefix, self.suffix = url_obj._replace(query="").geturl(), ""
+        else:
+            self.prefix, self.suffix = url_obj._replace(query="\0").geturl().split("\0")
+
+    def render(self, redirect_uri: str, code_challenge: Optional[str]) -> str:
+        values = {_REDIRECT_URI: redirect_uri, _CODE_CHALLENGE: code_challenge}
+        query = "&".join(
+            part if param is None else part + quote_plus(str(values[param]))
+            for part, param in self.parts
+        )
+        return self.prefix + query + self.suffix
+
+
+def _build_authorisation_url_template(
+    authorization_endpoint: Optional[str],
+    client_id: str,
+    scope: Optional[Tuple[str, ...]],
+    use_pkce: bool,
+    extra_params: Optional[Tuple[Tuple[str, Any], ...]],
+) -> _AuthorisationURLTemplate:
+    query_params: Dict[str, Any] = {
+        "client_id": client_id,
+        "redirect_uri": _REDIRECT_URI,
+        "response_type": "code",
+    }
+
+    if scope is not None:
+        query_params["scope"] = " ".join(scope)
+
+    if use_pkce:
+        query_params["code_challenge"] = _CODE_CHALLENGE
+        query_params["code_challenge_method"] = "S256"
+
+    if extra_params is not None:
+        for k, v in extra_params:
+            if v is None:
+                del query_params[k]
+            else:
+                query_params[k] = v
+
+    if authorization_endpoint is None:
+        raise Exception(
+            "ThirdParty provider's authorizationEndpoint is not configured."
+        )
+
+    url: str = authorization_endpoint
+
+    # Transformation needed for dev keys BEGIN
+    if is_using_oauth_development_client_id(client_id):
+        query_params["client_id"] = get_actual_client_id_from_development_client_id(
+            client_id
+        )
+        query_params["actual_redirect_uri"] = url
+        url = DEV_OAUTH_AUTHORIZATION_URL
+    # Transformation needed for dev keys END
+
+    url_obj = urlparse(url)
+    qparams: Dict[str, List[Any]] = parse_qs(url_obj.query)
+    for k, v in query_params.items():
+        qparams[k] = [v]
+
+    return _AuthorisationURLTemplate(url_obj, qparams)
+
+
+_get_authorisation_url_template = lru_cache(maxsize=256)(
+    _build_authorisation_url_template
+)
+
+
 class GenericProvider(Provider):
     def __init__(self, provider_config: ProviderConfig):
         self.input_config = input_config = self._normalize_input(provider_config)
@@ -293,54 +474,40 @@ class GenericProvider(Provider):
         redirect_uri_on_provider_dashboard: str,
         user_context: Dict[str, Any],
     ) -> AuthorisationRedirect:
-        query_params: Dict[str, str] = {
-            "client_id": self.config.client_id,
-            "redirect_uri": redirect_uri_on_provider_dashboard,
-            "response_type": "code",
-        }
-
-        if self.config.scope is not None:
-            query_params["scope"] = " ".join(self.config.scope)
+        use_pkce = bool(self.config.client_secret is None or self.config.force_pkce)
+        template = self._get_authorisation_url_template(use_pkce)
 
         pkce_code_verifier: Union[str, None] = None
+        code_challenge: Union[str, None] = None
+        if use_pkce:
+            pkce_code_verifier, code_challenge = pkce.generate_pkce_pair(64)
 
-        if self.config.client_secret is None or self.config.force_pkce:
-            code_verifier, code_challenge = pkce.generate_pkce_pair(64)
-            query_params["code_challenge"] = code_challenge
-            query_params["code_challenge_method"] = "S256"
-            pkce_code_verifier = code_verifier
-
-        if self.config.authorization_endpoint_query_params is not None:
-            for k, v in self.config.authorization_endpoint_query_params.items():
-                if v is None:
-                    del query_params[k]
-                else:
-                    query_params[k] = v
-
-        if self.config.authorization_endpoint is None:
-            raise Exception(
-                "ThirdParty provider's authorizationEndpoint is not configured."
-            )
-
-        url: str = self.config.authorization_endpoint
-
-        # Transformation needed for dev keys BEGIN
-        if is_using_oauth_development_client_id(self.config.client_id):
-            query_params["client_id"] = get_actual_client_id_from_development_client_id(
-                self.config.client_id
-            )
-            query_params["actual_redirect_uri"] = url
-            url = DEV_OAUTH_AUTHORIZATION_URL
-        # Transformation needed for dev keys END
-
-        url_obj = urlparse(url)
-        qparams = parse_qs(url_obj.query)
-        for k, v in query_params.items():
-            qparams[k] = [v]
-
-        url = url_obj._replace(query=urlencode(qparams, doseq=True)).geturl()
+        return AuthorisationRedirect(
+            template.render(redirect_uri_on_provider_dashboard, code_challenge),
+            pkce_code_verifier,
+        )
 
-        return AuthorisationRedirect(url, pkce_code_verifier)
+    def _get_authorisation_url_template(
+        self, use_pkce: bool
+    ) -> _AuthorisationURLTemplate:
+        # Providers are created on every request, so the templates are cached
+        # in the module, keyed on all the values they're built from. The
+        # config can be changed after the provider is created, so the key is
+        # made from the current config every time.
+        scope = self.config.scope
+        extra_params = self.config.authorization_endpoint_query_params
+        args = (
+            self.config.authorization_endpoint,
+            self.config.client_id,
+            None if scope is None else tuple(scope),
+            use_pkce,
+            None if extra_params is None else tuple(extra_params.items()),
+        )
+        try:
+            return _get_authorisation_url_template(*args)
+        except TypeError:
+            # Some of the extra params can't be hashed
+            return _build_authorisation_url_template(*args)
 
     async def exchange_auth_code_for_oauth_tokens(
         self, redirect_uri_info: RedirectUriInfo, user_context: Dict[str, Any]
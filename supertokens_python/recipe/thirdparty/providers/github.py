@@ -21,6 +21,7 @@ from supertokens_python.recipe.thirdparty.providers.utils import (
     do_post_request,
 )
 from supertokens_python.recipe.thirdparty.types import UserInfo, UserInfoEmail
+from supertokens_python.utils import gather_cancelling_on_error
 
 from .custom import GenericProvider, NewProvider
 from ..provider import Provider, ProviderConfigForClient, ProviderInput
@@ -47,8 +48,13 @@ class GithubImpl(GenericProvider):
 
         raw_response = {}
 
-        email_info: List[Any] = await do_get_request("https://api.github.com/user/emails", headers=headers)  # type: ignore
-        user_info = await do_get_request("https://api.github.com/user", headers=headers)
+        email_info: List[Any]
+        email_info, user_info = await gather_cancelling_on_error(  # type: ignore
+            [
+                do_get_request("https://api.github.com/user/emails", headers=headers),
+                do_get_request("https://api.github.com/user", headers=headers),
+            ]
+        )
 
         raw_response["emails"] = email_info
         raw_response["user"] = user_info
@@ -1,7 +1,17 @@
-from typing import Any, Dict, Optional, Tuple
+from __future__ import annotations
 
-from httpx import AsyncClient
+import asyncio
+import re
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from concurrent.futures import Future
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Coroutine, Dict, Generic, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
 
+from httpx import AsyncClient, Limits, Response, Timeout
+
+from supertokens_python.async_to_sync_wrapper import await_in_background_loop
 from supertokens_python.logger import log_debug_message
 
 DEV_OAUTH_CLIENT_IDS = [
@@ -13,6 +23,8 @@ DEV_KEY_IDENTIFIER = "4398792-"
 DEV_OAUTH_AUTHORIZATION_URL = "https://supertokens.io/dev/oauth/redirect-to-provider"
 DEV_OAUTH_REDIRECT_URL = "https://supertokens.io/dev/oauth/redirect-to-app"
 
+_T = TypeVar("_T")
+
 
 def is_using_oauth_development_client_id(client_id: str):
     return client_id.startswith(DEV_KEY_IDENTIFIER) or client_id in DEV_OAUTH_CLIENT_IDS
@@ -29,19 +41,43 @@ async def do_get_request(
     query_params: Optional[Dict[str, str]] = None,
     headers: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
+    body, _ = await do_get_request_with_max_age(url, query_params, headers)
+    return body
+
+
+async def do_get_request_with_max_age(
+    url: str,
+    query_params: Optional[Dict[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Same as do_get_request, but also returns for how many seconds the
+    response may be cached according to its Cache-Control header, or None if
+    the header doesn't say"""
     if query_params is None:
         query_params = {}
     if headers is None:
         headers = {}
 
-    async with AsyncClient() as client:
-        res = await client.get(url, params=query_params, headers=headers)  # type:ignore
+    res = await http_client_pool.request(
+        "GET", url, params=query_params, headers=headers
+    )
+
+    log_debug_message(
+        "Received response with status %s and body %s", res.status_code, res.text
+    )
+
+    return res.json(), get_max_age_from_cache_control(res.headers.get("cache-control"))
 
-        log_debug_message(
-            "Received response with status %s and body %s", res.status_code, res.text
-        )
 
-        return res.json()
+def get_max_age_from_cache_control(cache_control: Optional[str]) -> Optional[int]:
+    if cache_control is None:
+        return None
+    if re.search(r"(?:^|,)\s*(?:no-store|no-cache)\s*(?:,|$)", cache_control):
+        return 0
+    max_age = re.search(r"(?:^|,)\s*max-age=(\d+)\s*(?:,|$)", cache_control)
+    if max_age is None:
+        return None
+    return int(max_age.group(1))
 
 
 async def do_post_request(
@@ -57,9 +93,194 @@ async def do_post_request(
     headers["content-type"] = "application/x-www-form-urlencoded"
     headers["accept"] = "application/json"
 
-    async with AsyncClient() as client:
-        res = await client.post(url, data=body_params, headers=headers)  # type:ignore
-        log_debug_message(
-            "Received response with status %s and body %s", res.status_code, res.text
+    res = await http_client_pool.request("POST", url, data=body_params, headers=headers)
+    log_debug_message(
+        "Received response with status %s and body %s", res.status_code, res.text
+    )
+    return res.status_code, res.json()
+
+
+class SingleFlight(Generic[_T]):
+    """Runs at most one task per key at a time on each event loop. Asking for a
+    key whose task is still running returns that task instead of starting a
+    new one."""
+
+    def __init__(self):
+        # key -> (event loop, task running on that loop)
+        self._in_flight: Dict[
+            str, Tuple[asyncio.AbstractEventLoop, asyncio.Future[_T]]
+        ] = {}
+
+    def run(
+        self, key: str, func: Callable[[], Coroutine[Any, Any, _T]]
+    ) -> asyncio.Future[_T]:
+        loop = asyncio.get_event_loop()
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None and in_flight[0] is loop:
+            return in_flight[1]
+
+        task = loop.create_task(func())
+        self._in_flight[key] = (loop, task)
+
+        def on_done(_: asyncio.Future[_T]):
+            if self._in_flight.get(key, (None, None))[1] is task:
+                del self._in_flight[key]
+            if not task.cancelled():
+                # Tasks that run in the background are not awaited by anyone,
+                # so their errors are retrieved here
+                task.exception()
+
+        task.add_done_callback(on_done)
+        return task
+
+
+class HTTPClientConfig:
+    """Connection pool settings for the requests made to third party providers.
+    Limits apply to each host separately."""
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 20,
+        max_keepalive_connections_per_host: int = 10,
+        keepalive_expiry_in_sec: float = 30,
+        timeout_in_sec: float = 5,
+        http2: bool = False,
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        self.max_keepalive_connections_per_host = max_keepalive_connections_per_host
+        self.keepalive_expiry_in_sec = keepalive_expiry_in_sec
+        self.timeout_in_sec = timeout_in_sec
+        self.http2 = http2
+
+
+class RequestLatencyStats:
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_time_in_ms = 0.0
+        self.max_time_in_ms = 0.0
+
+    def get_average_time_in_ms(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return self.total_time_in_ms / self.count
+
+
+class HTTPClientPool:
+    """Keeps one httpx client per host and event loop, so requests to a provider
+    reuse open connections instead of doing a new TLS handshake every time.
+    httpx clients can't be shared between event loops, which is why they are
+    also keyed on the loop. Requests made with `request` are all sent from the
+    background event loop, since frameworks like Django (through
+    `async_to_sync`) run each request on a new loop, whose clients would never
+    be reused."""
+
+    def __init__(self, config: Optional[HTTPClientConfig] = None):
+        self._config = HTTPClientConfig() if config is None else config
+        self._lock = Lock()
+        self._clients: Dict[Tuple[asyncio.AbstractEventLoop, str], AsyncClient] = {}
+        # host -> latency of the requests made to it
+        self._latency_stats: Dict[str, RequestLatencyStats] = {}
+
+    def configure(self, config: HTTPClientConfig):
+        """Clients created from now on use the new config. Existing clients are
+        closed."""
+        with self._lock:
+            self._config = config
+            clients = self._clients
+            self._clients = {}
+        for (loop, _), client in clients.items():
+            _close_client_on_its_loop(loop, client)
+
+    def get_client(self, url: str) -> AsyncClient:
+        parts = urlsplit(url)
+        key = (asyncio.get_event_loop(), f"{parts.scheme}://{parts.netloc}")
+        client = self._clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                # Drop the clients of loops that have been closed since
+                for loop, host in list(self._clients):
+                    if loop.is_closed():
+                        del self._clients[(loop, host)]
+                client = self._create_client()
+                self._clients[key] = client
+            return client
+
+    def _create_client(self) -> AsyncClient:
+        config = self._config
+        return AsyncClient(
+            limits=Limits(
+                max_connections=config.max_connections_per_host,
+                max_keepalive_connections=config.max_keepalive_connections_per_host,
+                keepalive_expiry=config.keepalive_expiry_in_sec,
+            ),
+            timeout=Timeout(config.timeout_in_sec),
+            http2=config.http2,
+            # Clients are shared by all users, so cookies set by a provider
+            # must not be sent with someone else's requests
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
         )
-        return res.status_code, res.json()
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        host = urlsplit(url).netloc
+        start = perf_counter()
+        failed = True
+        try:
+            res = await await_in_background_loop(self._send(method, url, **kwargs))
+            failed = False
+            return res
+        finally:
+            time_in_ms = (perf_counter() - start) * 1000
+            self._record_latency(host, time_in_ms, failed)
+            log_debug_message("%s request to %s took %d ms", method, host, time_in_ms)
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> Response:
+        return await self.get_client(url).request(method, url, **kwargs)
+
+    def _record_latency(self, host: str, time_in_ms: float, failed: bool):
+        stats = self._latency_stats.get(host)
+        if stats is None:
+            stats = self._latency_stats.setdefault(host, RequestLatencyStats())
+        stats.count += 1
+        if failed:
+            stats.errors += 1
+        stats.total_time_in_ms += time_in_ms
+        stats.max_time_in_ms = max(stats.max_time_in_ms, time_in_ms)
+
+    def get_latency_stats(self) -> Dict[str, RequestLatencyStats]:
+        """Latency of the requests made so far, per provider host"""
+        return dict(self._latency_stats)
+
+    def reset_latency_stats(self):
+        self._latency_stats = {}
+
+    async def aclose(self):
+        """Closes all the clients. Those created on other event loops are closed
+        on their loop, if it's still running."""
+        with self._lock:
+            clients = self._clients
+            self._clients = {}
+        current_loop = asyncio.get_event_loop()
+        for (loop, _), client in clients.items():
+            if loop is current_loop:
+                await client.aclose()
+            else:
+                closed = _close_client_on_its_loop(loop, client)
+                if closed is not None:
+                    await asyncio.wrap_future(closed)
+
+
+def _close_client_on_its_loop(
+    loop: asyncio.AbstractEventLoop, client: AsyncClient
+) -> Optional["Future[None]"]:
+    if loop.is_closed() or not loop.is_running():
+        # Its connections are closed when the client is garbage collected
+        return None
+    return asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+http_client_pool = HTTPClientPool()
@@ -13,15 +13,22 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
 from os import environ
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+from supertokens_python.async_to_sync_wrapper import get_background_event_loop
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
 from supertokens_python.recipe_module import APIHandled, RecipeModule
 
 from .api.implementation import APIImplementation
 from .interfaces import APIInterface, APIOptions, RecipeInterface
+from .providers.config_utils import (
+    MergedProvidersCache,
+    prewarm_oidc_discovery_cache,
+)
+from .providers.utils import http_client_pool
 from .recipe_implementation import RecipeImplementation
 from ..emailverification.interfaces import GetEmailForUserIdOkResult, UnknownUserIdError
 from ...post_init_callbacks import PostSTInitCallbacks
@@ -30,6 +37,7 @@ if TYPE_CHECKING:
     from supertokens_python.framework.request import BaseRequest
     from supertokens_python.framework.response import BaseResponse
     from supertokens_python.supertokens import AppInfo
+    from .providers.utils import HTTPClientConfig
     from .utils import SignInAndUpFeature, InputOverrideConfig
 
 from supertokens_python.exceptions import SuperTokensError, raise_general_exception
@@ -58,15 +66,23 @@ class ThirdPartyRecipe(RecipeModule):
         sign_in_and_up_feature: SignInAndUpFeature,
         _ingredients: ThirdPartyIngredients,
         override: Union[InputOverrideConfig, None] = None,
+        http_client: Optional[HTTPClientConfig] = None,
+        prewarm_oidc_discovery: bool = False,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
             sign_in_and_up_feature,
             override,
+            http_client,
+            prewarm_oidc_discovery,
         )
         self.providers = self.config.sign_in_and_up_feature.providers
+        http_client_pool.configure(self.config.http_client)
+        self.merged_providers_cache = MergedProvidersCache(self.providers)
         recipe_implementation = RecipeImplementation(
-            Querier.get_instance(recipe_id), self.providers
+            Querier.get_instance(recipe_id),
+            self.providers,
+            self.merged_providers_cache,
         )
         self.recipe_implementation: RecipeInterface = (
             recipe_implementation
@@ -88,6 +104,14 @@ class ThirdPartyRecipe(RecipeModule):
             mt_recipe = MultitenancyRecipe.get_instance_optional()
             if mt_recipe:
                 mt_recipe.static_third_party_providers = self.providers
+                mt_recipe.merged_providers_cache = self.merged_providers_cache
+
+            if self.config.prewarm_oidc_discovery and self.providers:
+                # Runs in the background, so init doesn't wait for the providers
+                asyncio.run_coroutine_threadsafe(
+                    prewarm_oidc_discovery_cache(self.providers),
+                    get_background_event_loop(),
+                )
 
         PostSTInitCallbacks.add_post_init_callback(callback)
 
@@ -170,6 +194,8 @@ class ThirdPartyRecipe(RecipeModule):
     def init(
         sign_in_and_up_feature: SignInAndUpFeature,
         override: Union[InputOverrideConfig, None] = None,
+        http_client: Optional[HTTPClientConfig] = None,
+        prewarm_oidc_discovery: bool = False,
     ):
         def func(app_info: AppInfo):
             if ThirdPartyRecipe.__instance is None:
@@ -180,6 +206,8 @@ class ThirdPartyRecipe(RecipeModule):
                     sign_in_and_up_feature,
                     ingredients,
                     override,
+                    http_client,
+                    prewarm_oidc_discovery,
                 )
                 return ThirdPartyRecipe.__instance
             raise_general_exception(
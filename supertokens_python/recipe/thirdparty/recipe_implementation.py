@@ -19,6 +19,7 @@ from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
 from supertokens_python.recipe.thirdparty.provider import ProviderInput
 from supertokens_python.recipe.thirdparty.providers.config_utils import (
+    MergedProvidersCache,
     find_and_create_provider_instance,
     merge_providers_from_core_and_static,
 )
@@ -35,10 +36,16 @@ from .types import RawUserInfoFromProvider, ThirdPartyInfo, User
 
 
 class RecipeImplementation(RecipeInterface):
-    def __init__(self, querier: Querier, providers: List[ProviderInput]):
+    def __init__(
+        self,
+        querier: Querier,
+        providers: List[ProviderInput],
+        merged_providers_cache: Optional[MergedProvidersCache] = None,
+    ):
         super().__init__()
         self.querier = querier
         self.providers = providers
+        self.merged_providers_cache = merged_providers_cache
 
     async def get_user_by_id(
         self, user_id: str, user_context: Dict[str, Any]
@@ -201,10 +208,15 @@ class RecipeImplementation(RecipeInterface):
         if tenant_config is None:
             raise Exception("Tenant not found")
 
-        merged_providers = merge_providers_from_core_and_static(
-            provider_configs_from_core=tenant_config.third_party.providers,
-            provider_inputs_from_static=self.providers,
-        )
+        if self.merged_providers_cache is not None:
+            merged_providers = self.merged_providers_cache.get_merged_providers(
+                tenant_id, tenant_config
+            )
+        else:
+            merged_providers = merge_providers_from_core_and_static(
+                provider_configs_from_core=tenant_config.third_party.providers,
+                provider_inputs_from_static=self.providers,
+            )
 
         provider = await find_and_create_provider_instance(
             merged_providers, third_party_id, client_type, user_context
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Set, Union, Optiona
 
 from supertokens_python.exceptions import raise_bad_input_exception
 from supertokens_python.recipe.thirdparty.provider import ProviderInput
+from supertokens_python.recipe.thirdparty.providers.utils import HTTPClientConfig
 
 from .interfaces import APIInterface, RecipeInterface
 
@@ -71,14 +72,20 @@ class ThirdPartyConfig:
         self,
         sign_in_and_up_feature: SignInAndUpFeature,
         override: OverrideConfig,
+        http_client: HTTPClientConfig,
+        prewarm_oidc_discovery: bool = False,
     ):
         self.sign_in_and_up_feature = sign_in_and_up_feature
         self.override = override
+        self.http_client = http_client
+        self.prewarm_oidc_discovery = prewarm_oidc_discovery
 
 
 def validate_and_normalise_user_input(
     sign_in_and_up_feature: SignInAndUpFeature,
     override: Union[InputOverrideConfig, None] = None,
+    http_client: Optional[HTTPClientConfig] = None,
+    prewarm_oidc_discovery: bool = False,
 ) -> ThirdPartyConfig:
     if not isinstance(sign_in_and_up_feature, SignInAndUpFeature):  # type: ignore
         raise ValueError(
@@ -91,9 +98,31 @@ def validate_and_normalise_user_input(
     if override is None:
         override = InputOverrideConfig()
 
+    if http_client is None:
+        http_client = HTTPClientConfig()
+    if not isinstance(http_client, HTTPClientConfig):  # type: ignore
+        raise ValueError("http_client must be an instance of HTTPClientConfig or None")
+    if http_client.max_connections_per_host < 1:
+        raise ValueError("max_connections_per_host must be at least 1")
+    if http_client.max_keepalive_connections_per_host < 0:
+        raise ValueError("max_keepalive_connections_per_host must not be negative")
+    if http_client.keepalive_expiry_in_sec < 0:
+        raise ValueError("keepalive_expiry_in_sec must not be negative")
+    if http_client.timeout_in_sec <= 0:
+        raise ValueError("timeout_in_sec must be positive")
+    if http_client.http2:
+        try:
+            import h2  # type: ignore # pylint: disable=unused-import,import-outside-toplevel
+        except ImportError:
+            raise ValueError(
+                "http2 requires the h2 package. Install it with: pip install httpx[http2]"
+            )
+
     return ThirdPartyConfig(
         sign_in_and_up_feature,
         OverrideConfig(functions=override.functions, apis=override.apis),
+        http_client,
+        prewarm_oidc_discovery,
     )
 
 
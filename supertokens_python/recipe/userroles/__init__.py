@@ -32,9 +32,11 @@ def init(
     skip_adding_roles_to_access_token: Optional[bool] = None,
     skip_adding_permissions_to_access_token: Optional[bool] = None,
     override: Union[utils.InputOverrideConfig, None] = None,
+    permissions_for_role_cache_ttl_in_sec: Optional[int] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return UserRolesRecipe.init(
         skip_adding_roles_to_access_token,
         skip_adding_permissions_to_access_token,
         override,
+        permissions_for_role_cache_ttl_in_sec,
     )
@@ -27,13 +27,16 @@ from supertokens_python.recipe.userroles.recipe_implementation import (
 from supertokens_python.recipe.userroles.utils import validate_and_normalise_user_input
 from supertokens_python.recipe_module import APIHandled, RecipeModule
 from supertokens_python.supertokens import AppInfo
+from supertokens_python.utils import gather_with_concurrency_limit
 
 from ...post_init_callbacks import PostSTInitCallbacks
 from ..session import SessionRecipe
 from ..session.claim_base_classes.primitive_array_claim import PrimitiveArrayClaim
 from .exceptions import SuperTokensUserRolesError
 from .interfaces import GetPermissionsForRoleOkResult
-from .utils import InputOverrideConfig
+from .utils import InputOverrideConfig, PermissionsForRoleCache
+
+PERMISSIONS_FETCH_CONCURRENCY_LIMIT = 5
 
 
 class UserRolesRecipe(RecipeModule):
@@ -47,6 +50,7 @@ class UserRolesRecipe(RecipeModule):
         skip_adding_roles_to_access_token: Optional[bool] = None,
         skip_adding_permissions_to_access_token: Optional[bool] = None,
         override: Union[InputOverrideConfig, None] = None,
+        permissions_for_role_cache_ttl_in_sec: Optional[int] = None,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
@@ -55,8 +59,14 @@ class UserRolesRecipe(RecipeModule):
             skip_adding_roles_to_access_token,
             skip_adding_permissions_to_access_token,
             override,
+            permissions_for_role_cache_ttl_in_sec,
+        )
+        self.permissions_for_role_cache = PermissionsForRoleCache(
+            self.config.permissions_for_role_cache_ttl_in_sec
+        )
+        recipe_implementation = RecipeImplementation(
+            Querier.get_instance(recipe_id), self.permissions_for_role_cache
         )
-        recipe_implementation = RecipeImplementation(Querier.get_instance(recipe_id))
         self.recipe_implementation = (
             recipe_implementation
             if self.config.override.functions is None
@@ -110,6 +120,7 @@ class UserRolesRecipe(RecipeModule):
         skip_adding_roles_to_access_token: Optional[bool] = None,
         skip_adding_permissions_to_access_token: Optional[bool] = None,
         override: Union[InputOverrideConfig, None] = None,
+        permissions_for_role_cache_ttl_in_sec: Optional[int] = None,
     ):
         def func(app_info: AppInfo):
             if UserRolesRecipe.__instance is None:
@@ -119,6 +130,7 @@ class UserRolesRecipe(RecipeModule):
                     skip_adding_roles_to_access_token,
                     skip_adding_permissions_to_access_token,
                     override,
+                    permissions_for_role_cache_ttl_in_sec,
                 )
                 return UserRolesRecipe.__instance
             raise Exception(
@@ -159,18 +171,34 @@ class PermissionClaimClass(PrimitiveArrayClaim[List[str]]):
                 user_id, tenant_id, user_context
             )
 
+            cache = recipe.permissions_for_role_cache
+            cache_version = cache.get_version()
+            roles_to_fetch: List[str] = []
             user_permissions: Set[str] = set()
 
             for role in user_roles.roles:
-                role_permissions = (
-                    await recipe.recipe_implementation.get_permissions_for_role(
+                found, permissions = cache.get(role)
+                if not found:
+                    roles_to_fetch.append(role)
+                elif permissions is not None:
+                    user_permissions.update(permissions)
+
+            roles_permissions = await gather_with_concurrency_limit(
+                [
+                    recipe.recipe_implementation.get_permissions_for_role(
                         role, user_context
                     )
-                )
+                    for role in roles_to_fetch
+                ],
+                PERMISSIONS_FETCH_CONCURRENCY_LIMIT,
+            )
 
+            for role, role_permissions in zip(roles_to_fetch, roles_permissions):
                 if isinstance(role_permissions, GetPermissionsForRoleOkResult):
-                    for permission in role_permissions.permissions:
-                        user_permissions.add(permission)
+                    cache.set(role, role_permissions.permissions, cache_version)
+                    user_permissions.update(role_permissions.permissions)
+                else:
+                    cache.set(role, None, cache_version)
 
             return list(user_permissions)
 
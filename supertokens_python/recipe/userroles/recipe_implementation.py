@@ -13,7 +13,7 @@
 # under the License.
 
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
@@ -32,12 +32,22 @@ from .interfaces import (
     RemoveUserRoleOkResult,
     UnknownRoleError,
 )
+from .utils import PermissionsForRoleCache
 
 
 class RecipeImplementation(RecipeInterface):
-    def __init__(self, querier: Querier):
+    def __init__(
+        self,
+        querier: Querier,
+        permissions_for_role_cache: Optional[PermissionsForRoleCache] = None,
+    ):
         super().__init__()
         self.querier = querier
+        self.permissions_for_role_cache = permissions_for_role_cache
+
+    def _invalidate_permissions_for_role(self, role: str):
+        if self.permissions_for_role_cache is not None:
+            self.permissions_for_role_cache.invalidate(role)
 
     async def add_role_to_user(
         self,
@@ -110,6 +120,7 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        self._invalidate_permissions_for_role(role)
         return CreateNewRoleOrAddPermissionsOkResult(
             created_new_role=response["createdNewRole"]
         )
@@ -136,6 +147,7 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        self._invalidate_permissions_for_role(role)
         if response["status"] == "OK":
             return RemovePermissionsFromRoleOkResult()
         return UnknownRoleError()
@@ -160,6 +172,7 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        self._invalidate_permissions_for_role(role)
         return DeleteRoleOkResult(did_role_exist=response["didRoleExist"])
 
     async def get_all_roles(self, user_context: Dict[str, Any]) -> GetAllRolesOkResult:
@@ -14,10 +14,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Union, Optional
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, Union, Optional
 
 from supertokens_python.recipe.userroles.interfaces import APIInterface, RecipeInterface
 from supertokens_python.supertokens import AppInfo
+from supertokens_python.utils import get_timestamp_ms
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.userroles.recipe import UserRolesRecipe
@@ -39,12 +41,62 @@ class UserRolesConfig:
         skip_adding_roles_to_access_token: bool,
         skip_adding_permissions_to_access_token: bool,
         override: InputOverrideConfig,
+        permissions_for_role_cache_ttl_in_sec: int,
     ) -> None:
         self.skip_adding_roles_to_access_token = skip_adding_roles_to_access_token
         self.skip_adding_permissions_to_access_token = (
             skip_adding_permissions_to_access_token
         )
         self.override = override
+        self.permissions_for_role_cache_ttl_in_sec = (
+            permissions_for_role_cache_ttl_in_sec
+        )
+
+
+class PermissionsForRoleCache:
+    """Process level cache of role -> permissions, used while fetching the
+    value of the PermissionClaim. Entries expire after the configured TTL and
+    are invalidated whenever the permissions of a role are changed via this SDK."""
+
+    def __init__(self, ttl_in_sec: int):
+        self.ttl_in_ms = ttl_in_sec * 1000
+        self._lock = Lock()
+        # role -> (expiry time in ms, permissions or None if the role doesn't exist)
+        self._entries: Dict[str, Tuple[int, Optional[List[str]]]] = {}
+        self._version = 0
+
+    def get_version(self) -> int:
+        return self._version
+
+    def get(self, role: str) -> Tuple[bool, Optional[List[str]]]:
+        """Returns whether the role was found in the cache and its permissions"""
+        entry = self._entries.get(role)
+        if entry is None:
+            return False, None
+        if entry[0] <= get_timestamp_ms():
+            with self._lock:
+                if self._entries.get(role) is entry:
+                    del self._entries[role]
+            return False, None
+        return True, entry[1]
+
+    def set(self, role: str, permissions: Optional[List[str]], version: int):
+        """Caches the permissions of the role, unless the cache was invalidated
+        after `version` was read (i.e. while the permissions were being fetched)"""
+        if self.ttl_in_ms <= 0:
+            return
+        with self._lock:
+            if version != self._version:
+                return
+            self._entries[role] = (get_timestamp_ms() + self.ttl_in_ms, permissions)
+
+    def invalidate(self, role: Optional[str] = None):
+        with self._lock:
+            self._version += 1
+            if role is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(role, None)
 
 
 def validate_and_normalise_user_input(
@@ -53,6 +105,7 @@ def validate_and_normalise_user_input(
     skip_adding_roles_to_access_token: Optional[bool] = None,
     skip_adding_permissions_to_access_token: Optional[bool] = None,
     override: Union[InputOverrideConfig, None] = None,
+    permissions_for_role_cache_ttl_in_sec: Optional[int] = None,
 ) -> UserRolesConfig:
     if override is not None and not isinstance(override, InputOverrideConfig):  # type: ignore
         raise ValueError("override must be an instance of InputOverrideConfig or None")
@@ -64,9 +117,14 @@ def validate_and_normalise_user_input(
         skip_adding_roles_to_access_token = False
     if skip_adding_permissions_to_access_token is None:
         skip_adding_permissions_to_access_token = False
+    if permissions_for_role_cache_ttl_in_sec is None:
+        permissions_for_role_cache_ttl_in_sec = 60
+    if permissions_for_role_cache_ttl_in_sec < 0:
+        raise ValueError("permissions_for_role_cache_ttl_in_sec must not be negative")
 
     return UserRolesConfig(
         skip_adding_roles_to_access_token=skip_adding_roles_to_access_token,
         skip_adding_permissions_to_access_token=skip_adding_permissions_to_access_token,
         override=override,
+        permissions_for_role_cache_ttl_in_sec=permissions_for_role_cache_ttl_in_sec,
     )
@@ -195,9 +195,12 @@ class AppInfo:
 def manage_session_post_response(
     session: SessionContainer, response: BaseResponse, user_context: Dict[str, Any]
 ):
+    from supertokens_python.recipe.session.cookie_and_header import (
+        apply_response_mutators,
+    )
+
     # Something similar happens in handle_error of session/recipe.py
-    for mutator in session.response_mutators:
-        mutator(response, user_context)
+    apply_response_mutators(session.response_mutators, response, user_context)
 
 
 class Supertokens:
@@ -570,6 +573,17 @@ class Supertokens:
 
         raise_general_exception("Please upgrade the SuperTokens core to >= 3.15.0")
 
+    def is_supertokens_api_path(self, request: BaseRequest) -> bool:
+        """
+        Returns False if the request can't be for any SuperTokens API, in which
+        case `middleware` would return None without doing anything. Sync
+        frameworks use this to skip running the middleware coroutine.
+        """
+        path = self.app_info.api_gateway_path.append(
+            NormalisedURLPath(request.get_path())
+        )
+        return path.startswith(self.app_info.api_base_path)
+
     async def middleware(  # pylint: disable=no-self-use
         self, request: BaseRequest, response: BaseResponse, user_context: Dict[str, Any]
     ) -> Union[BaseResponse, None]:
@@ -14,10 +14,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import threading
 import warnings
 from base64 import urlsafe_b64decode, urlsafe_b64encode, b64encode, b64decode
+from functools import lru_cache
 from math import floor
 from re import fullmatch
 from time import time
@@ -34,12 +36,6 @@ from typing import (
 )
 from urllib.parse import urlparse
 
-from httpx import HTTPStatusError, Response
-from tldextract import extract  # type: ignore
-
-from supertokens_python.framework.django.framework import DjangoFramework
-from supertokens_python.framework.fastapi.framework import FastapiFramework
-from supertokens_python.framework.flask.framework import FlaskFramework
 from supertokens_python.framework.request import BaseRequest
 from supertokens_python.framework.response import BaseResponse
 from supertokens_python.logger import log_debug_message
@@ -51,14 +47,52 @@ from .types import MaybeAwaitable
 _T = TypeVar("_T")
 
 if TYPE_CHECKING:
-    pass
+    from supertokens_python.framework.types import Framework
+
+
+def _load_framework(name: str) -> Framework:
+    if name == "fastapi":
+        from supertokens_python.framework.fastapi.framework import FastapiFramework
+
+        return FastapiFramework()
+    if name == "flask":
+        from supertokens_python.framework.flask.framework import FlaskFramework
+
+        return FlaskFramework()
+    if name == "django":
+        from supertokens_python.framework.django.framework import DjangoFramework
+
+        return DjangoFramework()
+    raise KeyError(name)
 
 
-FRAMEWORKS = {
-    "fastapi": FastapiFramework(),
-    "flask": FlaskFramework(),
-    "django": DjangoFramework(),
-}
+class _LazyFrameworks(Dict[str, "Framework"]):
+    # Only the adapter of the framework that is used gets imported
+    def __missing__(self, key: str) -> Framework:
+        framework = _load_framework(key)
+        self[key] = framework
+        return framework
+
+
+FRAMEWORKS: Dict[str, Framework] = _LazyFrameworks()
+
+
+@lru_cache(maxsize=1)
+def _get_tld_extractor() -> Any:
+    # tldextract is imported, and the public suffix list is parsed, on first use.
+    # This happens in Supertokens.init, when the api domain is resolved, and
+    # not during a request.
+    from tldextract import TLDExtract  # type: ignore
+
+    # Uses the public suffix list snapshot bundled with tldextract, so
+    # resolving a domain never makes a network request or touches the disk
+    # cache.
+    return TLDExtract(
+        cache_dir=None, suffix_list_urls=(), include_psl_private_domains=True
+    )
+
+
+TOP_LEVEL_DOMAIN_CACHE_SIZE = 1000
 
 
 def is_an_ip_address(ip_address: str) -> bool:
@@ -203,6 +237,8 @@ def deprecated_warn(msg: str):
 def handle_httpx_client_exceptions(
     e: Exception, input_: Union[Dict[str, Any], None] = None
 ):
+    from httpx import HTTPStatusError, Response
+
     if isinstance(e, HTTPStatusError) and isinstance(e.response, Response):  # type: ignore
         res = e.response  # type: ignore
         log_debug_message("Error status: %s", res.status_code)  # type: ignore
@@ -266,6 +302,33 @@ async def resolve(obj: MaybeAwaitable[_T]) -> _T:
     return obj  # type: ignore
 
 
+async def gather_with_concurrency_limit(
+    awaitables: List[Awaitable[_T]], limit: int
+) -> List[_T]:
+    """Awaits all awaitables with at most `limit` of them running at a time.
+    The results are returned in the same order as the awaitables passed in."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(awaitable: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*[_run(a) for a in awaitables]))
+
+
+async def gather_cancelling_on_error(awaitables: List[Awaitable[_T]]) -> List[_T]:
+    """Runs the awaitables concurrently, like asyncio.gather. If one of them
+    fails, the ones still running are cancelled instead of being left running
+    in the background, and the error is raised."""
+    tasks = [asyncio.ensure_future(a) for a in awaitables]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
 def get_top_level_domain_for_same_site_resolution(url: str) -> str:
     url_obj = urlparse(url)
     hostname = url_obj.hostname
@@ -273,10 +336,15 @@ def get_top_level_domain_for_same_site_resolution(url: str) -> str:
     if hostname is None:
         raise Exception("Should not come here")
 
+    return _get_top_level_domain_for_hostname(hostname)
+
+
+@lru_cache(maxsize=TOP_LEVEL_DOMAIN_CACHE_SIZE)
+def _get_top_level_domain_for_hostname(hostname: str) -> str:
     if hostname.startswith("localhost") or is_an_ip_address(hostname):
         return "localhost"
 
-    parsed_url: Any = extract(hostname, include_psl_private_domains=True)
+    parsed_url: Any = _get_tld_extractor()(hostname)
     if parsed_url.domain == "":  # type: ignore
         # We need to do this because of https://github.com/supertokens/supertokens-python/issues/394
         if hostname.endswith(".amazonaws.com") and parsed_url.suffix == hostname:
@@ -33,7 +33,7 @@ DATABASES = {
         # 'oracle'.
         "ENGINE": "django.db.backends.sqlite3",
         # Or path to database file if using sqlite3.
-        "NAME": "sqlite.db",
+        "NAME": os.path.join(os.path.dirname(os.path.abspath(__file__)), "sqlite.db"),
         "USER": "",  # Not used with sqlite3.
         "PASSWORD": "",  # Not used with sqlite3.
         # Set to empty string for localhost. Not used with sqlite3.
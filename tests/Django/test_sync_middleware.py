@@ -0,0 +1,118 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+from time import perf_counter
+from typing import Any, Callable, List
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.http import HttpRequest, JsonResponse
+from django.test import RequestFactory
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.framework.django import django_middleware, middleware
+from supertokens_python.recipe import session
+from supertokens_python.supertokens import Supertokens
+from tests.benchmark import benchmark, write_benchmark_report
+from tests.utils import reset
+
+
+def setup_function(_):
+    reset(stop_core=False)
+    # None of the requests below need the core
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.supertokens.io",
+            website_domain="http://supertokens.io",
+        ),
+        framework="django",
+        mode="wsgi",
+        recipe_list=[session.init()],
+    )
+
+
+def teardown_function(_):
+    reset(stop_core=False)
+
+
+def hello_view(_: HttpRequest):
+    return JsonResponse({"hello": "world"})
+
+
+def test_sync_middleware():
+    factory = RequestFactory()
+    mw = middleware(hello_view)
+
+    response = mw(factory.get("/hello"))
+    assert json.loads(response.content) == {"hello": "world"}
+
+    # Requests for SuperTokens APIs still run the middleware
+    response = mw(factory.post("/auth/session/refresh"))
+    assert response.status_code == 401
+    assert response.cookies["sAccessToken"].value == ""
+
+
+def test_sync_middleware_skips_the_coroutine_for_app_views():
+    factory = RequestFactory()
+    mw = middleware(hello_view)
+    calls: List[Any] = []
+
+    def recording_async_to_sync(f: Callable[..., Any]) -> Callable[..., Any]:
+        calls.append(f)
+        return async_to_sync(f)
+
+    with patch.object(django_middleware, "async_to_sync", recording_async_to_sync):
+        for _ in range(5):
+            response = mw(factory.get("/hello"))
+            assert json.loads(response.content) == {"hello": "world"}
+        assert calls == []
+
+        # SuperTokens APIs and errors still go through async_to_sync, so
+        # thread sensitive code in overrides runs on the request thread.
+        response = mw(factory.post("/auth/session/refresh"))
+        assert response.status_code == 401
+
+    st = Supertokens.get_instance()
+    assert calls == [st.middleware, st.handle_supertokens_error]
+
+
+@benchmark
+def test_benchmark_sync_middleware_for_app_views():
+    factory = RequestFactory()
+    mw = middleware(hello_view)
+    requests = [factory.get("/hello") for _ in range(500)]
+    # Warm up
+    for request in requests[:50]:
+        mw(request)
+
+    start = perf_counter()
+    for request in requests:
+        mw(request)
+    new_time = perf_counter() - start
+
+    # The previous middleware ran the middleware coroutine with async_to_sync
+    # for every request.
+    with patch.object(Supertokens, "is_supertokens_api_path", lambda *_: True):  # type: ignore
+        start = perf_counter()
+        for request in requests:
+            mw(request)
+        old_time = perf_counter() - start
+
+    write_benchmark_report(
+        "Sync Django middleware for app views",
+        f"before: {len(requests) / old_time:.0f} req/s\n"
+        f"after: {len(requests) / new_time:.0f} req/s",
+    )
@@ -0,0 +1,114 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict
+
+from fastapi import Request
+from pytest import mark
+
+from supertokens_python.framework.fastapi.fastapi_request import (
+    FastApiASGIRequest,
+    FastApiRequest,
+)
+from supertokens_python.framework.fastapi.fastapi_response import (
+    FastApiASGIResponse,
+)
+from supertokens_python.recipe.session.cookie_and_header import (
+    anti_csrf_response_mutator,
+    apply_response_mutators,
+)
+
+
+def make_scope() -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "method": "POST",
+        "scheme": "https",
+        "server": ("api.example.com", 443),
+        "root_path": "",
+        "path": "/auth/session/refresh",
+        "query_string": b"a=1&b=&a=2",
+        "headers": [
+            (b"host", b"api.example.com"),
+            (b"rid", b"session"),
+            (b"authorization", b"Bearer token"),
+            (b"cookie", b"sRefreshToken=rt%3D; other=1; other=2"),
+        ],
+    }
+
+
+def test_asgi_request_matches_starlette_request():
+    asgi_req = FastApiASGIRequest(make_scope(), None)
+    fastapi_req = FastApiRequest(Request(make_scope()))
+
+    assert asgi_req.method() == fastapi_req.method()
+    assert asgi_req.get_path() == fastapi_req.get_path()
+    assert asgi_req.get_query_params() == fastapi_req.get_query_params()
+    assert asgi_req.get_query_param("b") == fastapi_req.get_query_param("b")
+    assert asgi_req.get_query_param("c", "x") == fastapi_req.get_query_param("c", "x")
+    for header in ["rid", "authorization", "AUTHORIZATION", "missing"]:
+        assert asgi_req.get_header(header) == fastapi_req.get_header(header)
+    for cookie in ["sRefreshToken", "other", "missing"]:
+        assert asgi_req.get_cookie(cookie) == fastapi_req.get_cookie(cookie)
+    assert asgi_req.get_original_url() == fastapi_req.get_original_url()
+
+
+def test_asgi_request_only_creates_starlette_request_when_needed():
+    scope = make_scope()
+    req = FastApiASGIRequest(scope, None)
+
+    req.get_header("rid")
+    req.get_path()
+    req.get_query_params()
+    assert req._request is None  # type: ignore
+
+    session: Any = object()
+    req.set_session(session)
+    assert req.get_session() is session
+    # The session is visible to the app through request.state
+    assert Request(scope).state.supertokens is session
+
+    req.get_original_url()
+    assert req._request is not None  # type: ignore
+
+
+@mark.parametrize("existing_expose_headers", [None, "x-custom"])
+def test_asgi_response_mutates_raw_headers(existing_expose_headers: Any):
+    headers = [(b"content-type", b"application/json")]
+    if existing_expose_headers is not None:
+        headers.append(
+            (b"access-control-expose-headers", existing_expose_headers.encode())
+        )
+    message: Dict[str, Any] = {
+        "type": "http.response.start",
+        "status": 200,
+        "headers": headers,
+    }
+
+    response = FastApiASGIResponse(message)
+    apply_response_mutators([anti_csrf_response_mutator("csrf")], response, {})
+    response.add_set_cookie_header("a=b")
+
+    expected_expose_headers = (
+        "anti-csrf"
+        if existing_expose_headers is None
+        else existing_expose_headers + ",anti-csrf"
+    )
+    assert sorted(message["headers"]) == sorted(
+        [
+            (b"content-type", b"application/json"),
+            (b"anti-csrf", b"csrf"),
+            (b"access-control-expose-headers", expected_expose_headers.encode()),
+            (b"set-cookie", b"a=b"),
+        ]
+    )
@@ -0,0 +1,150 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Coroutine, List
+from unittest.mock import patch
+
+from flask import Flask, jsonify
+from pytest import fixture
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.async_to_sync_wrapper import (
+    create_or_get_event_loop,
+    get_background_event_loop,
+    run_in_background_loop,
+)
+from supertokens_python.framework.flask import Middleware
+from supertokens_python.framework.flask import flask_middleware
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.framework.flask import verify_session
+from supertokens_python.supertokens import Supertokens
+from tests.benchmark import benchmark, write_benchmark_report
+from tests.utils import reset
+
+
+def setup_function(_):
+    reset(stop_core=False)
+
+
+def teardown_function(_):
+    reset(stop_core=False)
+
+
+@fixture(scope="function")
+def flask_app():
+    # None of the requests below need the core
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.supertokens.io",
+            website_domain="http://supertokens.io",
+        ),
+        framework="flask",
+        recipe_list=[session.init()],
+    )
+
+    app = Flask(__name__)
+    Middleware(app)
+
+    @app.route("/hello")  # type: ignore
+    def hello():  # type: ignore
+        return jsonify({"hello": "world"})
+
+    @app.route("/optional-session")  # type: ignore
+    @verify_session(session_required=False)
+    def optional_session():  # type: ignore
+        from flask import g
+
+        return jsonify({"session": g.supertokens is not None})
+
+    return app
+
+
+def get_from_threads(app: Flask, path: str, threads: int, requests: int) -> List[int]:
+    def worker(_: int) -> List[int]:
+        client = app.test_client()
+        return [client.get(path).status_code for _ in range(requests // threads)]
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return [
+            code for codes in executor.map(worker, range(threads)) for code in codes
+        ]
+
+
+def test_flask_sdk_code_runs_from_multiple_threads(flask_app: Any):
+    assert set(get_from_threads(flask_app, "/optional-session", 8, 80)) == {200}
+
+    client = flask_app.test_client()
+    assert client.get("/optional-session").json == {"session": False}
+    # Requests for SuperTokens APIs still run the middleware
+    assert client.post("/auth/session/refresh").status_code == 401
+
+
+def test_flask_middleware_only_runs_coroutines_for_supertokens_apis(flask_app: Any):
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    def run_and_record_loop(co: Coroutine[Any, Any, Any]) -> Any:
+        loops.append(run_in_background_loop(get_loop()))
+        return run_in_background_loop(co)
+
+    with patch.object(flask_middleware, "run_in_background_loop", run_and_record_loop):
+        assert set(get_from_threads(flask_app, "/hello", 4, 20)) == {200}
+        assert loops == []
+
+        client = flask_app.test_client()
+        assert client.post("/auth/session/refresh").status_code == 401
+        assert client.post("/auth/session/refresh").status_code == 401
+
+    # The middleware and error handler coroutines of both requests ran on one loop
+    assert len(loops) >= 2
+    assert set(loops) == {get_background_event_loop()}
+
+
+def requests_per_second(app: Flask, path: str, threads: int, requests: int) -> float:
+    start = perf_counter()
+    get_from_threads(app, path, threads, requests)
+    return requests / (perf_counter() - start)
+
+
+def run_on_thread_loop(co: Coroutine[Any, Any, Any]) -> Any:
+    return create_or_get_event_loop().run_until_complete(co)
+
+
+@benchmark
+def test_benchmark_flask_middleware_for_app_routes(flask_app: Any):
+    threads, requests = 8, 800
+    # Warm up
+    requests_per_second(flask_app, "/hello", threads, 80)
+
+    new_rps = requests_per_second(flask_app, "/hello", threads, requests)
+
+    # The previous middleware ran the middleware coroutine for every request,
+    # with run_until_complete on an event loop per thread.
+    with patch.object(
+        flask_middleware, "run_in_background_loop", run_on_thread_loop
+    ), patch.object(
+        Supertokens, "is_supertokens_api_path", lambda *_: True
+    ):  # type: ignore
+        old_rps = requests_per_second(flask_app, "/hello", threads, requests)
+
+    write_benchmark_report(
+        "Flask middleware for app routes",
+        f"before: {old_rps:.0f} req/s\nafter: {new_rps:.0f} req/s",
+    )
@@ -0,0 +1,33 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Benchmarks are slow and their timings are only useful when compared across
+changes, so they only run when SUPERTOKENS_BENCHMARK_REPORT is set to the path
+of a file. Each benchmark appends its report to that file.
+"""
+import os
+
+from pytest import mark
+
+BENCHMARK_REPORT_PATH = os.environ.get("SUPERTOKENS_BENCHMARK_REPORT")
+
+benchmark = mark.skipif(
+    BENCHMARK_REPORT_PATH is None, reason="SUPERTOKENS_BENCHMARK_REPORT is not set"
+)
+
+
+def write_benchmark_report(title: str, report: str):
+    assert BENCHMARK_REPORT_PATH is not None
+    with open(BENCHMARK_REPORT_PATH, "a") as f:
+        f.write(f"{title}\n{report}\n\n")
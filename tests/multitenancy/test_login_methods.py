@@ -0,0 +1,138 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+from pytest import mark
+
+from supertokens_python.recipe.multitenancy.api.implementation import (
+    APIImplementation,
+)
+from supertokens_python.recipe.multitenancy.constants import (
+    PROVIDER_RESOLUTION_CONCURRENCY_LIMIT,
+)
+from supertokens_python.recipe.multitenancy.interfaces import (
+    APIOptions,
+    EmailPasswordConfig,
+    GetTenantOkResult,
+    PasswordlessConfig,
+    ThirdPartyConfig,
+)
+from supertokens_python.recipe.thirdparty.exceptions import ClientTypeNotFoundError
+from supertokens_python.recipe.thirdparty.provider import (
+    Provider,
+    ProviderClientConfig,
+    ProviderConfig,
+    ProviderInput,
+)
+from supertokens_python.recipe.thirdparty.providers import config_utils
+from supertokens_python.recipe.thirdparty.providers.config_utils import (
+    MergedProvidersCache,
+)
+
+pytestmark = mark.asyncio
+
+
+class FakeRecipeImplementation:
+    def __init__(self):
+        self.tenant_config = make_tenant_config()
+
+    async def get_tenant(
+        self, tenant_id: Optional[str], user_context: Dict[str, Any]
+    ) -> Optional[GetTenantOkResult]:
+        return self.tenant_config
+
+
+def make_tenant_config() -> GetTenantOkResult:
+    return GetTenantOkResult(
+        emailpassword=EmailPasswordConfig(True),
+        passwordless=PasswordlessConfig(False),
+        third_party=ThirdPartyConfig(True, []),
+        core_config={},
+    )
+
+
+def make_api_options(
+    recipe_implementation: FakeRecipeImplementation, provider_count: int
+) -> APIOptions:
+    providers = [
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id=f"provider-{i}",
+                clients=[ProviderClientConfig(client_id=f"client-{i}")],
+            )
+        )
+        for i in range(provider_count)
+    ]
+    return APIOptions(
+        MagicMock(),
+        MagicMock(),
+        "multitenancy",
+        MagicMock(),
+        recipe_implementation,  # type: ignore
+        providers,
+        MergedProvidersCache(providers),
+    )
+
+
+async def test_login_methods_resolve_providers_concurrently():
+    created: List[str] = []
+    running = 0
+    max_running = 0
+
+    async def find_and_create_provider_instance(
+        providers: List[ProviderInput],
+        third_party_id: str,
+        client_type: Optional[str],
+        user_context: Dict[str, Any],
+    ) -> Provider:
+        # Stands in for a provider whose OIDC discovery endpoint is fetched
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        created.append(third_party_id)
+        if third_party_id == "provider-3":
+            raise ClientTypeNotFoundError("not found")
+        provider = MagicMock()
+        provider.id = third_party_id
+        provider.config.name = third_party_id.upper()
+        return provider
+
+    recipe_implementation = FakeRecipeImplementation()
+    api_options = make_api_options(recipe_implementation, 10)
+    api_implementation = APIImplementation()
+
+    with patch.object(
+        config_utils,
+        "find_and_create_provider_instance",
+        find_and_create_provider_instance,
+    ):
+        result = await api_implementation.login_methods_get(
+            "public", None, api_options, {}
+        )
+        assert max_running == PROVIDER_RESOLUTION_CONCURRENCY_LIMIT
+        assert [p.to_json() for p in result.third_party.providers] == [  # type: ignore
+            {"id": f"provider-{i}", "name": f"PROVIDER-{i}"}
+            for i in range(10)
+            if i != 3
+        ]
+        assert len(created) == 10
+
+        # Providers are created on every request, since overrides can depend
+        # on the user_context
+        await api_implementation.login_methods_get("public", "web", api_options, {})
+        assert len(created) == 20
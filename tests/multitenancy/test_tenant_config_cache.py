@@ -0,0 +1,140 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+from pytest import mark
+
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe.multitenancy import utils as multitenancy_utils
+from supertokens_python.recipe.multitenancy.recipe_implementation import (
+    RecipeImplementation,
+)
+from supertokens_python.recipe.multitenancy.utils import (
+    TenantConfigCache,
+    validate_and_normalise_user_input,
+)
+
+pytestmark = mark.asyncio
+
+
+class FakeQuerier:
+    # Answers the core requests made by the multitenancy recipe implementation
+    def __init__(self):
+        self.get_requests: List[str] = []
+        self.get_request_user_contexts: List[Dict[str, Any]] = []
+        self.tenants: Dict[str, Dict[str, Any]] = {}
+
+    async def send_get_request(
+        self,
+        path: NormalisedURLPath,
+        params: Optional[Dict[str, Any]],
+        user_context: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        self.get_requests.append(path.get_as_string_dangerous())
+        self.get_request_user_contexts.append(user_context)
+        tenant_id = path.get_as_string_dangerous().split("/")[1]
+        if tenant_id not in self.tenants:
+            return {"status": "TENANT_NOT_FOUND_ERROR"}
+        return {"status": "OK", **self.tenants[tenant_id]}
+
+    async def send_put_request(
+        self, path: NormalisedURLPath, data: Dict[str, Any], user_context: Any
+    ) -> Dict[str, Any]:
+        self.tenants[data["tenantId"]] = make_tenant(
+            data.get("emailPasswordEnabled", True)
+        )
+        return {"status": "OK", "createdNew": False}
+
+
+def make_tenant(emailpassword_enabled: bool) -> Dict[str, Any]:
+    return {
+        "emailPassword": {"enabled": emailpassword_enabled},
+        "passwordless": {"enabled": True},
+        "thirdParty": {"enabled": True, "providers": []},
+        "coreConfig": {},
+    }
+
+
+def make_recipe_implementation(querier: FakeQuerier, cache: TenantConfigCache):
+    return RecipeImplementation(
+        querier, validate_and_normalise_user_input(None), cache  # type: ignore
+    )
+
+
+async def test_tenant_config_is_cached_and_invalidated():
+    querier = FakeQuerier()
+    querier.tenants["t1"] = make_tenant(True)
+    cache = TenantConfigCache(60, 60)
+    recipe_implementation = make_recipe_implementation(querier, cache)
+
+    tenant = await recipe_implementation.get_tenant("t1", {})
+    assert tenant is not None and tenant.emailpassword.enabled
+    assert await recipe_implementation.get_tenant("t1", {}) is tenant
+    assert await recipe_implementation.get_tenant("unknown", {}) is None
+    assert await recipe_implementation.get_tenant("unknown", {}) is None
+    assert len(querier.get_requests) == 2
+    assert (cache.hits, cache.stale_hits, cache.misses) == (2, 0, 2)
+    assert cache.get_hit_ratio() == 0.5
+
+    await recipe_implementation.create_or_update_tenant("t1", None, {})
+    await recipe_implementation.get_tenant("t1", {})
+    assert len(querier.get_requests) == 3
+
+
+async def test_stale_tenant_config_is_served_while_it_is_refreshed():
+    querier = FakeQuerier()
+    querier.tenants["t1"] = make_tenant(True)
+    cache = TenantConfigCache(60, 60)
+    recipe_implementation = make_recipe_implementation(querier, cache)
+
+    now = 1_000_000
+    with patch.object(multitenancy_utils, "get_timestamp_ms", lambda: now):
+        await recipe_implementation.get_tenant("t1", {})
+
+        querier.tenants["t1"] = make_tenant(False)
+        now += 90_000
+        user_context = {"request": "stale"}
+        stale_results = await asyncio.gather(
+            *[recipe_implementation.get_tenant("t1", user_context) for _ in range(5)]
+        )
+        assert all(t is not None and t.emailpassword.enabled for t in stale_results)
+        # Only one background refresh runs
+        await asyncio.sleep(0)
+        assert len(querier.get_requests) == 2
+        # The refresh doesn't use the user_context of the request that started it
+        assert querier.get_request_user_contexts[-1] == {}
+
+        tenant = await recipe_implementation.get_tenant("t1", {})
+        assert tenant is not None and not tenant.emailpassword.enabled
+        assert len(querier.get_requests) == 2
+
+        # Past the stale while revalidate window the config is fetched again
+        now += 200_000
+        await recipe_implementation.get_tenant("t1", {})
+        assert len(querier.get_requests) == 3
+
+
+async def test_tenant_config_cache_can_be_disabled():
+    querier = FakeQuerier()
+    querier.tenants["public"] = make_tenant(True)
+    recipe_implementation = make_recipe_implementation(querier, TenantConfigCache(0, 0))
+
+    await recipe_implementation.get_tenant(None, {})
+    await recipe_implementation.get_tenant(None, {})
+    assert querier.get_requests == [
+        "/public/recipe/multitenancy/tenant",
+        "/public/recipe/multitenancy/tenant",
+    ]
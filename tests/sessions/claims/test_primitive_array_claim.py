@@ -399,3 +399,18 @@ async def test_validator_should_not_validate_older_values_with_5min_default_max_
         "maxAgeInSeconds": 300,
         "message": "expired",
     }
+
+
+async def test_validators_should_see_in_place_changes_to_the_payload_value():
+    claim = PrimitiveArrayClaim(
+        "key", lambda _, __, ___: ["a", "b", "c"]  # type: ignore
+    )
+    payload = await claim.build("user_id", DEFAULT_TENANT_ID)
+    validator = claim.validators.includes("d")
+
+    res = await validator.validate(payload, {})
+    assert res.is_valid is False
+
+    payload["key"]["v"].append("d")
+    res = await validator.validate(payload, {})
+    assert res.is_valid is True
@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+from pytest import mark
+
+from supertokens_python.recipe.session.claims import BooleanClaim, PrimitiveClaim
+from supertokens_python.recipe.session.recipe_implementation import (
+    RecipeImplementation,
+)
+
+pytestmark = mark.asyncio
+
+
+async def test_should_refetch_claims_concurrently():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch_value(value: Any):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return value
+
+    claim_a = PrimitiveClaim("claim-a", lambda _, __, ___: fetch_value("a"))
+    claim_b = PrimitiveClaim("claim-b", lambda _, __, ___: fetch_value("b"))
+    claim_c = BooleanClaim("claim-c", lambda _, __, ___: fetch_value(True))
+
+    recipe_implementation = RecipeImplementation(MagicMock(), MagicMock(), MagicMock())
+    res = await recipe_implementation.validate_claims(
+        "userId",
+        {},
+        [
+            claim_a.validators.has_value("a"),
+            claim_b.validators.has_value("b"),
+            claim_c.validators.has_value(True),
+        ],
+        {},
+    )
+
+    assert max_in_flight == 3
+    assert res.invalid_claims == []
+    assert res.access_token_payload_update is not None
+    assert list(res.access_token_payload_update.keys()) == [
+        "claim-a",
+        "claim-b",
+        "claim-c",
+    ]
+
+
+async def test_should_fetch_a_claim_once_for_multiple_validators():
+    fetch_value = MagicMock(return_value="a")
+    claim = PrimitiveClaim("claim-a", fetch_value)
+
+    recipe_implementation = RecipeImplementation(MagicMock(), MagicMock(), MagicMock())
+    user_context: Dict[str, Any] = {}
+    res = await recipe_implementation.validate_claims(
+        "userId",
+        {},
+        [claim.validators.has_value("a"), claim.validators.has_value("b")],
+        user_context,
+    )
+
+    fetch_value.assert_called_once_with("userId", "public", user_context)
+    assert len(res.invalid_claims) == 1
@@ -0,0 +1,319 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from http.cookies import SimpleCookie
+from itertools import product
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+from urllib.parse import quote
+
+from fastapi import Request, Response
+from flask import Response as FlaskWrapperResponse
+
+from supertokens_python.framework.fastapi import fastapi_response
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.framework.flask.flask_response import FlaskResponse
+from supertokens_python.framework import BaseResponse
+from supertokens_python.framework import request as request_module
+from supertokens_python.framework.request import parse_cookie_header_allow_duplicates
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe.session.cookie_and_header import (
+    anti_csrf_response_mutator,
+    apply_response_mutators,
+    build_set_cookie_header,
+    clear_session_mutator,
+    get_token,
+    has_multiple_cookies_for_token_type,
+    token_response_mutator,
+)
+from tests.benchmark import benchmark, write_benchmark_report
+
+
+def make_request(cookie_header: Optional[str]) -> FastApiRequest:
+    headers: List[tuple] = []  # type: ignore
+    if cookie_header is not None:
+        headers.append((b"cookie", cookie_header.encode("latin-1")))
+    return FastApiRequest(
+        Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+    )
+
+
+def make_config(cookie_domain: Optional[str] = None) -> Any:
+    return SimpleNamespace(
+        cookie_secure=True,
+        cookie_domain=cookie_domain,
+        refresh_token_path=NormalisedURLPath("/auth/session/refresh"),
+        get_cookie_same_site=lambda *_: "lax",  # type: ignore
+    )
+
+
+def realistic_cookie_header() -> str:
+    # ~4KB, which is what a browser typically sends for an app with analytics,
+    # consent and session cookies.
+    cookies = [f"_analytics_{i}=GA1.2.{i * 7919}.{i * 104729}" for i in range(80)]
+    cookies.append("sAccessToken=" + "a" * 1000 + "%3D")
+    cookies.append("sRefreshToken=" + "r" * 300)
+    cookies.append("consent=%7B%22necessary%22%3Atrue%7D")
+    return "; ".join(cookies)
+
+
+def test_parse_cookie_header_allow_duplicates():
+    assert parse_cookie_header_allow_duplicates(
+        'a=1; b="quoted\\054\\"value"; a=2; c=x%3Dy; d=e=f; invalid; '
+    ) == {
+        "a": ["1", "2"],
+        "b": ['quoted,"value'],
+        "c": ["x=y"],
+        "d": ["e=f"],
+    }
+
+
+def test_cookie_header_is_parsed_once_per_request():
+    req = make_request("sAccessToken=at%3D; sRefreshToken=rt; sRefreshToken=rt2")
+
+    with patch.object(
+        request_module,
+        "parse_cookie_header_allow_duplicates",
+        wraps=parse_cookie_header_allow_duplicates,
+    ) as parse:
+        assert get_token(req, "access", "cookie") == "at="
+        assert get_token(req, "refresh", "cookie") == "rt2"
+        assert has_multiple_cookies_for_token_type(req, "access") is False
+        assert has_multiple_cookies_for_token_type(req, "refresh") is True
+        assert parse.call_count == 1
+
+
+def test_request_without_cookie_header():
+    req = make_request(None)
+    assert get_token(req, "access", "cookie") is None
+    assert has_multiple_cookies_for_token_type(req, "refresh") is False
+
+
+def test_cookies_are_parsed_once_across_lookups():
+    req = make_request(realistic_cookie_header())
+
+    with patch.object(
+        request_module,
+        "parse_cookie_header_allow_duplicates",
+        wraps=parse_cookie_header_allow_duplicates,
+    ) as parse:
+        for _ in range(6):
+            cookies = req.get_cookies_allow_duplicates()
+            assert cookies["sAccessToken"] == ["a" * 1000 + "="]
+        assert has_multiple_cookies_for_token_type(req, "access") is False
+        assert parse.call_count == 1
+
+
+@benchmark
+def test_benchmark_cookie_lookups():
+    cookie_header = realistic_cookie_header()
+    iterations = 200
+    # Number of cookie lookups done by a typical get_session + refresh flow
+    lookups_per_request = 6
+
+    start = perf_counter()
+    for _ in range(iterations):
+        for _ in range(lookups_per_request):
+            parse_cookie_header_allow_duplicates(cookie_header).get("sAccessToken")
+    parse_every_time = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(iterations):
+        req = make_request(cookie_header)
+        for _ in range(lookups_per_request):
+            get_token(req, "access", "cookie")
+    parse_once = perf_counter() - start
+
+    write_benchmark_report(
+        f"Cookie lookups per request ({len(cookie_header)} byte cookie header)",
+        f"parse every time {parse_every_time / iterations * 1e6:.1f}us\n"
+        f"parse once {parse_once / iterations * 1e6:.1f}us",
+    )
+
+
+def test_last_value_is_used_for_duplicate_cookies():
+    req = make_request("sAccessToken=first; sAccessToken=second")
+    assert get_token(req, "access", "cookie") == "second"
+    assert req.get_cookies_allow_duplicates() == {"sAccessToken": ["first", "second"]}
+
+
+def test_set_cookie_header_matches_simple_cookie_output():
+    header = build_set_cookie_header(
+        "sAccessToken", "a b=c", 1700000000123, "/", None, True, "lax"
+    )
+
+    expected = SimpleCookie()
+    expected["sAccessToken"] = "a%20b%3Dc"
+    expected["sAccessToken"]["expires"] = "Tue, 14 Nov 2023 22:13:20 GMT"
+    expected["sAccessToken"]["path"] = "/"
+    expected["sAccessToken"]["secure"] = True
+    expected["sAccessToken"]["httponly"] = True
+    expected["sAccessToken"]["samesite"] = "lax"
+    assert header == expected.output(header="").strip()
+
+    assert (
+        build_set_cookie_header(
+            "sRefreshToken",
+            "",
+            0,
+            "/auth/session/refresh",
+            ".example.com",
+            False,
+            "none",
+        )
+        == 'sRefreshToken=""; Domain=.example.com; expires=Thu, 01 Jan 1970 00:00:00 GMT; '
+        "HttpOnly; Path=/auth/session/refresh; SameSite=none"
+    )
+
+
+def test_set_cookie_header_matches_starlette_set_cookie():
+    now = 1700000000
+    with patch("time.time", lambda: now), patch.object(
+        fastapi_response, "get_timestamp_ms", lambda: now * 1000
+    ):
+        for value, expires, path, domain, secure, same_site in product(
+            ["at", "a b=c/ü", ""],
+            [now * 1000 + 3600 * 1000, 0],
+            ["/", "/auth/session/refresh"],
+            [None, ".example.com"],
+            [True, False],
+            ["lax", "strict", "none"],
+        ):
+            response = FastApiResponse(Response())
+            response.set_cookie(
+                "sAccessToken",
+                quote(value, encoding="utf-8"),
+                expires,
+                path,
+                domain,
+                secure,
+                httponly=True,
+                samesite=same_site,
+            )
+            assert (
+                build_set_cookie_header(
+                    "sAccessToken", value, expires, path, domain, secure, same_site
+                )
+                == response.response.headers["set-cookie"]
+            )
+
+
+def test_base_response_subclasses_dont_need_add_set_cookie_header():
+    assert "add_set_cookie_header" not in BaseResponse.__abstractmethods__
+    assert FlaskResponse.supports_set_cookie_header is False
+
+
+def test_flask_uses_its_own_set_cookie():
+    config = make_config(".example.com")
+    req = make_request(None)
+    response = FlaskResponse(FlaskWrapperResponse())
+
+    apply_response_mutators(
+        [
+            token_response_mutator(
+                config, "access", "a b=c", 1700000000123, "cookie", req
+            ),
+            token_response_mutator(config, "refresh", "", 0, "cookie", req),
+        ],
+        response,
+        {},
+    )
+
+    assert response.response.headers.getlist("Set-Cookie") == [
+        "sAccessToken=a%20b%3Dc; Domain=example.com; Expires=Tue, 14 Nov 2023 22:13:20 GMT; "
+        "Secure; HttpOnly; Path=/; SameSite=Lax",
+        "sRefreshToken=; Domain=example.com; Expires=Thu, 01 Jan 1970 00:00:00 GMT; "
+        "Secure; HttpOnly; Path=/auth/session/refresh; SameSite=Lax",
+    ]
+
+
+def test_response_mutators_are_collapsed_before_being_applied():
+    config = make_config()
+    req = make_request(None)
+    response = FastApiResponse(Response())
+
+    apply_response_mutators(
+        [
+            token_response_mutator(config, "access", "at1", 1, "cookie", req),
+            anti_csrf_response_mutator("csrf1"),
+            token_response_mutator(config, "refresh", "rt1", 1, "cookie", req),
+            token_response_mutator(config, "access", "at2", 2000, "cookie", req),
+            anti_csrf_response_mutator("csrf2"),
+        ],
+        response,
+        {},
+    )
+
+    assert response.response.headers.getlist("set-cookie") == [
+        "sAccessToken=at2; expires=Thu, 01 Jan 1970 00:00:02 GMT; HttpOnly; Path=/; SameSite=lax; Secure",
+        "sRefreshToken=rt1; expires=Thu, 01 Jan 1970 00:00:00 GMT; HttpOnly; Path=/auth/session/refresh; SameSite=lax; Secure",
+    ]
+    assert response.get_header("anti-csrf") == "csrf2"
+    # Like before, writes to comma separated headers are appended
+    assert response.get_header("Access-Control-Expose-Headers") == "anti-csrf,anti-csrf"
+
+    response = FastApiResponse(Response())
+    response.set_header("Access-Control-Expose-Headers", "x-custom")
+    apply_response_mutators(
+        [
+            anti_csrf_response_mutator("csrf"),
+            clear_session_mutator(config, "header", req),
+        ],
+        response,
+        {},
+    )
+
+    assert response.get_header("anti-csrf") is None
+    assert response.get_header("st-access-token") == ""
+    assert response.get_header("front-token") == "remove"
+    assert (
+        response.get_header("Access-Control-Expose-Headers")
+        == "x-custom,anti-csrf,st-access-token,st-refresh-token,front-token"
+    )
+
+
+def test_mutators_written_against_base_response_still_work():
+    config = make_config()
+    req = make_request(None)
+    response = FastApiResponse(Response())
+
+    def custom_mutator(response: BaseResponse, _: Dict[str, Any]):
+        # Sees the changes of the mutators before it
+        assert response.get_header("anti-csrf") == "csrf1"
+        response.set_status_code(201)
+        response.set_header("anti-csrf", "custom")
+        response.set_cookie("custom", "1", expires=0, httponly=False, samesite="strict")
+
+    apply_response_mutators(
+        [
+            anti_csrf_response_mutator("csrf1"),
+            custom_mutator,
+            token_response_mutator(config, "access", "at", 2000, "cookie", req),
+        ],
+        response,
+        {},
+    )
+
+    assert response.response.status_code == 201
+    assert response.get_header("anti-csrf") == "custom"
+    assert [
+        c.split(";")[0] for c in response.response.headers.getlist("set-cookie")
+    ] == ["custom=1", "sAccessToken=at"]
+
+    # SDK mutators can also be called with a response directly
+    response = FastApiResponse(Response())
+    anti_csrf_response_mutator("csrf")(response, {})
+    assert response.get_header("anti-csrf") == "csrf"
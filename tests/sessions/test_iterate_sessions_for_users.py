@@ -0,0 +1,52 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+from pytest import mark
+
+from supertokens_python.recipe.session import asyncio as session_asyncio
+from supertokens_python.recipe.session.asyncio import iterate_sessions_for_users
+
+pytestmark = mark.asyncio
+
+
+async def get_all_session_handles_for_user(
+    user_id: str, _tenant_id: Optional[str], _user_context: Dict[str, Any]
+) -> List[str]:
+    await asyncio.sleep(0)
+    return [f"{user_id}-1", f"{user_id}-2"]
+
+
+async def test_stopping_early_waits_for_the_cancelled_tasks():
+    tasks_before = asyncio.all_tasks()
+
+    with patch.object(
+        session_asyncio,
+        "get_all_session_handles_for_user",
+        get_all_session_handles_for_user,
+    ):
+        # The result queue fills up, so workers are blocked on it when cancelled
+        sessions = iterate_sessions_for_users(
+            [str(i) for i in range(1000)],
+            fetch_session_information=False,
+            max_concurrency=2,
+        )
+        async for session in sessions:
+            assert session.session_handle.startswith(session.user_id)
+            break
+        await sessions.aclose()
+
+    assert asyncio.all_tasks() == tasks_before
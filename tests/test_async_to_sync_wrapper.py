@@ -0,0 +1,88 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+from pytest import raises
+
+from supertokens_python.async_to_sync_wrapper import (
+    get_background_event_loop,
+    run_in_background_loop,
+    sync,
+)
+
+request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+async def get_loop_and_request_id():
+    await asyncio.sleep(0)
+    return asyncio.get_running_loop(), request_id.get()
+
+
+def test_run_in_background_loop_uses_one_loop_for_all_threads():
+    def call(i: int):
+        request_id.set(str(i))
+        return run_in_background_loop(get_loop_and_request_id())
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(call, range(32)))
+
+    assert {loop for loop, _ in results} == {get_background_event_loop()}
+    # Context variables of the calling thread are visible to the coroutine
+    assert [r_id for _, r_id in results] == [str(i) for i in range(32)]
+
+
+def test_run_in_background_loop_when_a_loop_is_running():
+    async def main():
+        # This would fail with run_until_complete without nest_asyncio
+        return run_in_background_loop(get_loop_and_request_id())
+
+    loop, _ = asyncio.run(main())
+    assert loop is get_background_event_loop()
+
+
+def test_sync_uses_the_background_loop():
+    async def main():
+        return sync(get_loop_and_request_id())
+
+    loop, _ = asyncio.run(main())
+    assert loop is get_background_event_loop()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        loops = set(
+            executor.map(lambda _: sync(get_loop_and_request_id())[0], range(8))
+        )
+    assert loops == {get_background_event_loop()}
+
+
+def test_run_in_background_loop_raises_the_coroutine_exception():
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("from the coroutine")
+
+    with raises(ValueError, match="from the coroutine"):
+        run_in_background_loop(fail())
+
+    # The loop keeps running after a coroutine fails
+    loop, _ = run_in_background_loop(get_loop_and_request_id())
+    assert loop is get_background_event_loop()
+
+
+def test_sync_from_the_background_loop_raises_a_clear_error():
+    async def call_sync():
+        return sync(get_loop_and_request_id())
+
+    with raises(Exception, match="background event loop"):
+        run_in_background_loop(call_sync())
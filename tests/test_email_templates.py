@@ -0,0 +1,97 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from pytest import raises
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.ingredients.emaildelivery import EmailDeliveryIngredient
+from supertokens_python.ingredients.emaildelivery.templates import get_email_template
+from supertokens_python.recipe import emailpassword, passwordless, session
+from supertokens_python.recipe.emailpassword.emaildelivery.services.smtp import (
+    password_reset_email,
+)
+from supertokens_python.recipe.emailpassword.recipe import EmailPasswordRecipe
+from supertokens_python.recipe.emailverification.emaildelivery.services.smtp import (
+    email_verify_email,
+)
+from supertokens_python.recipe.passwordless.emaildelivery.services.smtp import (
+    pless_login_email,
+)
+from supertokens_python.recipe.passwordless.recipe import PasswordlessRecipe
+from tests.utils import reset
+
+
+def setup_function(_):
+    reset(stop_core=False)
+
+
+def teardown_function(_):
+    reset(stop_core=False)
+
+
+def test_email_templates_are_read_once():
+    get_email_template.cache_clear()
+
+    for module, names in [
+        (pless_login_email, ["otp_body", "magic_link_body", "otp_and_magic_link_body"]),
+        (password_reset_email, ["html_template"]),
+        (email_verify_email, ["html_template"]),
+    ]:
+        for name in names:
+            template = getattr(module, name)
+            assert template.lstrip().lower().startswith("<!doctype html")
+            assert "${appname}" in template
+            assert getattr(module, name) is template
+
+    info = get_email_template.cache_info()  # pylint: disable=no-value-for-parameter
+    assert info.currsize == 5
+
+    with raises(AttributeError):
+        pless_login_email.unknown_body  # pylint: disable=pointless-statement
+
+
+def test_delivery_ingredients_are_created_on_first_use():
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.supertokens.io",
+            website_domain="http://supertokens.io",
+        ),
+        framework="fastapi",
+        recipe_list=[
+            session.init(),
+            emailpassword.init(),
+            passwordless.init(
+                contact_config=passwordless.ContactEmailOrPhoneConfig(),
+                flow_type="USER_INPUT_CODE",
+            ),
+        ],
+    )
+
+    ep_recipe = EmailPasswordRecipe.get_instance()
+    pless_recipe = PasswordlessRecipe.get_instance()
+    assert ep_recipe._email_delivery is None  # type: ignore
+    assert pless_recipe._email_delivery is None  # type: ignore
+    assert pless_recipe._sms_delivery is None  # type: ignore
+
+    email_delivery = ep_recipe.email_delivery
+    assert email_delivery is ep_recipe.email_delivery
+    assert pless_recipe.sms_delivery is pless_recipe.sms_delivery
+
+    # Ingredients can still be replaced, for example by tests
+    pless_email_delivery = EmailDeliveryIngredient(
+        pless_recipe.config.get_email_delivery_config()
+    )
+    pless_recipe.email_delivery = pless_email_delivery
+    assert pless_recipe.email_delivery is pless_email_delivery
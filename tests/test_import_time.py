@@ -0,0 +1,66 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+DEFERRED_MODULES = [
+    "httpx",
+    "tldextract",
+    "requests",
+    "supertokens_python.framework.fastapi.framework",
+    "supertokens_python.framework.flask.framework",
+    "supertokens_python.framework.django.framework",
+]
+
+
+def get_import_times_in_us(module: str) -> Dict[str, int]:
+    # Returns the cumulative import time of every module imported by a fresh
+    # interpreter while importing `module`
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "module", ["supertokens_python", "supertokens_python.recipe.session"]
+)
+def test_benchmark_import_time(module: str):
+    times = get_import_times_in_us(module)
+
+    print(f"import {module}: {times[module] / 1000:.1f}ms")
+    for deferred in DEFERRED_MODULES:
+        assert deferred not in times, f"{deferred} should be imported on first use"
+
+
+def test_framework_adapter_is_loaded_on_first_use():
+    from supertokens_python.framework.flask.framework import FlaskFramework
+    from supertokens_python.utils import FRAMEWORKS
+
+    assert isinstance(FRAMEWORKS["flask"], FlaskFramework)
+    assert FRAMEWORKS["flask"] is FRAMEWORKS["flask"]
+    with pytest.raises(KeyError):
+        FRAMEWORKS["unknown"]  # pylint: disable=pointless-statement
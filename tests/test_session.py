@@ -45,6 +45,7 @@ from supertokens_python.recipe.session.asyncio import (
     update_session_data_in_database,
 )
 from supertokens_python.recipe.session.interfaces import (
+    CreateNewSessionInput,
     RecipeInterface,
     SessionContainer,
 )
@@ -705,7 +706,10 @@ async def test_token_cookie_expires(
 
 from supertokens_python.recipe.session.asyncio import (
     create_new_session_without_request_response,
+    create_new_sessions_bulk,
     get_session_without_request_response,
+    iterate_sessions_for_users,
+    revoke_sessions_in_bulk,
     refresh_session_without_request_response,
 )
 
@@ -789,6 +793,84 @@ async def test_that_verify_session_doesnt_always_call_core():
     )  # Core got called this time
 
 
+async def test_create_new_sessions_bulk():
+    def override_functions(oi: RecipeInterface) -> RecipeInterface:
+        oi_create_new_session = oi.create_new_session
+
+        async def create_new_session(
+            user_id: str,
+            access_token_payload: Optional[Dict[str, Any]],
+            session_data_in_database: Optional[Dict[str, Any]],
+            disable_anti_csrf: Optional[bool],
+            tenant_id: str,
+            user_context: Dict[str, Any],
+        ):
+            if user_id == "failing-user":
+                raise Exception("failing-user")
+            return await oi_create_new_session(
+                user_id,
+                access_token_payload,
+                session_data_in_database,
+                disable_anti_csrf,
+                tenant_id,
+                user_context,
+            )
+
+        oi.create_new_session = create_new_session
+        return oi
+
+    init(**get_st_init_args([session.init(get_token_transfer_method=lambda *_: "cookie", override=InputOverrideConfig(functions=override_functions))]))  # type: ignore
+    start_st()
+
+    inputs = [
+        CreateNewSessionInput("public", f"user-{i}", {"index": i}) for i in range(20)
+    ]
+    inputs.append(CreateNewSessionInput("public", "failing-user"))
+
+    res = await create_new_sessions_bulk(inputs, max_concurrency=5)
+
+    assert len(res.results) == 21
+    assert res.success_count == 20
+    assert res.error_count == 1
+    assert res.sessions_per_second > 0
+    for i, s in enumerate(res.results[:20]):
+        assert isinstance(s, SessionContainer)
+        assert s.get_user_id() == f"user-{i}"
+        assert s.get_access_token_payload()["index"] == i
+    assert isinstance(res.results[20], Exception)
+
+
+async def test_iterate_sessions_for_users_and_revoke_sessions_in_bulk():
+    init(**get_st_init_args([session.init(get_token_transfer_method=lambda *_: "cookie")]))  # type: ignore
+    start_st()
+
+    user_ids = [f"user-{i}" for i in range(10)]
+    for user_id in user_ids:
+        await create_new_session_without_request_response("public", user_id)
+        await create_new_session_without_request_response("public", user_id)
+
+    sessions = [
+        s async for s in iterate_sessions_for_users(iter(user_ids), max_concurrency=3)
+    ]
+    assert len(sessions) == 20
+    assert sorted({s.user_id for s in sessions}) == sorted(user_ids)
+    for s in sessions:
+        assert s.session_information is not None
+        assert s.session_information.user_id == s.user_id
+
+    async def handles_to_revoke():
+        async for s in iterate_sessions_for_users(
+            user_ids[:5], fetch_session_information=False
+        ):
+            assert s.session_information is None
+            yield s.session_handle
+
+    assert await revoke_sessions_in_bulk(handles_to_revoke(), batch_size=3) == 10
+
+    remaining = [s async for s in iterate_sessions_for_users(user_ids)]
+    assert sorted({s.user_id for s in remaining}) == sorted(user_ids[5:])
+
+
 async def test_anti_csrf_header_via_custom_header_check_happens_only_when_access_token_is_provided(
     driver_config_client: TestClient,
 ):
@@ -7,6 +7,7 @@ from supertokens_python.utils import (
     humanize_time,
     is_version_gte,
     get_top_level_domain_for_same_site_resolution,
+    _get_top_level_domain_for_hostname,  # type: ignore
 )
 from supertokens_python.utils import RWMutex
 
@@ -197,3 +198,18 @@ def test_rw_mutex_writes():
 )
 def test_tld_for_same_site(url: str, res: str):
     assert get_top_level_domain_for_same_site_resolution(url) == res
+
+
+def test_tld_for_same_site_is_cached_per_hostname():
+    _get_top_level_domain_for_hostname.cache_clear()
+
+    for url in [
+        "https://app.example.co.uk",
+        "http://app.example.co.uk:3000/path",
+        "https://app.example.co.uk/other?query=1",
+    ]:
+        assert get_top_level_domain_for_same_site_resolution(url) == "example.co.uk"
+
+    cache_info = _get_top_level_domain_for_hostname.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
@@ -0,0 +1,506 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""A local fake OAuth2 / OIDC provider, and a harness that drives thirdparty
+sign ins against it, so the cost of sign_in_up_post can be measured without
+real IdPs or a SuperTokens core."""
+import asyncio
+import json
+import re
+import time
+from contextlib import ExitStack
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from httpx import AsyncClient, AsyncHTTPTransport, Limits, Request, Response, Timeout
+from jwt import encode  # type: ignore
+from jwt.algorithms import RSAAlgorithm
+
+from supertokens_python.recipe.emailverification.recipe import EmailVerificationRecipe
+from supertokens_python.recipe.multitenancy.interfaces import (
+    EmailPasswordConfig,
+    GetTenantOkResult,
+    PasswordlessConfig,
+    ThirdPartyConfig,
+)
+from supertokens_python.recipe.thirdparty.api import implementation
+from supertokens_python.recipe.thirdparty.api.implementation import (
+    APIImplementation,
+)
+from supertokens_python.recipe.thirdparty.interfaces import (
+    APIOptions,
+    SignInUpOkResult,
+    SignInUpPostOkResult,
+)
+from supertokens_python.recipe.thirdparty.provider import (
+    ProviderClientConfig,
+    ProviderConfig,
+    ProviderInput,
+    RedirectUriInfo,
+)
+from supertokens_python.recipe.thirdparty.providers import (
+    config_utils,
+    custom,
+)
+from supertokens_python.recipe.thirdparty.providers import utils as providers_utils
+from supertokens_python.recipe.thirdparty.providers.config_utils import (
+    MergedProvidersCache,
+    OIDCDiscoveryCache,
+    find_and_create_provider_instance,
+)
+from supertokens_python.recipe.thirdparty.providers.custom import JWKSCache
+from supertokens_python.recipe.thirdparty.providers.utils import (
+    HTTPClientConfig,
+    HTTPClientPool,
+)
+from supertokens_python.recipe.thirdparty.types import ThirdPartyInfo, User
+
+DISCOVERY = "discovery"
+TOKEN = "token"
+JWKS = "jwks"
+USER_INFO = "userinfo"
+CORE = "core"
+# Time not spent waiting for the IdP or the core, like verifying id tokens
+SDK = "sdk"
+TOTAL = "total"
+SIGN_IN_PHASES = [DISCOVERY, TOKEN, JWKS, USER_INFO, CORE, SDK, TOTAL]
+
+KEY_ID = "fake-idp-key"
+OIDC_DISCOVERY_PATH = "/.well-known/openid-configuration"
+
+
+class FakeIdP:
+    """Answers the discovery, token, JWKS and user info requests of every built
+    in provider, whatever host they are sent to. Each response is delayed by
+    `latency_in_sec` to stand in for the round trip to a real IdP."""
+
+    def __init__(self, latency_in_sec: float = 0.0):
+        self.latency_in_sec = latency_in_sec
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        self.requests: List[Tuple[str, str]] = []  # (kind, url)
+        self.connections = 0
+        self._lock = Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def port(self) -> int:
+        assert self._server is not None
+        return self._server.server_address[1]
+
+    def __enter__(self) -> "FakeIdP":
+        idp = self
+
+        class Handler(_FakeIdPRequestHandler):
+            fake_idp = idp
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *_: Any):
+        assert self._server is not None
+        self._server.shutdown()
+        self._server.server_close()
+
+    def add_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def count_requests(self, kind: str) -> int:
+        return len([k for k, _ in self.requests if k == kind])
+
+    @staticmethod
+    def get_kind(method: str, path: str) -> str:
+        if path.endswith(OIDC_DISCOVERY_PATH):
+            return DISCOVERY
+        if path.endswith("/jwks"):
+            return JWKS
+        # GitHub validates the access token with a POST while getting user info
+        if (
+            method == "POST"
+            and re.fullmatch(r"/applications/[^/]+/token", path) is None
+        ):
+            return TOKEN
+        return USER_INFO
+
+    def handle(
+        self, method: str, host: str, path: str, form: Dict[str, str]
+    ) -> Tuple[str, Any]:
+        kind = FakeIdP.get_kind(method, path)
+        with self._lock:
+            self.requests.append((kind, f"https://{host}{path}"))
+        time.sleep(self.latency_in_sec)
+
+        if kind == DISCOVERY:
+            issuer = f"https://{host}{path[: -len(OIDC_DISCOVERY_PATH)]}"
+            return kind, {
+                "issuer": issuer,
+                "authorization_endpoint": f"{issuer}/authorize",
+                "token_endpoint": f"{issuer}/token",
+                "userinfo_endpoint": f"{issuer}/userinfo",
+                "jwks_uri": f"{issuer}/jwks",
+            }
+        if kind == JWKS:
+            jwk = json.loads(RSAAlgorithm.to_jwk(self.private_key.public_key()))  # type: ignore
+            return kind, {"keys": [{**jwk, "kid": KEY_ID, "alg": "RS256"}]}
+        if kind == TOKEN:
+            return kind, {
+                "access_token": "fake-access-token",
+                "id_token": self.create_id_token(host, form.get("client_id", "")),
+            }
+
+        if method == "POST":
+            client_id = path.split("/")[2]
+            return kind, {"app": {"client_id": client_id}}
+        if path.endswith("/user/emails"):
+            email = {"email": "user@example.com"}
+            if host == "api.bitbucket.org":
+                return kind, {
+                    "values": [{**email, "is_primary": True, "is_confirmed": True}]
+                }
+            return kind, [{**email, "primary": True, "verified": True}]
+        # One body that fits the user info mapping of every provider
+        return kind, {
+            "id": "fake-user",
+            "sub": "fake-user",
+            "uuid": "fake-user",
+            "data": {"id": "fake-user"},
+            "email": "user@example.com",
+            "verified": True,
+            "email_verified": True,
+        }
+
+    def create_id_token(self, host: str, client_id: str) -> str:
+        now = int(time.time())
+        return encode(  # type: ignore
+            {
+                "iss": f"https://{host}",
+                "aud": client_id,
+                "sub": "fake-user",
+                "email": "user@example.com",
+                "email_verified": True,
+                "iat": now,
+                "exp": now + 3600,
+            },
+            self.private_key,
+            algorithm="RS256",
+            headers={"kid": KEY_ID},
+        )
+
+
+class _FakeIdPRequestHandler(BaseHTTPRequestHandler):
+    # Keeps connections alive, so the benchmark shows the effect of pooling
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which Nagle's algorithm would
+    # delay until the client's delayed ACK
+    disable_nagle_algorithm = True
+    fake_idp: FakeIdP
+
+    def setup(self):
+        super().setup()
+        self.fake_idp.add_connection()
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self._respond("GET", {})
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers.get("content-length", 0)))
+        form = {k: v[0] for k, v in parse_qs(body.decode()).items()}
+        self._respond("POST", form)
+
+    def _respond(self, method: str, form: Dict[str, str]):
+        kind, body = self.fake_idp.handle(
+            method, self.headers["host"], urlsplit(self.path).path, form
+        )
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(content)))
+        if kind in (DISCOVERY, JWKS):
+            self.send_header("cache-control", "public, max-age=3600")
+        self.end_headers()
+        self.wfile.write(content)
+
+    # Keeps the argument names of BaseHTTPRequestHandler.log_message
+    # pylint: disable=redefined-builtin
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _RedirectToFakeIdPTransport(AsyncHTTPTransport):
+    # Sends requests for any provider host to the fake IdP over plain HTTP. The
+    # Host header still names the provider's host.
+    def __init__(self, port: int, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.port = port
+
+    async def handle_async_request(self, request: Request) -> Response:
+        request.url = request.url.copy_with(
+            scheme="http", host="127.0.0.1", port=self.port
+        )
+        return await super().handle_async_request(request)
+
+
+class _FakeIdPClientPool(HTTPClientPool):
+    def __init__(self, benchmark: "SignInBenchmark", config: HTTPClientConfig):
+        super().__init__(config)
+        self.benchmark = benchmark
+
+    def _create_client(self) -> AsyncClient:
+        config = self._config
+        return AsyncClient(
+            transport=_RedirectToFakeIdPTransport(
+                self.benchmark.idp.port,
+                limits=Limits(
+                    max_connections=config.max_connections_per_host,
+                    max_keepalive_connections=config.max_keepalive_connections_per_host,
+                    keepalive_expiry=config.keepalive_expiry_in_sec,
+                ),
+            ),
+            timeout=Timeout(config.timeout_in_sec),
+        )
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        kind = FakeIdP.get_kind(method, urlsplit(url).path)
+        self.benchmark.start_phase(kind)
+        try:
+            return await super().request(method, url, **kwargs)
+        finally:
+            self.benchmark.end_phase(kind)
+
+
+class _FakeCoreRecipeImplementation:
+    def __init__(self, benchmark: "SignInBenchmark"):
+        self.benchmark = benchmark
+
+    async def sign_in_up(
+        self,
+        third_party_id: str,
+        third_party_user_id: str,
+        email: str,
+        oauth_tokens: Dict[str, Any],
+        raw_user_info_from_provider: Any,
+        tenant_id: str,
+        user_context: Dict[str, Any],
+    ) -> SignInUpOkResult:
+        self.benchmark.start_phase(CORE)
+        await asyncio.sleep(self.benchmark.core_latency_in_sec)
+        self.benchmark.end_phase(CORE)
+        user = User(
+            f"{third_party_id}|{third_party_user_id}",
+            email,
+            0,
+            [tenant_id],
+            ThirdPartyInfo(third_party_user_id, third_party_id),
+        )
+        return SignInUpOkResult(user, False, oauth_tokens, raw_user_info_from_provider)
+
+
+def get_built_in_provider_inputs() -> List[ProviderInput]:
+    """A working config for each provider in recipe/thirdparty/providers"""
+    apple_private_key = (
+        ec.generate_private_key(ec.SECP256R1())
+        .private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        .decode()
+    )
+    additional_configs: Dict[str, Dict[str, Any]] = {
+        "active-directory": {"directoryId": "fake-directory"},
+        "apple": {"keyId": "key", "teamId": "team", "privateKey": apple_private_key},
+        "boxy-saml": {"boxyURL": "https://boxy.example.com"},
+        "okta": {"oktaDomain": "https://fake.okta.com"},
+    }
+    third_party_ids = [
+        "active-directory",
+        "apple",
+        "bitbucket",
+        "boxy-saml",
+        "discord",
+        "facebook",
+        "github",
+        "gitlab",
+        "google",
+        "google-workspaces",
+        "linkedin",
+        "okta",
+        "twitter",
+    ]
+    return [
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id=third_party_id,
+                clients=[
+                    ProviderClientConfig(
+                        client_id=f"{third_party_id}-client",
+                        client_secret=None if third_party_id == "apple" else "secret",
+                        additional_config=additional_configs.get(third_party_id),
+                    )
+                ],
+            )
+        )
+        for third_party_id in third_party_ids
+    ]
+
+
+class SignInBenchmark:
+    """Drives sign_in_up_post against a FakeIdP, with SDK caches that start out
+    empty and a fake core that takes `core_latency_in_sec` per call. Sign ins
+    have to be run one at a time, since the time of each phase is added to
+    the sign in that is running."""
+
+    def __init__(
+        self,
+        idp: FakeIdP,
+        providers: List[ProviderInput],
+        core_latency_in_sec: float = 0.0,
+        http_client_config: Optional[HTTPClientConfig] = None,
+    ):
+        self.idp = idp
+        self.providers = providers
+        self.core_latency_in_sec = core_latency_in_sec
+        self.http_client_pool = _FakeIdPClientPool(
+            self, http_client_config or HTTPClientConfig()
+        )
+        self.merged_providers_cache = MergedProvidersCache(providers)
+        self.tenant_config = GetTenantOkResult(
+            emailpassword=EmailPasswordConfig(False),
+            passwordless=PasswordlessConfig(False),
+            third_party=ThirdPartyConfig(True, []),
+            core_config={},
+        )
+        self.api_options = APIOptions(
+            None,  # type: ignore
+            None,  # type: ignore
+            "thirdparty",
+            None,  # type: ignore
+            _FakeCoreRecipeImplementation(self),  # type: ignore
+            providers,
+            None,  # type: ignore
+        )
+        self._timings: Dict[str, float] = {}
+        # phase -> (requests of the phase in flight, when the first one started)
+        self._in_flight: Dict[str, Tuple[int, float]] = {}
+        self._exit_stack = ExitStack()
+
+    async def __aenter__(self) -> "SignInBenchmark":
+        async def create_new_session(*_: Any, **__: Any) -> Any:
+            self.start_phase(CORE)
+            await asyncio.sleep(self.core_latency_in_sec)
+            self.end_phase(CORE)
+            return None
+
+        for target, name, value in [
+            (providers_utils, "http_client_pool", self.http_client_pool),
+            (config_utils, "oidc_discovery_cache", OIDCDiscoveryCache()),
+            (custom, "jwks_cache", JWKSCache()),
+            (implementation, "create_new_session", create_new_session),
+            (EmailVerificationRecipe, "get_instance_optional", lambda: None),
+        ]:
+            self._exit_stack.enter_context(patch.object(target, name, value))
+        return self
+
+    async def __aexit__(self, *_: Any):
+        await self.http_client_pool.aclose()
+        self._exit_stack.close()
+
+    def start_phase(self, phase: str):
+        count, start = self._in_flight.get(phase, (0, time.perf_counter()))
+        self._in_flight[phase] = (count + 1, start)
+
+    def end_phase(self, phase: str):
+        # Concurrent requests of a phase, like GitHub's user and emails
+        # requests, count once for the time they overlap
+        count, start = self._in_flight[phase]
+        if count > 1:
+            self._in_flight[phase] = (count - 1, start)
+            return
+        del self._in_flight[phase]
+        elapsed = (time.perf_counter() - start) * 1000
+        self._timings[phase] = self._timings.get(phase, 0.0) + elapsed
+
+    async def sign_in(self, third_party_id: str) -> Dict[str, float]:
+        """Signs in with the provider, the way the sign in up API does, and
+        returns the time spent in each of SIGN_IN_PHASES, in milliseconds"""
+        self._timings = {phase: 0.0 for phase in SIGN_IN_PHASES}
+        self.start_phase(TOTAL)
+
+        provider = await find_and_create_provider_instance(
+            self.merged_providers_cache.get_merged_providers(
+                "public", self.tenant_config
+            ),
+            third_party_id,
+            None,
+            {},
+        )
+        assert provider is not None
+        result = await APIImplementation().sign_in_up_post(
+            provider,
+            RedirectUriInfo(
+                "https://example.com/auth/callback",
+                {"code": "fake-code"},
+                "fake-pkce-code-verifier",
+            ),
+            None,
+            "public",
+            self.api_options,
+            {},
+        )
+        assert isinstance(result, SignInUpPostOkResult), result
+
+        self.end_phase(TOTAL)
+        self._timings[SDK] = self._timings[TOTAL] - sum(
+            self._timings[phase]
+            for phase in SIGN_IN_PHASES
+            if phase not in (SDK, TOTAL)
+        )
+        return self._timings
+
+    async def run(self, sign_ins_per_provider: int) -> Dict[str, Dict[str, float]]:
+        """Signs in with every provider `sign_ins_per_provider` times, and
+        returns the average time of each phase per provider. The first sign in
+        of each provider is left out of the averages, and reported separately
+        as `<third party id> (first)`."""
+        report: Dict[str, Dict[str, float]] = {}
+        for provider in self.providers:
+            third_party_id = provider.config.third_party_id
+            report[f"{third_party_id} (first)"] = await self.sign_in(third_party_id)
+            totals = {phase: 0.0 for phase in SIGN_IN_PHASES}
+            for _ in range(sign_ins_per_provider - 1):
+                for phase, time_in_ms in (await self.sign_in(third_party_id)).items():
+                    totals[phase] += time_in_ms
+            report[third_party_id] = {
+                phase: total / max(sign_ins_per_provider - 1, 1)
+                for phase, total in totals.items()
+            }
+        return report
+
+
+def format_report(report: Dict[str, Dict[str, float]]) -> str:
+    lines = [f"{'provider':<28}" + "".join(f"{phase:>11}" for phase in SIGN_IN_PHASES)]
+    for name, timings in report.items():
+        lines.append(
+            f"{name:<28}"
+            + "".join(f"{timings[phase]:>9.2f}ms" for phase in SIGN_IN_PHASES)
+        )
+    return "\n".join(lines)
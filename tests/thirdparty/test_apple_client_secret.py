@@ -0,0 +1,139 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from collections import OrderedDict
+from typing import Any, Dict
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from jwt import decode  # type: ignore
+from pytest import fixture, mark
+
+from supertokens_python.recipe.thirdparty.provider import (
+    ProviderClientConfig,
+    ProviderConfig,
+    ProviderInput,
+)
+from supertokens_python.recipe.thirdparty.providers import apple
+from supertokens_python.recipe.thirdparty.providers.apple import Apple
+
+pytestmark = mark.asyncio
+
+
+def make_private_key() -> Any:
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+def to_config_pem(private_key: Any) -> str:
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    # Keys are usually configured with escaped new lines
+    return pem.replace("\n", "\\n")
+
+
+def make_apple(client_id: str, private_key: str):
+    return Apple(
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id="apple",
+                clients=[
+                    ProviderClientConfig(
+                        client_id=client_id,
+                        additional_config={
+                            "keyId": "key-id",
+                            "teamId": "team-id",
+                            "privateKey": private_key,
+                        },
+                    )
+                ],
+            )
+        )
+    )
+
+
+@fixture
+def now():
+    clock = {"now": 1_700_000_000.0}
+    with patch.object(apple, "time", lambda: clock["now"]), patch.object(
+        apple, "_client_secrets", OrderedDict()
+    ):
+        yield clock
+
+
+async def get_client_secret(provider: Any) -> str:
+    config = await provider.get_config_for_client_type(None, {})
+    return config.client_secret
+
+
+async def test_client_secret_is_reused_until_shortly_before_it_expires(
+    now: Dict[str, float]
+):
+    private_key = make_private_key()
+    pem = to_config_pem(private_key)
+    provider = make_apple("com.example.app", pem)
+
+    client_secret = await get_client_secret(provider)
+    payload = decode(  # type: ignore
+        client_secret,
+        private_key.public_key(),
+        algorithms=["ES256"],
+        audience="https://appleid.apple.com",
+        options={"verify_exp": False, "verify_iat": False},
+    )
+    assert payload["iss"] == "team-id"
+    assert payload["sub"] == "com.example.app"
+    assert payload["exp"] == now["now"] + 86400 * 180
+
+    # Other provider instances with the same config share it
+    assert await get_client_secret(make_apple("com.example.app", pem)) == client_secret
+
+    now["now"] += 86400 * 178
+    assert await get_client_secret(provider) == client_secret
+
+    now["now"] += 86400 * 1.5
+    new_client_secret = await get_client_secret(provider)
+    assert new_client_secret != client_secret
+    assert await get_client_secret(provider) == new_client_secret
+
+
+async def test_client_secret_is_cached_per_client_and_key(
+    now: Dict[str, float]  # pylint: disable=unused-argument
+):
+    pem = to_config_pem(make_private_key())
+    client_secret = await get_client_secret(make_apple("com.example.app", pem))
+
+    other_client = await get_client_secret(make_apple("com.example.other", pem))
+    assert other_client != client_secret
+
+    rotated_pem = to_config_pem(make_private_key())
+    rotated_key = await get_client_secret(make_apple("com.example.app", rotated_pem))
+    assert rotated_key != client_secret
+
+
+async def test_client_secret_cache_is_bounded_and_doesnt_hold_private_keys(
+    now: Dict[str, float]
+):
+    pem = to_config_pem(make_private_key())
+    for i in range(apple.CLIENT_SECRET_CACHE_SIZE + 10):
+        await get_client_secret(make_apple(f"com.example.app{i}", pem))
+    assert len(apple._client_secrets) == apple.CLIENT_SECRET_CACHE_SIZE  # type: ignore
+    assert all(pem not in key for key in apple._client_secrets)  # type: ignore
+
+    # Expired secrets are dropped when a new one is cached
+    now["now"] += 86400 * 181
+    await get_client_secret(make_apple("com.example.app", pem))
+    assert len(apple._client_secrets) == 1  # type: ignore
@@ -0,0 +1,215 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from itertools import product
+from typing import Any, Dict, List, Optional
+from types import SimpleNamespace
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from pytest import fixture, mark
+
+from supertokens_python.recipe.multitenancy.interfaces import (
+    EmailPasswordConfig,
+    GetTenantOkResult,
+    PasswordlessConfig,
+    ThirdPartyConfig,
+)
+from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
+from supertokens_python.recipe.thirdparty.provider import (
+    ProviderClientConfig,
+    ProviderConfig,
+    ProviderConfigForClient,
+    ProviderInput,
+)
+from supertokens_python.recipe.thirdparty.providers import custom
+from supertokens_python.recipe.thirdparty.providers.config_utils import (
+    MergedProvidersCache,
+)
+from supertokens_python.recipe.thirdparty.providers.custom import (
+    GenericProvider,
+    NewProvider,
+)
+from supertokens_python.recipe.thirdparty.recipe_implementation import (
+    RecipeImplementation,
+)
+from supertokens_python.recipe.thirdparty.providers.utils import (
+    DEV_OAUTH_AUTHORIZATION_URL,
+    get_actual_client_id_from_development_client_id,
+    is_using_oauth_development_client_id,
+)
+
+pytestmark = mark.asyncio
+
+
+@fixture(autouse=True)
+def fixed_pkce():
+    with patch.object(
+        custom.pkce, "generate_pkce_pair", lambda _: ("verifier", "challenge+/=")
+    ):
+        yield
+
+
+def encode_every_time(config: ProviderConfigForClient, redirect_uri: str) -> str:
+    # How the authorisation URL was built before it was precomputed
+    query_params: Dict[str, Any] = {
+        "client_id": config.client_id,
+        "redirect_uri": redirect_uri,
+        "response_type": "code",
+    }
+    if config.scope is not None:
+        query_params["scope"] = " ".join(config.scope)
+    if config.client_secret is None or config.force_pkce:
+        query_params["code_challenge"] = "challenge+/="
+        query_params["code_challenge_method"] = "S256"
+    if config.authorization_endpoint_query_params is not None:
+        for k, v in config.authorization_endpoint_query_params.items():
+            if v is None:
+                del query_params[k]
+            else:
+                query_params[k] = v
+
+    assert config.authorization_endpoint is not None
+    url = config.authorization_endpoint
+    if is_using_oauth_development_client_id(config.client_id):
+        query_params["client_id"] = get_actual_client_id_from_development_client_id(
+            config.client_id
+        )
+        query_params["actual_redirect_uri"] = url
+        url = DEV_OAUTH_AUTHORIZATION_URL
+
+    url_obj = urlparse(url)
+    qparams = parse_qs(url_obj.query)
+    for k, v in query_params.items():
+        qparams[k] = [v]
+    return url_obj._replace(query=urlencode(qparams, doseq=True)).geturl()
+
+
+def make_provider(
+    endpoint: str,
+    client_id: str,
+    client_secret: Optional[str],
+    scope: Optional[List[str]],
+    extra_params: Optional[Dict[str, Optional[str]]],
+):
+    provider = NewProvider(ProviderInput(config=ProviderConfig(third_party_id="x")))
+    provider.config.authorization_endpoint = endpoint
+    provider.config.client_id = client_id
+    provider.config.client_secret = client_secret
+    provider.config.scope = scope
+    provider.config.authorization_endpoint_query_params = extra_params
+    return provider
+
+
+async def test_urls_are_the_same_as_encoding_every_param_every_time():
+    endpoints = [
+        "https://idp.example.com/oauth/authorize",
+        "https://idp.example.com/authorize?prompt=login&a=1&a=2#fragment",
+    ]
+    client_ids = ["client id&=?", "4398792-dev-client"]
+    client_secrets = [None, "secret"]
+    scopes = [None, ["openid", "email"]]
+    extra_params_list: List[Optional[Dict[str, Optional[str]]]] = [
+        None,
+        {"prompt": "consent", "response_type": "token", "x y": "ü"},
+        {"redirect_uri": "https://fixed.example.com", "code_challenge": None},
+        {"client_id": None, "response_type": None, "redirect_uri": None},
+    ]
+    redirect_uris = ["https://example.com/callback?a=b&c=d", "com.example.app:/cb"]
+
+    for endpoint, client_id, client_secret, scope, extra_params in product(
+        endpoints, client_ids, client_secrets, scopes, extra_params_list
+    ):
+        if (
+            extra_params is not None
+            and "code_challenge" in extra_params
+            and client_secret is not None
+        ):
+            # There is no code_challenge param to remove without PKCE
+            continue
+        provider = make_provider(
+            endpoint, client_id, client_secret, scope, extra_params
+        )
+        for redirect_uri in redirect_uris:
+            result = await provider.get_authorisation_redirect_url(redirect_uri, {})
+            assert result.url_with_query_params == encode_every_time(
+                provider.config, redirect_uri
+            )
+            assert result.pkce_code_verifier == (
+                "verifier" if client_secret is None else None
+            )
+
+
+async def test_template_is_rebuilt_when_the_config_changes():
+    provider = make_provider(
+        "https://idp.example.com/authorize", "client", "secret", ["openid"], None
+    )
+    url = (
+        await provider.get_authorisation_redirect_url("https://a.com", {})
+    ).url_with_query_params
+    assert url == (
+        "https://idp.example.com/authorize?client_id=client"
+        "&redirect_uri=https%3A%2F%2Fa.com&response_type=code&scope=openid"
+    )
+
+    provider.config.scope = ["openid", "email"]
+    provider.config.authorization_endpoint_query_params = {"hd": "example.com"}
+    provider.config.force_pkce = True
+    url = (
+        await provider.get_authorisation_redirect_url("https://b.com", {})
+    ).url_with_query_params
+    assert url == encode_every_time(provider.config, "https://b.com")
+    assert "scope=openid+email" in url and "hd=example.com" in url
+    assert "code_challenge=challenge%2B%2F%3D" in url
+
+
+async def test_template_is_reused_by_the_providers_created_for_each_request():
+    providers = [
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id="custom",
+                clients=[ProviderClientConfig(client_id="client", client_secret="s")],
+                authorization_endpoint="https://idp.example.com/authorize",
+            )
+        )
+    ]
+    recipe_implementation = RecipeImplementation(
+        None, providers, MergedProvidersCache(providers)  # type: ignore
+    )
+    tenant_config = GetTenantOkResult(
+        emailpassword=EmailPasswordConfig(True),
+        passwordless=PasswordlessConfig(True),
+        third_party=ThirdPartyConfig(True, []),
+        core_config={},
+    )
+
+    async def get_tenant(*_: Any, **__: Any) -> GetTenantOkResult:
+        return tenant_config
+
+    mt_recipe = SimpleNamespace(
+        recipe_implementation=SimpleNamespace(get_tenant=get_tenant)
+    )
+    with patch.object(MultitenancyRecipe, "get_instance", lambda: mt_recipe):
+        first = await recipe_implementation.get_provider("custom", None, "public", {})
+        second = await recipe_implementation.get_provider("custom", None, "public", {})
+
+    assert isinstance(first, GenericProvider) and isinstance(second, GenericProvider)
+    assert first is not second
+    assert first._get_authorisation_url_template(False) is (  # type: ignore
+        second._get_authorisation_url_template(False)  # type: ignore
+    )
+    assert (
+        await first.get_authorisation_redirect_url("https://a.com", {})
+    ).url_with_query_params == (
+        await second.get_authorisation_redirect_url("https://a.com", {})
+    ).url_with_query_params
@@ -0,0 +1,137 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import List
+from unittest.mock import patch
+
+import respx
+from asgiref.sync import async_to_sync
+from httpx import AsyncClient
+from httpx import ConnectError, Response
+from pytest import fixture, mark, raises
+
+from supertokens_python.recipe.thirdparty import SignInAndUpFeature
+from supertokens_python.recipe.thirdparty.providers import utils
+from supertokens_python.recipe.thirdparty.providers.utils import (
+    HTTPClientConfig,
+    HTTPClientPool,
+    do_get_request,
+    do_post_request,
+)
+from supertokens_python.recipe.thirdparty.utils import (
+    validate_and_normalise_user_input,
+)
+
+pytestmark = mark.asyncio
+
+
+@fixture
+def pool():
+    pool = HTTPClientPool(HTTPClientConfig(timeout_in_sec=2))
+    with patch.object(utils, "http_client_pool", pool):
+        yield pool
+
+
+async def test_clients_are_reused_per_host(pool: HTTPClientPool):
+    client = pool.get_client("https://api.github.com/user")
+    assert pool.get_client("https://api.github.com/user/emails") is client
+    assert pool.get_client("https://github.com/login/oauth") is not client
+    assert client.timeout.read == 2
+
+    await pool.aclose()
+    assert client.is_closed
+    new_client = pool.get_client("https://api.github.com/user")
+    assert new_client is not client
+
+    pool.configure(HTTPClientConfig(timeout_in_sec=3))
+    assert pool.get_client("https://api.github.com/user").timeout.read == 3
+    await pool.aclose()
+
+
+@respx.mock
+async def test_requests_use_the_pool_and_record_latency(pool: HTTPClientPool):
+    user_route = respx.get("https://api.github.com/user").mock(
+        return_value=Response(200, json={"id": 1}, headers={"set-cookie": "s=1"})
+    )
+    respx.post("https://github.com/login/oauth/access_token").mock(
+        return_value=Response(200, json={"access_token": "t"})
+    )
+    respx.get("https://down.example.com/user").mock(side_effect=ConnectError)
+
+    for _ in range(3):
+        assert await do_get_request("https://api.github.com/user") == {"id": 1}
+    # Cookies are not shared between the requests made with a pooled client
+    last_call = user_route.calls.last
+    assert last_call is not None
+    assert "cookie" not in last_call.request.headers
+    assert await do_post_request("https://github.com/login/oauth/access_token") == (
+        200,
+        {"access_token": "t"},
+    )
+    with raises(ConnectError):
+        await do_get_request("https://down.example.com/user")
+
+    stats = pool.get_latency_stats()
+    assert stats["api.github.com"].count == 3
+    assert stats["api.github.com"].errors == 0
+    assert stats["github.com"].count == 1
+    assert stats["down.example.com"].errors == 1
+    assert (
+        0
+        <= stats["api.github.com"].get_average_time_in_ms()
+        <= stats["api.github.com"].max_time_in_ms
+    )
+
+    pool.reset_latency_stats()
+    assert pool.get_latency_stats() == {}
+    await pool.aclose()
+
+
+@respx.mock
+def test_requests_from_short_lived_event_loops_share_clients(pool: HTTPClientPool):
+    respx.get("https://api.github.com/user").mock(
+        return_value=Response(200, json={"id": 1})
+    )
+    clients: List[AsyncClient] = []
+    get_client = pool.get_client
+
+    def get_and_record_client(url: str) -> AsyncClient:
+        clients.append(get_client(url))
+        return clients[-1]
+
+    # Like the Django middleware, which runs each request on a new event loop
+    with patch.object(pool, "get_client", get_and_record_client):
+        for _ in range(2):
+            assert async_to_sync(do_get_request)("https://api.github.com/user") == {
+                "id": 1
+            }
+
+    assert len(clients) == 2
+    assert clients[0] is clients[1] and not clients[0].is_closed
+
+    async_to_sync(pool.aclose)()
+    assert clients[0].is_closed
+
+
+def test_http_client_config_is_validated():
+    config = validate_and_normalise_user_input(SignInAndUpFeature())
+    assert config.http_client.max_connections_per_host == 20
+
+    with raises(ValueError):
+        validate_and_normalise_user_input(
+            SignInAndUpFeature(), None, HTTPClientConfig(max_connections_per_host=0)
+        )
+    with raises(ValueError):
+        validate_and_normalise_user_input(
+            SignInAndUpFeature(), None, HTTPClientConfig(timeout_in_sec=0)
+        )
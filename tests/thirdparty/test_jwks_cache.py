@@ -0,0 +1,137 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt import encode  # type: ignore
+from jwt.algorithms import RSAAlgorithm
+from pytest import fixture, mark, raises
+
+from supertokens_python.recipe.thirdparty.providers import custom
+from supertokens_python.recipe.thirdparty.providers.custom import (
+    JWKSCache,
+    verify_id_token_from_jwks_endpoint_and_get_payload,
+)
+
+pytestmark = mark.asyncio
+
+JWKS_URI = "https://idp.example.com/jwks"
+
+
+class FakeJWKSEndpoint:
+    def __init__(self, max_age: Optional[int] = None):
+        self.max_age = max_age
+        self.keys: Dict[str, Any] = {}
+        self.requests = 0
+
+    def add_key(self, kid: str) -> Any:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.keys[kid] = private_key
+        return private_key
+
+    async def get(self, url: str, *_: Any) -> Tuple[Dict[str, Any], Optional[int]]:
+        assert url == JWKS_URI
+        self.requests += 1
+        await asyncio.sleep(0.01)
+        keys: List[Dict[str, Any]] = []
+        for kid, private_key in self.keys.items():
+            jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))  # type: ignore
+            keys.append({**jwk, "kid": kid, "alg": "RS256", "use": "sig"})
+        return {"keys": keys}, self.max_age
+
+    def sign(self, kid: str) -> str:
+        return encode(  # type: ignore
+            {"sub": "user", "aud": "client"},
+            self.keys[kid],
+            algorithm="RS256",
+            headers={"kid": kid},
+        )
+
+
+@fixture
+def endpoint():
+    endpoint = FakeJWKSEndpoint(max_age=600)
+    with patch.object(custom, "jwks_cache", JWKSCache()), patch.object(
+        custom, "do_get_request_with_max_age", endpoint.get
+    ):
+        yield endpoint
+
+
+@fixture
+def now():
+    clock = {"now": 1_000_000}
+    with patch.object(custom, "get_timestamp_ms", lambda: clock["now"]):
+        yield clock
+
+
+async def verify(id_token: str) -> Dict[str, Any]:
+    return await verify_id_token_from_jwks_endpoint_and_get_payload(
+        id_token, JWKS_URI, "client"
+    )
+
+
+async def test_keys_are_fetched_once(endpoint: FakeJWKSEndpoint):
+    endpoint.add_key("k1")
+    endpoint.add_key("k2")
+
+    payloads = await asyncio.gather(
+        *[verify(endpoint.sign("k1")) for _ in range(10)],
+        *[verify(endpoint.sign("k2")) for _ in range(10)],
+    )
+    assert all(p["sub"] == "user" for p in payloads)
+    assert endpoint.requests == 1
+
+
+async def test_unknown_kid_refetches_keys_with_a_cooldown(
+    endpoint: FakeJWKSEndpoint, now: Dict[str, int]
+):
+    endpoint.add_key("k1")
+    await verify(endpoint.sign("k1"))
+
+    # The provider rotates its keys
+    endpoint.add_key("k2")
+    with raises(Exception):
+        await verify(endpoint.sign("k2"))
+    assert endpoint.requests == 1
+
+    now["now"] += 31_000
+    assert (await verify(endpoint.sign("k2")))["sub"] == "user"
+    assert endpoint.requests == 2
+
+    # A kid the provider doesn't have is refetched once per cooldown
+    endpoint.add_key("k3")
+    token = endpoint.sign("k3")
+    del endpoint.keys["k3"]
+    now["now"] += 31_000
+    for _ in range(5):
+        with raises(Exception):
+            await verify(token)
+    assert endpoint.requests == 3
+
+
+async def test_keys_expire_after_their_max_age(
+    endpoint: FakeJWKSEndpoint, now: Dict[str, int]
+):
+    endpoint.add_key("k1")
+    await verify(endpoint.sign("k1"))
+    now["now"] += 599_000
+    await verify(endpoint.sign("k1"))
+    assert endpoint.requests == 1
+
+    now["now"] += 2_000
+    await verify(endpoint.sign("k1"))
+    assert endpoint.requests == 2
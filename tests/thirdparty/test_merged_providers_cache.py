@@ -0,0 +1,138 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict, List, Optional
+
+from pytest import mark
+
+from supertokens_python.recipe.multitenancy.interfaces import (
+    EmailPasswordConfig,
+    GetTenantOkResult,
+    PasswordlessConfig,
+    ThirdPartyConfig,
+)
+from supertokens_python.recipe.thirdparty.provider import (
+    Provider,
+    ProviderClientConfig,
+    ProviderConfig,
+    ProviderConfigForClient,
+    ProviderInput,
+)
+from supertokens_python.recipe.thirdparty.providers.config_utils import (
+    MergedProvidersCache,
+    find_and_create_provider_instance,
+)
+
+pytestmark = mark.asyncio
+
+
+def make_tenant_config(providers: List[ProviderConfig]) -> GetTenantOkResult:
+    return GetTenantOkResult(
+        emailpassword=EmailPasswordConfig(True),
+        passwordless=PasswordlessConfig(True),
+        third_party=ThirdPartyConfig(True, providers),
+        core_config={},
+    )
+
+
+def make_static_providers() -> List[ProviderInput]:
+    def override(original_implementation: Provider) -> Provider:
+        original_get_config = original_implementation.get_config_for_client_type
+
+        async def get_config_for_client_type(
+            client_type: Optional[str], user_context: Dict[str, Any]
+        ) -> ProviderConfigForClient:
+            config = await original_get_config(client_type, user_context)
+            if "client_id" in user_context:
+                config.client_id = user_context["client_id"]
+            return config
+
+        original_implementation.get_config_for_client_type = get_config_for_client_type  # type: ignore
+        return original_implementation
+
+    return [
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id="discord",
+                clients=[
+                    ProviderClientConfig(
+                        client_type="web", client_id="web-id", client_secret="s"
+                    ),
+                    ProviderClientConfig(client_type="android", client_id="android-id"),
+                ],
+            ),
+            override=override,
+        ),
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id="github",
+                clients=[ProviderClientConfig(client_id="gh-id", client_secret="s")],
+            )
+        ),
+    ]
+
+
+async def test_merged_providers_are_reused_for_the_same_tenant_config():
+    cache = MergedProvidersCache(make_static_providers())
+    tenant_config = make_tenant_config([])
+
+    merged_providers = cache.get_merged_providers("t1", tenant_config)
+    assert [p.config.third_party_id for p in merged_providers] == [
+        "discord",
+        "github",
+    ]
+    assert cache.get_merged_providers("t1", tenant_config) is merged_providers
+
+    # A new tenant config object means it was fetched from the core again
+    new_tenant_config = make_tenant_config(
+        [
+            ProviderConfig(
+                third_party_id="github",
+                clients=[ProviderClientConfig(client_id="core-gh-id")],
+            )
+        ]
+    )
+    new_merged_providers = cache.get_merged_providers("t1", new_tenant_config)
+    assert new_merged_providers is not merged_providers
+    assert [p.config.third_party_id for p in new_merged_providers] == ["github"]
+
+    # Other tenants have their own entries
+    assert cache.get_merged_providers("t2", tenant_config) is not (new_merged_providers)
+
+
+async def test_provider_config_is_resolved_on_every_request():
+    cache = MergedProvidersCache(make_static_providers())
+    merged_providers = cache.get_merged_providers("t1", make_tenant_config([]))
+
+    web = await find_and_create_provider_instance(
+        merged_providers, "discord", "web", {}
+    )
+    assert web is not None and web.config.client_id == "web-id"
+
+    # An override of get_config_for_client_type can use the user_context of
+    # each request
+    web_for_request = await find_and_create_provider_instance(
+        merged_providers, "discord", "web", {"client_id": "request-id"}
+    )
+    assert web_for_request is not None and web_for_request is not web
+    assert web_for_request.config.client_id == "request-id"
+
+    android = await find_and_create_provider_instance(
+        merged_providers, "discord", "android", {}
+    )
+    assert android is not None and android.config.client_id == "android-id"
+
+    assert (
+        await find_and_create_provider_instance(merged_providers, "unknown", None, {})
+        is None
+    )
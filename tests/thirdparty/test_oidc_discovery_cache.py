@@ -0,0 +1,237 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from pytest import fixture, mark
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.recipe import thirdparty
+from supertokens_python.recipe.thirdparty import recipe as thirdparty_recipe
+from supertokens_python.recipe.thirdparty.provider import (
+    Provider,
+    ProviderClientConfig,
+    ProviderConfig,
+    ProviderConfigForClient,
+    ProviderInput,
+)
+from supertokens_python.recipe.thirdparty.providers import config_utils
+from supertokens_python.recipe.thirdparty.providers.config_utils import (
+    OIDCDiscoveryCache,
+    prewarm_oidc_discovery_cache,
+)
+from tests.utils import reset
+
+pytestmark = mark.asyncio
+
+
+class FakeIdP:
+    def __init__(self, max_age: Optional[int] = None):
+        self.max_age = max_age
+        self.requests: List[str] = []
+        self.version = 0
+
+    async def get(self, url: str, *_: Any) -> Tuple[Dict[str, Any], Optional[int]]:
+        self.requests.append(url)
+        await asyncio.sleep(0.01)
+        return {
+            "issuer": url,
+            "token_endpoint": f"{url}/token/{self.version}",
+        }, self.max_age
+
+
+@fixture
+def now():
+    clock = {"now": 1_000_000}
+    with patch.object(config_utils, "get_timestamp_ms", lambda: clock["now"]):
+        yield clock
+
+
+async def test_concurrent_lookups_share_one_request():
+    idp = FakeIdP()
+    cache = OIDCDiscoveryCache()
+
+    with patch.object(config_utils, "do_get_request_with_max_age", idp.get):
+        results = await asyncio.gather(
+            *[cache.get("https://idp.example.com") for _ in range(20)]
+        )
+        assert all(r is results[0] for r in results)
+        assert idp.requests == [
+            "https://idp.example.com/.well-known/openid-configuration"
+        ]
+
+        await cache.get("https://idp.example.com")
+        assert len(idp.requests) == 1
+
+
+async def test_entries_follow_cache_control_and_refresh_in_background(
+    now: Dict[str, int]
+):
+    idp = FakeIdP(max_age=120)
+    cache = OIDCDiscoveryCache()
+
+    with patch.object(config_utils, "do_get_request_with_max_age", idp.get):
+        info = await cache.get("https://idp.example.com")
+        assert info["token_endpoint"].endswith("/0")
+
+        # In the last quarter of its life, the entry is served and refreshed
+        idp.version = 1
+        now["now"] += 100_000
+        info = await cache.get("https://idp.example.com")
+        assert info["token_endpoint"].endswith("/0")
+        await asyncio.sleep(0.05)
+        assert len(idp.requests) == 2
+        info = await cache.get("https://idp.example.com")
+        assert info["token_endpoint"].endswith("/1")
+
+        # Once expired, the lookup waits for a new request
+        idp.version = 2
+        now["now"] += 200_000
+        info = await cache.get("https://idp.example.com")
+        assert info["token_endpoint"].endswith("/2")
+        assert len(idp.requests) == 3
+
+        # Responses that can't be cached are still kept for a minute
+        idp.max_age = 0
+        cache.clear()
+        await cache.get("https://idp.example.com")
+        now["now"] += 40_000
+        await cache.get("https://idp.example.com")
+        assert len(idp.requests) == 4
+
+
+async def test_cache_is_bounded():
+    idp = FakeIdP()
+    cache = OIDCDiscoveryCache(max_size=2, refresh_in_background=False)
+
+    with patch.object(config_utils, "do_get_request_with_max_age", idp.get):
+        for issuer in ["https://a.com", "https://b.com", "https://c.com"]:
+            await cache.get(issuer)
+        await cache.get("https://c.com")
+        await cache.get("https://a.com")
+        assert len(idp.requests) == 4
+
+
+def override_get_config_for_client_type(original_implementation: Provider) -> Provider:
+    original_get_config = original_implementation.get_config_for_client_type
+
+    async def get_config_for_client_type(
+        client_type: Optional[str], user_context: Dict[str, Any]
+    ) -> ProviderConfigForClient:
+        config = await original_get_config(client_type, user_context)
+        config.oidc_discovery_endpoint = user_context.get(
+            "issuer", config.oidc_discovery_endpoint
+        )
+        return config
+
+    original_implementation.get_config_for_client_type = get_config_for_client_type  # type: ignore
+    return original_implementation
+
+
+async def test_prewarm_fetches_configured_providers():
+    idp = FakeIdP()
+    providers = [
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id="google",
+                clients=[
+                    ProviderClientConfig(client_type="web", client_id="a"),
+                    ProviderClientConfig(client_type="ios", client_id="b"),
+                ],
+            )
+        ),
+        # Misconfigured: it has no private key to create its client secret
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id="apple",
+                clients=[ProviderClientConfig(client_id="c")],
+            )
+        ),
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id="github",
+                clients=[ProviderClientConfig(client_id="d", client_secret="e")],
+            )
+        ),
+        # Its config can depend on the user_context, so it's skipped
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id="okta",
+                clients=[ProviderClientConfig(client_id="f")],
+                oidc_discovery_endpoint="https://okta.example.com",
+            ),
+            override=override_get_config_for_client_type,
+        ),
+        # Overrides of other functions don't matter
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id="custom",
+                clients=[ProviderClientConfig(client_id="g")],
+                oidc_discovery_endpoint="https://custom.example.com",
+            ),
+            override=lambda provider: provider,
+        ),
+    ]
+
+    with patch.object(
+        config_utils, "oidc_discovery_cache", OIDCDiscoveryCache()
+    ), patch.object(config_utils, "do_get_request_with_max_age", idp.get):
+        await prewarm_oidc_discovery_cache(providers)
+        assert idp.requests == [
+            "https://accounts.google.com/.well-known/openid-configuration",
+            "https://custom.example.com/.well-known/openid-configuration",
+        ]
+
+        await config_utils.get_oidc_discovery_info("https://accounts.google.com/")
+        assert len(idp.requests) == 2
+
+
+def test_init_only_prewarms_when_enabled():
+    prewarmed: List[List[ProviderInput]] = []
+
+    def prewarm(providers: List[ProviderInput]):
+        prewarmed.append(providers)
+        return asyncio.sleep(0)
+
+    providers = [
+        ProviderInput(
+            config=ProviderConfig(
+                third_party_id="google",
+                clients=[ProviderClientConfig(client_id="a")],
+            )
+        )
+    ]
+
+    with patch.object(thirdparty_recipe, "prewarm_oidc_discovery_cache", prewarm):
+        for prewarm_oidc_discovery in [False, True]:
+            reset(stop_core=False)
+            init(
+                supertokens_config=SupertokensConfig("http://localhost:3567"),
+                app_info=InputAppInfo(
+                    app_name="SuperTokens Demo",
+                    api_domain="http://api.supertokens.io",
+                    website_domain="http://supertokens.io",
+                ),
+                framework="fastapi",
+                recipe_list=[
+                    thirdparty.init(
+                        sign_in_and_up_feature=thirdparty.SignInAndUpFeature(providers),
+                        prewarm_oidc_discovery=prewarm_oidc_discovery,
+                    )
+                ],
+            )
+    reset(stop_core=False)
+
+    assert prewarmed == [providers]
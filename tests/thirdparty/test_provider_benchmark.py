@@ -0,0 +1,83 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from pytest import mark
+
+from tests.benchmark import benchmark, write_benchmark_report
+from tests.thirdparty.fake_idp import (
+    CORE,
+    DISCOVERY,
+    JWKS,
+    TOKEN,
+    TOTAL,
+    USER_INFO,
+    FakeIdP,
+    SignInBenchmark,
+    format_report,
+    get_built_in_provider_inputs,
+)
+
+pytestmark = mark.asyncio
+
+OIDC_PROVIDERS = [
+    "active-directory",
+    "apple",
+    "gitlab",
+    "google",
+    "google-workspaces",
+    "okta",
+]
+
+
+async def test_every_built_in_provider_signs_in_with_the_fake_idp():
+    with FakeIdP() as idp:
+        for provider in get_built_in_provider_inputs():
+            third_party_id = provider.config.third_party_id
+            # Each provider starts with empty caches
+            async with SignInBenchmark(idp, [provider]) as benchmark:
+                idp.requests = []
+                timings = await benchmark.sign_in(third_party_id)
+                assert timings[TOTAL] > 0
+
+                assert idp.count_requests(TOKEN) == 1
+                assert idp.count_requests(USER_INFO) >= 1
+                if third_party_id in OIDC_PROVIDERS:
+                    assert idp.count_requests(DISCOVERY) == 1
+                    assert idp.count_requests(JWKS) == 1
+
+                # The discovery info and JWKS are cached
+                idp.requests = []
+                await benchmark.sign_in(third_party_id)
+                assert idp.count_requests(DISCOVERY) == 0
+                assert idp.count_requests(JWKS) == 0
+
+
+@benchmark
+async def test_benchmark_sign_in_latency_per_provider():
+    providers = get_built_in_provider_inputs()
+
+    with FakeIdP(latency_in_sec=0.002) as idp:
+        async with SignInBenchmark(
+            idp, providers, core_latency_in_sec=0.002
+        ) as benchmark:
+            report = await benchmark.run(sign_ins_per_provider=5)
+
+    write_benchmark_report("Sign in latency per provider", format_report(report))
+
+    for provider in providers:
+        timings = report[provider.config.third_party_id]
+        assert timings[DISCOVERY] == 0
+        assert timings[JWKS] == 0
+        assert timings[CORE] > 0
+    # Connections to the IdP are reused across sign ins
+    assert idp.connections < len(idp.requests) / 2
@@ -0,0 +1,131 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+from pytest import mark, raises
+
+from supertokens_python.recipe.thirdparty.provider import (
+    ProviderClientConfig,
+    ProviderConfig,
+    ProviderInput,
+)
+from supertokens_python.recipe.thirdparty.providers import bitbucket, github
+from supertokens_python.recipe.thirdparty.providers.bitbucket import Bitbucket
+from supertokens_python.recipe.thirdparty.providers.github import Github
+
+pytestmark = mark.asyncio
+
+
+class FakeAPI:
+    def __init__(self, responses: Dict[str, Any]):
+        self.responses = responses
+        self.running = 0
+        self.max_running = 0
+        self.completed: List[str] = []
+
+    async def get(
+        self,
+        url: str,
+        query_params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            response = self.responses[url]
+            if isinstance(response, Exception):
+                await asyncio.sleep(0.01)
+                raise response
+            await asyncio.sleep(0.05)
+            self.completed.append(url)
+            return response
+        finally:
+            self.running -= 1
+
+
+def make_input(third_party_id: str) -> ProviderInput:
+    return ProviderInput(
+        config=ProviderConfig(
+            third_party_id=third_party_id,
+            clients=[ProviderClientConfig(client_id="id", client_secret="secret")],
+        )
+    )
+
+
+async def test_github_fetches_the_user_and_emails_concurrently():
+    api = FakeAPI(
+        {
+            "https://api.github.com/user": {"id": 1},
+            "https://api.github.com/user/emails": [
+                {"email": "other@example.com", "primary": False, "verified": True},
+                {"email": "user@example.com", "primary": True, "verified": True},
+            ],
+        }
+    )
+    provider = Github(make_input("github"))
+
+    with patch.object(github, "do_get_request", api.get):
+        user_info = await provider.get_user_info({"access_token": "token"}, {})
+
+    assert api.max_running == 2
+    assert user_info.third_party_user_id == "1"
+    assert user_info.email is not None
+    assert user_info.email.id == "user@example.com"
+
+
+async def test_bitbucket_fetches_the_user_and_emails_concurrently():
+    api = FakeAPI(
+        {
+            "https://api.bitbucket.org/2.0/user": {"uuid": "user-uuid"},
+            "https://api.bitbucket.org/2.0/user/emails": {
+                "values": [
+                    {
+                        "email": "user@example.com",
+                        "is_primary": True,
+                        "is_confirmed": False,
+                    }
+                ]
+            },
+        }
+    )
+    provider = Bitbucket(make_input("bitbucket"))
+
+    with patch.object(bitbucket, "do_get_request", api.get):
+        user_info = await provider.get_user_info({"access_token": "token"}, {})
+
+    assert api.max_running == 2
+    assert user_info.third_party_user_id == "user-uuid"
+    assert user_info.email is not None
+    assert user_info.email.id == "user@example.com"
+    assert not user_info.email.is_verified
+
+
+async def test_a_failed_request_cancels_the_other_one():
+    api = FakeAPI(
+        {
+            "https://api.github.com/user": Exception("user request failed"),
+            "https://api.github.com/user/emails": [],
+        }
+    )
+    provider = Github(make_input("github"))
+
+    with patch.object(github, "do_get_request", api.get):
+        with raises(Exception, match="user request failed"):
+            await provider.get_user_info({"access_token": "token"}, {})
+
+    await asyncio.sleep(0.1)
+    assert api.completed == []
+    assert api.running == 0
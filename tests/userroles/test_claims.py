@@ -12,7 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from unittest.mock import MagicMock
-from typing import List
+from typing import Any, Dict, List
 
 import pytest
 from pytest import mark
@@ -34,7 +34,10 @@ from supertokens_python.recipe.userroles import (
 from supertokens_python.recipe.userroles.asyncio import (
     create_new_role_or_add_permissions,
     add_role_to_user,
+    remove_permissions_from_role,
 )
+from supertokens_python.recipe.userroles.interfaces import RecipeInterface
+from supertokens_python.utils import resolve
 
 _ = setup_function  # type: ignore
 _ = teardown_function  # type: ignore
@@ -229,3 +232,53 @@ async def test_should_validate_permissions_after_refetch():
     await add_role_to_user("public", user_id, role)
 
     await s.assert_claims([PermissionClaim.validators.includes("a")])
+
+
+@min_api_version("2.14")
+async def test_permissions_for_role_are_cached_and_invalidated():
+    get_permissions_for_role_calls: List[str] = []
+
+    def override_functions(oi: RecipeInterface) -> RecipeInterface:
+        oi_get_permissions_for_role = oi.get_permissions_for_role
+
+        async def get_permissions_for_role(role: str, user_context: Dict[str, Any]):
+            get_permissions_for_role_calls.append(role)
+            return await oi_get_permissions_for_role(role, user_context)
+
+        oi.get_permissions_for_role = get_permissions_for_role
+        return oi
+
+    st_args = get_st_init_args(
+        [
+            userroles.init(
+                override=userroles.utils.InputOverrideConfig(
+                    functions=override_functions
+                )
+            ),
+            session.init(get_token_transfer_method=lambda _, __, ___: "cookie"),
+        ]
+    )
+    init(**st_args)
+    start_st()
+
+    user_id = "userId"
+    role = "role"
+
+    await create_new_role_or_add_permissions(role, ["a"])
+    await add_role_to_user("public", user_id, role)
+
+    value = await resolve(PermissionClaim.fetch_value(user_id, "public", {}))
+    assert value == ["a"]
+    value = await resolve(PermissionClaim.fetch_value(user_id, "public", {}))
+    assert value == ["a"]
+    assert get_permissions_for_role_calls == [role]
+
+    await create_new_role_or_add_permissions(role, ["b"])
+    value = await resolve(PermissionClaim.fetch_value(user_id, "public", {}))
+    assert sorted(value) == ["a", "b"]  # type: ignore
+    assert get_permissions_for_role_calls == [role, role]
+
+    await remove_permissions_from_role(role, ["a"])
+    value = await resolve(PermissionClaim.fetch_value(user_id, "public", {}))
+    assert value == ["b"]
+    assert get_permissions_for_role_calls == [role, role, role]